@@ -1,2 +1,12 @@
 from automatapy.automata.automata import EpsilonNFA, NFA, DFA
-from automatapy.automata.core import Epsilon
\ No newline at end of file
+from automatapy.automata.charclass import CharClass
+from automatapy.automata.compact import CompactTransitionSystem
+from automatapy.automata.compiled import CompiledDFA, CompiledNFA, LazyDFA
+from automatapy.automata.core import Epsilon
+from automatapy.automata.decision import Decision
+from automatapy.automata.instrumentation import EngineStats, collect_stats
+from automatapy.automata.matcher import Matcher
+from automatapy.automata.parallel import ParallelMatcher
+from automatapy.automata.product import LazyProduct
+from automatapy.automata.search import Searcher
+from automatapy.automata.serialization import load
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-from automatapy.automata.engine import Engine, NondeterministicEngine, EpsilonEngine
-from typing import Collection, Sequence, Hashable, Set
+from automatapy.automata.engine import Engine, NondeterministicEngine, EpsilonEngine, DeterministicEngine
+from typing import Collection, Sequence, Hashable, Set, Iterable, Iterator, Dict, FrozenSet, Tuple, Callable, Optional
 from automatapy.automata.core import State, Transition, TransitionSystem
+from automatapy.automata.compact import CompactTransitionSystem
+from automatapy.automata.compiled import CompiledDFA, CompiledNFA, LazyDFA
+from automatapy.automata.matcher import Matcher
+from automatapy.automata.parallel import ParallelMatcher
+from automatapy.automata.serialization import save_dfa, save_nfa
+from automatapy.automata.product import LazyProduct, pair_product, disjoint_union
+from automatapy.automata.search import Searcher
+from automatapy.automata import decision
+from automatapy.automata.decision import Decision
 import abc
 
 
@@ -12,6 +21,279 @@ class FiniteAutomaton:
         self.ts: TransitionSystem = ts if ts is not None else TransitionSystem()
         self.engine: Engine = engine
 
+    def compact(self):
+        """
+        Returns a read-only copy of the automaton backed by a compact transition system. States are renumbered densely
+        and transitions are stored in integer arrays, state and transition objects are only created on access
+
+        Returns
+        -------
+        FiniteAutomaton
+            Automaton of the same type with a :class:`CompactTransitionSystem`
+
+        """
+        return type(self)(ts=CompactTransitionSystem.from_transition_system(self.ts))
+
+    def intersect(self, other: FiniteAutomaton, lazy: bool = False):
+        """
+        Returns the intersection with another epsilon-free automaton. Only the reachable pairs of states are built
+
+        Parameters
+        ----------
+        other : FiniteAutomaton
+            Other automaton
+        lazy : bool
+            If true, a lazy product is returned that never materializes the product states
+
+        Returns
+        -------
+        Union[NFA, DFA, LazyProduct]
+            A DFA if both automata are DFAs, an NFA otherwise, or the lazy product
+
+        """
+        if lazy:
+            return LazyProduct(self.ts, other.ts, lambda left, right: left and right)
+        ts = pair_product(self.ts, other.ts, lambda left, right: left and right)
+        return DFA(ts=ts) if isinstance(self, DFA) and isinstance(other, DFA) else NFA(ts=ts)
+
+    def union(self, other: FiniteAutomaton, lazy: bool = False):
+        """
+        Returns the union with another epsilon-free automaton. The union of two DFAs is their reachable product, the
+        union of other automata is their disjoint union
+
+        Parameters
+        ----------
+        other : FiniteAutomaton
+            Other automaton
+        lazy : bool
+            If true, a lazy product is returned that never materializes the product states
+
+        Returns
+        -------
+        Union[NFA, DFA, LazyProduct]
+            A DFA if both automata are DFAs, an NFA otherwise, or the lazy product
+
+        """
+        if lazy:
+            return LazyProduct(self.ts, other.ts, lambda left, right: left or right)
+        if isinstance(self, DFA) and isinstance(other, DFA):
+            return DFA(ts=pair_product(self.ts, other.ts, lambda left, right: left or right, complete=True))
+        return NFA(ts=disjoint_union(self.ts, other.ts))
+
+    def difference(self, other: FiniteAutomaton, lazy: bool = False):
+        """
+        Returns the automaton accepting the words accepted by this automaton but not by the other one. Product states
+        are pairs of sets of states, so nondeterministic operands are only determinized as far as they are reached
+
+        Parameters
+        ----------
+        other : FiniteAutomaton
+            Other epsilon-free automaton
+        lazy : bool
+            If true, a lazy product is returned that never materializes the product states
+
+        Returns
+        -------
+        Union[DFA, LazyProduct]
+            Deterministic finite automaton, or the lazy product
+
+        """
+        product = LazyProduct(self.ts, other.ts, lambda left, right: left and not right)
+        return product if lazy else DFA(ts=product.to_transition_system())
+
+    def complement(self, alphabet: Set[Hashable] = None, lazy: bool = False):
+        """
+        Returns the complement of the epsilon-free automaton. The complement DFA is complete over the alphabet, the lazy
+        complement also accepts words with letters outside the alphabet
+
+        Parameters
+        ----------
+        alphabet : Set[Hashable]
+            Alphabet of the complement. If None, the alphabet of the automaton is used
+        lazy : bool
+            If true, a lazy product is returned that never materializes the subset states
+
+        Returns
+        -------
+        Union[DFA, LazyProduct]
+            Deterministic finite automaton, or the lazy complement
+
+        """
+        product = LazyProduct(self.ts, TransitionSystem(), lambda left, right: not left, alphabet=alphabet)
+        return product if lazy else DFA(ts=product.to_transition_system())
+
+    def trim(self):
+        """
+        Removes the states that are unreachable or from which no final state is reachable, see
+        :meth:`TransitionSystem.trim`
+
+        Returns
+        -------
+
+        """
+        self.ts.trim()
+
+    def reverse(self):
+        """
+        Returns the automaton accepting the reversed words
+
+        Returns
+        -------
+        Union[EpsilonNFA, NFA]
+            An epsilon NFA if this automaton is an epsilon NFA, an NFA otherwise
+
+        """
+        ts = self.engine.reverse()
+        return EpsilonNFA(ts=ts) if isinstance(self, EpsilonNFA) else NFA(ts=ts)
+
+    def searcher(self) -> Searcher:
+        """
+        Returns a searcher for matches of the epsilon-free automaton within longer texts. The searcher is built from a
+        forward and a reverse DFA once and can be reused for many texts
+
+        Returns
+        -------
+        Searcher
+            Searcher for the language of the automaton
+
+        """
+        return Searcher(self.ts)
+
+    def search(self, text: Sequence[Hashable], pos: int = 0, endpos: int = None) -> Optional[Tuple[int, int]]:
+        """
+        Returns the leftmost-longest match of the epsilon-free automaton in the text in linear time. Builds a searcher
+        on every call, use :meth:`searcher` when searching many texts
+
+        Parameters
+        ----------
+        text : Sequence[Hashable]
+            Text
+        pos : int
+            Start of the searched part of the text
+        endpos : int
+            End of the searched part of the text. If None, the text is searched to its end
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            Span (start, end) of the match, or None if there is no match
+
+        """
+        return self.searcher().search(text, pos, endpos)
+
+    def match_prefix(self, text: Sequence[Hashable], pos: int = 0, endpos: int = None) -> Optional[Tuple[int, int]]:
+        """
+        Returns the longest match of the epsilon-free automaton that starts at the given position
+
+        Parameters
+        ----------
+        text : Sequence[Hashable]
+            Text
+        pos : int
+            Start of the match
+        endpos : int
+            Position the match must not extend beyond. If None, the match may extend to the end of the text
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            Span (start, end) of the match, or None if there is no match
+
+        """
+        return self.searcher().match_prefix(text, pos, endpos)
+
+    def finditer(self, text: Sequence[Hashable], pos: int = 0, endpos: int = None) -> Iterator[Tuple[int, int]]:
+        """
+        Iterates over the non-overlapping leftmost-longest matches of the epsilon-free automaton in the text in linear
+        time
+
+        Parameters
+        ----------
+        text : Sequence[Hashable]
+            Text
+        pos : int
+            Start of the searched part of the text
+        endpos : int
+            End of the searched part of the text. If None, the text is searched to its end
+
+        Returns
+        -------
+        Iterator[Tuple[int, int]]
+            Spans (start, end) of the matches from left to right
+
+        """
+        return self.searcher().finditer(text, pos, endpos)
+
+    def is_empty(self) -> Decision:
+        """
+        Checks whether the epsilon-free automaton accepts no word
+
+        Returns
+        -------
+        Decision
+            Truthy if the language is empty, otherwise the counterexample is a shortest accepted word
+
+        """
+        return decision.is_empty(self.ts)
+
+    def is_subset_of(self, other: FiniteAutomaton) -> Decision:
+        """
+        Checks whether every word accepted by this automaton is accepted by the other one. The check uses antichains and
+        does not determinize the other automaton
+
+        Parameters
+        ----------
+        other : FiniteAutomaton
+            Other epsilon-free automaton
+
+        Returns
+        -------
+        Decision
+            Truthy if the language is included, otherwise the counterexample is a shortest word accepted by this
+            automaton but not by the other one
+
+        """
+        return decision.is_subset_of(self.ts, other.ts)
+
+    def is_universal(self, alphabet: Set[Hashable] = None) -> Decision:
+        """
+        Checks whether the epsilon-free automaton accepts every word over the alphabet. The check uses antichains and
+        does not determinize the automaton
+
+        Parameters
+        ----------
+        alphabet : Set[Hashable]
+            Alphabet, if None the alphabet of the automaton is used
+
+        Returns
+        -------
+        Decision
+            Truthy if every word is accepted, otherwise the counterexample is a shortest rejected word
+
+        """
+        return decision.is_universal(self.ts, alphabet)
+
+    def is_equivalent(self, other: FiniteAutomaton) -> Decision:
+        """
+        Checks whether the automaton accepts the same language as the other epsilon-free automaton. Two DFAs are
+        compared with the Hopcroft-Karp algorithm, other automata with two antichain inclusion checks
+
+        Parameters
+        ----------
+        other : FiniteAutomaton
+            Other epsilon-free automaton
+
+        Returns
+        -------
+        Decision
+            Truthy if the languages are equal, otherwise the counterexample is a shortest word accepted by exactly one
+            of the automata
+
+        """
+        if isinstance(self, DFA) and isinstance(other, DFA):
+            return decision.is_equivalent_dfa(self.ts, other.ts)
+        return decision.is_equivalent(self.ts, other.ts)
+
     def get_states(self) -> Collection[State]:
         """
         Returns the states of the automaton
@@ -161,6 +443,83 @@ class NFA(FiniteAutomaton):
         """
         return self.engine.accepts(sequence)
 
+    def compile(self) -> CompiledNFA:
+        """
+        Freezes the automaton into per-letter successor bitmasks. The compiled automaton simulates sets of states as
+        integers and does not reflect later modifications of the NFA
+
+        Returns
+        -------
+        CompiledNFA
+            Read-only compiled automaton
+
+        """
+        return CompiledNFA.from_transition_system(self.ts)
+
+    def save(self, path: str):
+        """
+        Writes the automaton to a compact binary file with CSR transition arrays, see
+        :func:`automatapy.automata.serialization.load`
+
+        Parameters
+        ----------
+        path : str
+            Path of the file
+
+        Returns
+        -------
+
+        """
+        save_nfa(self.ts, path)
+
+    def lazy_determinize(self, cache_size: int = 4096) -> LazyDFA:
+        """
+        Returns a lazily determinized version of the automaton. Subset states are only built when a word reaches them
+        and are kept in a bounded cache
+
+        Parameters
+        ----------
+        cache_size : int
+            Maximal number of subset states kept at once
+
+        Returns
+        -------
+        LazyDFA
+            Lazy deterministic automaton
+
+        """
+        return LazyDFA(self.compile(), cache_size=cache_size)
+
+    def matcher(self) -> Matcher:
+        """
+        Returns a resumable matcher that reads words chunk by chunk. The matcher runs on the compiled automaton
+
+        Returns
+        -------
+        Matcher
+            Matcher in the initial configuration
+
+        """
+        return Matcher(self.compile())
+
+    def accepts_many(self, sequences: Iterable[Sequence]):
+        """
+        Checks a batch of sequences at once. The automaton is determinized and compiled first, so this pays off for
+        large batches
+
+        Parameters
+        ----------
+        sequences : Iterable[Sequence]
+            Sequences to be checked
+
+        Returns
+        -------
+        Sequence[bool]
+            Boolean array whose i-th entry tells whether the i-th sequence is accepted
+
+        """
+        return self.determinize().compile().accepts_many(sequences)
+
     def determinize(self, alphabet=None):
         """
         Determinizes the nondeterministic finite automaton with the powerset construction
@@ -180,11 +539,143 @@ class NFA(FiniteAutomaton):
         ts = self.engine.determinize(alphabet)
         return DFA(ts=ts)
 
+    def subset_construction(self, alphabet=None) -> Tuple[DFA, Dict[State, FrozenSet[State]]]:
+        """
+        Determinizes the automaton like :meth:`determinize` and also returns the subset of states of the NFA that
+        every state of the DFA stands for
+
+        Parameters
+        ----------
+        alphabet: Set[Hashable]
+            Optional argument. Alphabet of the powerset construction, if None the alphabet of the NFA is used
+
+        Returns
+        -------
+        Tuple[DFA, Dict[State, FrozenSet[State]]]
+            Deterministic finite automaton and mapping from its states to sets of useful states of the NFA
+
+        """
+        ts, masks, states = self.engine.subset_construction(alphabet)
+        subsets = {state: frozenset(states[q] for q in range(mask.bit_length()) if mask >> q & 1)
+                   for state, mask in masks.items()}
+        return DFA(ts=ts), subsets
+
 
 class DFA(FiniteAutomaton):
     """Deterministic finite automaton implementation"""
 
     def __init__(self, **kwargs):
-        super().__init__(NondeterministicEngine(), **kwargs)
+        super().__init__(DeterministicEngine(), **kwargs)
         self.engine.set_transition_system(self.ts)
-        pass
+
+    def accepts(self, sequence: Sequence):
+        """
+        Checks whether the automaton accepts the given sequence
+
+        Parameters
+        ----------
+        sequence : Sequence
+            Sequence to be checked
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.engine.accepts(sequence)
+
+    def minimize(self, partition_key: Callable[[State], Hashable] = None) -> Tuple[DFA, Dict[State, State]]:
+        """
+        Minimizes the deterministic finite automaton with Hopcroft's partition refinement algorithm. States that are
+        not reachable from the initial state are removed
+
+        Parameters
+        ----------
+        partition_key: Callable[[State], Hashable]
+            Optional function on final states. Final states with different keys are never merged
+
+        Returns
+        -------
+        Tuple[DFA, Dict[State, State]]
+            Minimal deterministic finite automaton and mapping from the reachable states to its states
+
+        """
+        ts, mapping = self.engine.minimize(partition_key)
+        return DFA(ts=ts), mapping
+
+    def compile(self) -> CompiledDFA:
+        """
+        Freezes the automaton into a dense integer transition table. States are numbered 0..n-1, letters are interned
+        to column indices and missing transitions lead to an explicit dead state. The compiled automaton does not
+        reflect later modifications of the DFA
+
+        Returns
+        -------
+        CompiledDFA
+            Read-only compiled automaton
+
+        """
+        return CompiledDFA.from_transition_system(self.ts)
+
+    def save(self, path: str):
+        """
+        Writes the compiled automaton to a compact binary file that can be memory-mapped and matched on directly, see
+        :func:`automatapy.automata.serialization.load`
+
+        Parameters
+        ----------
+        path : str
+            Path of the file
+
+        Returns
+        -------
+
+        """
+        save_dfa(self.compile(), path)
+
+    def matcher(self) -> Matcher:
+        """
+        Returns a resumable matcher that reads words chunk by chunk. The matcher runs on the compiled automaton
+
+        Returns
+        -------
+        Matcher
+            Matcher in the initial configuration
+
+        """
+        return Matcher(self.compile())
+
+    def accepts_many(self, sequences: Iterable[Sequence]):
+        """
+        Checks a batch of sequences at once by advancing all of them in lockstep through the compiled transition table
+
+        Parameters
+        ----------
+        sequences : Iterable[Sequence]
+            Sequences to be checked
+
+        Returns
+        -------
+        Sequence[bool]
+            Boolean array whose i-th entry tells whether the i-th sequence is accepted
+
+        """
+        return self.compile().accepts_many(sequences)
+
+    def parallel_matcher(self, processes: int = None) -> ParallelMatcher:
+        """
+        Returns a process pool that matches corpora against the compiled automaton. The transition table is shared
+        between the processes, the pool has to be closed after use
+
+        Parameters
+        ----------
+        processes : int
+            Number of worker processes, if None the number of CPUs
+
+        Returns
+        -------
+        ParallelMatcher
+            Parallel matcher, usable as context manager
+
+        """
+        return ParallelMatcher(self.compile(), processes=processes)
@@ -0,0 +1,292 @@
+from bisect import bisect_right
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+MAX_CODE_POINT = 0x10FFFF
+
+Bound = Union[str, int]
+
+
+def code_point(letter: Hashable) -> Optional[int]:
+    """
+    Returns the code point of a letter that is a single character or an integer code point, e.g. a byte
+
+    Parameters
+    ----------
+    letter : Hashable
+        Letter
+
+    Returns
+    -------
+    Optional[int]
+        Code point, None if the letter is neither a character nor a code point
+    """
+    if isinstance(letter, str):
+        return ord(letter) if len(letter) == 1 else None
+    if isinstance(letter, int) and not isinstance(letter, bool) and 0 <= letter <= MAX_CODE_POINT:
+        return letter
+    return None
+
+
+def _bound(bound: Bound) -> int:
+    code = code_point(bound)
+    if code is None:
+        raise ValueError(f"{bound!r} is neither a character nor a code point")
+    return code
+
+
+class CharClass:
+    """Immutable set of characters stored as sorted, disjoint intervals of code points"""
+
+    __slots__ = ("intervals", "starts")
+
+    def __init__(self, intervals: Iterable[Tuple[Bound, Bound]] = ()):
+        """
+        Creates a character class from inclusive intervals. Bounds are characters or code points, overlapping and
+        adjacent intervals are merged
+
+        Parameters
+        ----------
+        intervals : Iterable[Tuple[Bound, Bound]]
+            Inclusive intervals (lo, hi)
+        """
+        merged: List[List[int]] = []
+        for lo, hi in sorted((_bound(lo), _bound(hi)) for lo, hi in intervals):
+            if lo > hi:
+                raise ValueError(f"Interval {chr(lo)!r}-{chr(hi)!r} is empty")
+            if merged and lo <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], hi)
+            else:
+                merged.append([lo, hi])
+        self.intervals: Tuple[Tuple[int, int], ...] = tuple((lo, hi) for lo, hi in merged)
+        self.starts: Tuple[int, ...] = tuple(lo for lo, _ in self.intervals)
+
+    @classmethod
+    def of(cls, letters: Iterable[Bound]) -> "CharClass":
+        """
+        Returns the class of the given characters
+
+        Parameters
+        ----------
+        letters : Iterable[Bound]
+            Characters or code points
+
+        Returns
+        -------
+        CharClass
+        """
+        return cls((letter, letter) for letter in letters)
+
+    @classmethod
+    def parse(cls, spec: str) -> "CharClass":
+        """
+        Parses the body of a bracket expression such as ``a-z0-9_``. A leading ``^`` negates the class, a backslash
+        escapes the following character
+
+        Parameters
+        ----------
+        spec : str
+            Class specification
+
+        Returns
+        -------
+        CharClass
+        """
+        negated = spec.startswith("^")
+        if negated:
+            spec = spec[1:]
+        chars: List[Tuple[str, bool]] = []
+        i = 0
+        while i < len(spec):
+            if spec[i] == "\\" and i + 1 < len(spec):
+                chars.append((spec[i + 1], True))
+                i += 2
+            else:
+                chars.append((spec[i], False))
+                i += 1
+        intervals, i = [], 0
+        while i < len(chars):
+            if i + 2 < len(chars) and chars[i + 1] == ("-", False):
+                intervals.append((chars[i][0], chars[i + 2][0]))
+                i += 3
+            else:
+                intervals.append((chars[i][0], chars[i][0]))
+                i += 1
+        char_class = cls(intervals)
+        return char_class.complement() if negated else char_class
+
+    @classmethod
+    def any(cls) -> "CharClass":
+        """Returns the class of all characters"""
+        return cls([(0, MAX_CODE_POINT)])
+
+    def complement(self) -> "CharClass":
+        """Returns the class of all characters not in this class"""
+        intervals, lo = [], 0
+        for start, end in self.intervals:
+            if lo < start:
+                intervals.append((lo, start - 1))
+            lo = end + 1
+        if lo <= MAX_CODE_POINT:
+            intervals.append((lo, MAX_CODE_POINT))
+        return CharClass(intervals)
+
+    def __contains__(self, letter) -> bool:
+        code = code_point(letter)
+        if code is None:
+            return False
+        i = bisect_right(self.starts, code) - 1
+        return i >= 0 and code <= self.intervals[i][1]
+
+    def __or__(self, other: "CharClass") -> "CharClass":
+        return CharClass(self.intervals + other.intervals)
+
+    def __and__(self, other: "CharClass") -> "CharClass":
+        return (self.complement() | other.complement()).complement()
+
+    def __sub__(self, other: "CharClass") -> "CharClass":
+        return self & other.complement()
+
+    def __bool__(self):
+        return bool(self.intervals)
+
+    def __len__(self):
+        return sum(hi - lo + 1 for lo, hi in self.intervals)
+
+    def __iter__(self):
+        return (chr(code) for lo, hi in self.intervals for code in range(lo, hi + 1))
+
+    def __eq__(self, other):
+        return isinstance(other, CharClass) and self.intervals == other.intervals
+
+    def __hash__(self):
+        return hash(self.intervals)
+
+    def __str__(self):
+        def char(code):
+            c = chr(code)
+            return "\\" + c if c in "\\]-^" else c if c.isprintable() else f"\\u{code:04x}"
+
+        return "[" + "".join(char(lo) if lo == hi else f"{char(lo)}-{char(hi)}" for lo, hi in self.intervals) + "]"
+
+    def __repr__(self):
+        return f"CharClass({str(self)[1:-1]!r})"
+
+
+def minterms(classes: Iterable[CharClass]) -> List[CharClass]:
+    """
+    Splits the union of the given classes into disjoint classes such that each of them is either contained in or
+    disjoint from every given class. The boundaries of all intervals are swept once
+
+    Parameters
+    ----------
+    classes : Iterable[CharClass]
+        Character classes
+
+    Returns
+    -------
+    List[CharClass]
+        Minterms, sorted by their smallest character
+    """
+    events: Dict[int, List[Tuple[int, bool]]] = dict()
+    for i, char_class in enumerate(classes):
+        for lo, hi in char_class.intervals:
+            events.setdefault(lo, []).append((i, True))
+            events.setdefault(hi + 1, []).append((i, False))
+    active = set()
+    groups: Dict[frozenset, List[Tuple[int, int]]] = dict()
+    points = sorted(events)
+    for point, following in zip(points, points[1:]):
+        for i, starts in events[point]:
+            if starts:
+                active.add(i)
+            else:
+                active.discard(i)
+        if active:
+            groups.setdefault(frozenset(active), []).append((point, following - 1))
+    return sorted((CharClass(intervals) for intervals in groups.values()), key=lambda c: c.starts[0])
+
+
+def symbols(alphabet: Iterable[Hashable]) -> List[Tuple[Hashable, Hashable]]:
+    """
+    Returns the letters to explore for an alphabet that may contain character classes. Without character classes these
+    are the letters themselves. Otherwise the classes and the letters that are characters are split into minterms, a
+    minterm that is a single letter of the alphabet is labeled with that letter and other minterms are labeled with the
+    minterm itself. A character and a code point with the same code are different letters and keep a label each
+
+    Parameters
+    ----------
+    alphabet : Iterable[Hashable]
+        Alphabet
+
+    Returns
+    -------
+    List[Tuple[Hashable, Hashable]]
+        Pairs (label, letter) where label is used for transitions and letter is a concrete letter with the same
+        successors as every letter of the label
+    """
+    alphabet = list(alphabet)
+    classes = [letter for letter in alphabet if isinstance(letter, CharClass)]
+    if not classes:
+        return [(letter, letter) for letter in alphabet]
+    result, plain = [], dict()
+    for letter in alphabet:
+        if isinstance(letter, CharClass):
+            continue
+        code = code_point(letter)
+        if code is None:
+            result.append((letter, letter))
+        else:
+            plain.setdefault(code, []).append(letter)
+    for minterm in minterms(classes + [CharClass([(code, code)]) for code in plain]):
+        lo = minterm.starts[0]
+        if lo in plain and len(minterm) == 1:
+            result.extend((letter, letter) for letter in plain[lo])
+        else:
+            result.append((minterm, chr(lo)))
+    return result
+
+
+class SymbolicIndex(dict):
+    """
+    Letter-to-column index whose columns may be character classes. Characters are resolved by bisection, the first
+    ``cache_size`` resolved characters are cached
+    """
+
+    def __init__(self, alphabet: Sequence[Hashable], cache_size: int = 4096):
+        super().__init__((letter, i) for i, letter in enumerate(alphabet))
+        intervals = sorted((lo, hi, i) for i, letter in enumerate(alphabet) if isinstance(letter, CharClass)
+                           for lo, hi in letter.intervals)
+        self.starts = [lo for lo, _, _ in intervals]
+        self.intervals = intervals
+        self.limit = len(self) + cache_size
+
+    def get(self, letter, default=None):
+        column = dict.get(self, letter)
+        if column is not None:
+            return column
+        code = code_point(letter)
+        if code is None:
+            return default
+        i = bisect_right(self.starts, code) - 1
+        if i < 0 or code > self.intervals[i][1]:
+            return default
+        column = self.intervals[i][2]
+        if len(self) < self.limit:
+            self[letter] = column
+        return column
+
+    def __missing__(self, letter):
+        column = self.get(letter)
+        if column is None:
+            raise KeyError(letter)
+        return column
+
+    def __contains__(self, letter):
+        return self.get(letter) is not None
+
+
+def letter_index(alphabet: Sequence[Hashable]) -> Dict[Hashable, int]:
+    """Returns the letter-to-column index of an alphabet, characters are resolved lazily if it has character classes"""
+    if any(isinstance(letter, CharClass) for letter in alphabet):
+        return SymbolicIndex(alphabet)
+    return {letter: i for i, letter in enumerate(alphabet)}
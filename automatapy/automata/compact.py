@@ -0,0 +1,327 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Collection, Mapping
+from typing import Hashable, Dict, Iterator, Set, Tuple, Union, Any
+
+from automatapy.automata.charclass import CharClass, letter_index, symbols
+from automatapy.automata.core import State, StateIds, Transition, TransitionSystem, Epsilon
+
+
+class _StateView(Collection):
+    """Collection of the states of a compact transition system that creates state objects on demand"""
+
+    def __init__(self, ts: "CompactTransitionSystem", ids: Collection[int]):
+        self.ts = ts
+        self.ids = ids
+
+    def __contains__(self, state):
+        return isinstance(state, State) and state.owner is self.ts.state_ids and state.state_id in self.ids
+
+    def __iter__(self) -> Iterator[State]:
+        return (self.ts.state(i) for i in self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+class _FinalIds(Collection):
+    """Collection of the ids marked in a bitmap"""
+
+    def __init__(self, bitmap: bytes):
+        self.bitmap = bitmap
+
+    def __contains__(self, i):
+        return 0 <= i < len(self.bitmap) and self.bitmap[i] == 1
+
+    def __iter__(self) -> Iterator[int]:
+        return (i for i, final in enumerate(self.bitmap) if final)
+
+    def __len__(self):
+        return self.bitmap.count(1)
+
+
+class _TransitionView(Collection):
+    """Collection of the transitions of a compact transition system that creates transition objects on demand"""
+
+    def __init__(self, ts: "CompactTransitionSystem"):
+        self.ts = ts
+
+    def __contains__(self, transition):
+        if not isinstance(transition, Transition):
+            return False
+        return transition.target in self.ts.get_successor(transition.source, transition.letter)
+
+    def __iter__(self) -> Iterator[Transition]:
+        ts = self.ts
+        for source in range(len(ts.offsets) - 1):
+            for i in range(ts.offsets[source], ts.offsets[source + 1]):
+                yield Transition(ts.state(source), ts.labels[ts.letters[i]], ts.state(ts.targets[i]))
+
+    def __len__(self):
+        return len(self.ts.targets)
+
+
+class _AdjacencyView(Mapping):
+    """Read-only mapping from states to their letter-successor (or letter-predecessor) dictionaries, built on demand"""
+
+    def __init__(self, ts: "CompactTransitionSystem", reverse: bool = False):
+        self.ts = ts
+        self.reverse = reverse
+
+    def _arrays(self) -> Tuple[array, array, array]:
+        ts = self.ts
+        return ts.predecessor_arrays() if self.reverse else (ts.offsets, ts.letters, ts.targets)
+
+    def __getitem__(self, state: State) -> Dict[Hashable, Set[State]]:
+        ts = self.ts
+        if state not in ts.states:
+            raise KeyError(state)
+        offsets, letters, targets = self._arrays()
+        action_states: Dict[Hashable, Set[State]] = dict()
+        for i in range(offsets[state.state_id], offsets[state.state_id + 1]):
+            action_states.setdefault(ts.labels[letters[i]], set()).add(ts.state(targets[i]))
+        return action_states
+
+    def __iter__(self) -> Iterator[State]:
+        offsets = self._arrays()[0]
+        return (self.ts.state(i) for i in range(len(offsets) - 1) if offsets[i] < offsets[i + 1])
+
+    def __len__(self):
+        offsets = self._arrays()[0]
+        return sum(1 for i in range(len(offsets) - 1) if offsets[i] < offsets[i + 1])
+
+
+class CompactTransitionSystem:
+    """Read-only transition system with integer state ids and CSR adjacency arrays"""
+
+    def __init__(self, labels: Tuple[Hashable, ...], offsets: array, letters: array, targets: array,
+                 initial: Collection[int], final: bytes, names: Dict[int, str] = None,
+                 properties: Dict[int, Dict[str, Any]] = None):
+        """
+        Creates a compact transition system. The states are the integers 0..n-1, the transitions of state q are stored
+        at the positions offsets[q]..offsets[q + 1] - 1 of ``letters`` and ``targets``, sorted by letter
+
+        Parameters
+        ----------
+        labels : Tuple[Hashable, ...]
+            Transition labels, ``letters`` refers to labels by their position
+        offsets : array
+            Start of the transitions of each state, with a final entry for the total number of transitions
+        letters : array
+            Label index of each transition
+        targets : array
+            Target state of each transition
+        initial : Collection[int]
+            Initial states
+        final : bytes
+            Final-state table, ``final[q]`` is 1 if ``q`` is final and 0 otherwise
+        names : Dict[int, str]
+            Names of the named states
+        properties : Dict[int, Dict[str, Any]]
+            Properties of the states that have properties
+        """
+        self.labels = labels
+        self.label_to_index: Dict[Hashable, int] = letter_index(labels)
+        self.offsets = offsets
+        self.letters = letters
+        self.targets = targets
+        self.names = names if names is not None else dict()
+        self.properties = properties if properties is not None else dict()
+        self.alphabet: Set[Hashable] = set(label for label in labels if label != Epsilon())
+        self.symbolic = any(isinstance(label, CharClass) for label in labels)
+        self.state_ids = StateIds()
+        self.state_ids.next_id = len(offsets) - 1
+        self.states = _StateView(self, range(len(offsets) - 1))
+        self.initial_states = _StateView(self, frozenset(initial))
+        self.final_states = _StateView(self, _FinalIds(final))
+        self.transitions = _TransitionView(self)
+        self.state_to_action_succ = _AdjacencyView(self)
+        self.state_to_action_pred = _AdjacencyView(self, reverse=True)
+        self._predecessors: Tuple[array, array, array] = None
+        self._key: Tuple = None
+
+    @classmethod
+    def from_transition_system(cls, ts: TransitionSystem) -> "CompactTransitionSystem":
+        """
+        Creates a compact copy of a transition system. States are renumbered densely in the order of their ids and
+        labels are sorted by type name and representation, so equal systems give equal copies regardless of the order
+        their states and transitions were added in. Names and properties are kept. Character classes are split into
+        disjoint minterms, so every character selects at most one label
+
+        Parameters
+        ----------
+        ts : TransitionSystem
+            Transition system
+
+        Returns
+        -------
+        CompactTransitionSystem
+            Compact transition system
+        """
+        states = sorted(ts.states, key=lambda state: state.state_id)
+        index = {state: i for i, state in enumerate(states)}
+        symbolic = getattr(ts, "symbolic", False)
+        minterms = symbols(ts.alphabet) if symbolic else None
+        labels = tuple(label for label, _ in minterms) if symbolic else tuple(ts.alphabet)
+        labels = tuple(sorted(labels, key=lambda label: (type(label).__name__, repr(label))))
+        if any(Epsilon() in ts.state_to_action_succ.get(state, dict()) for state in states):
+            labels += (Epsilon(),)
+        label_to_index = {label: i for i, label in enumerate(labels)}
+        offsets, letters, targets = array("q", [0]), array("i"), array("i")
+        for state in states:
+            action_succ = ts.state_to_action_succ.get(state, dict())
+            if symbolic:
+                epsilon_succ = action_succ.get(Epsilon())
+                action_succ = {label: ts.get_successor(state, letter) for label, letter in minterms}
+                action_succ = {label: targets for label, targets in action_succ.items() if targets}
+                if epsilon_succ:
+                    action_succ[Epsilon()] = epsilon_succ
+            for letter in sorted(action_succ, key=label_to_index.__getitem__):
+                column = label_to_index[letter]
+                for target in sorted(index[target] for target in action_succ[letter]):
+                    letters.append(column)
+                    targets.append(target)
+            offsets.append(len(targets))
+        final = bytearray(len(states))
+        for state in ts.final_states:
+            final[index[state]] = 1
+        names = {i: state.name for i, state in enumerate(states) if state.name is not None}
+        properties = {i: state.properties for i, state in enumerate(states) if state.properties is not None}
+        return cls(labels, offsets, letters, targets, [index[state] for state in ts.initial_states], bytes(final),
+                   names=names, properties=properties)
+
+    def state(self, state_id: int) -> State:
+        """
+        Returns a view of the state with the given id
+
+        Parameters
+        ----------
+        state_id : int
+            Id of the state
+
+        Returns
+        -------
+        State
+            State object, equal to every other view of the same state
+        """
+        return State(state_id, name=self.names.get(state_id), properties=self.properties.get(state_id),
+                     owner=self.state_ids)
+
+    def freeze(self) -> "CompactTransitionSystem":
+        """
+        Returns the transition system itself, it is already immutable
+
+        Returns
+        -------
+        CompactTransitionSystem
+        """
+        return self
+
+    def _structure(self) -> Tuple:
+        if self._key is None:
+            self._key = (self.labels, self.offsets.tobytes(), self.letters.tobytes(), self.targets.tobytes(),
+                         self.initial_states.ids, bytes(self.final_states.ids.bitmap))
+        return self._key
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactTransitionSystem):
+            return NotImplemented
+        return self is other or self._structure() == other._structure()
+
+    def __hash__(self):
+        return hash(self._structure())
+
+    def predecessor_arrays(self) -> Tuple[array, array, array]:
+        """
+        Returns the transitions in CSR form indexed by their targets. The arrays are built on first use
+
+        Returns
+        -------
+        Tuple[array, array, array]
+            Offsets, label indices and sources of the transitions entering each state
+        """
+        if self._predecessors is None:
+            n = len(self.offsets) - 1
+            offsets = array("q", [0]) * (n + 1)
+            for target in self.targets:
+                offsets[target + 1] += 1
+            for q in range(n):
+                offsets[q + 1] += offsets[q]
+            position = offsets[:-1]
+            letters, sources = array("i", [0]) * len(self.targets), array("i", [0]) * len(self.targets)
+            for source in range(n):
+                for i in range(self.offsets[source], self.offsets[source + 1]):
+                    target = self.targets[i]
+                    letters[position[target]], sources[position[target]] = self.letters[i], source
+                    position[target] += 1
+            self._predecessors = (offsets, letters, sources)
+        return self._predecessors
+
+    useful_states = TransitionSystem.useful_states
+
+    def successor_ids(self, state_id: int, letter: Hashable) -> array:
+        """
+        Returns the ids of the successors of a state for the given letter without creating state objects
+
+        Parameters
+        ----------
+        state_id : int
+            Id of the source state
+        letter : Hashable
+            Letter
+
+        Returns
+        -------
+        array
+            Ids of the successor states
+        """
+        column = self.label_to_index.get(letter)
+        if column is None:
+            return self.targets[0:0]
+        start, end = self.offsets[state_id], self.offsets[state_id + 1]
+        lo = bisect_left(self.letters, column, start, end)
+        hi = bisect_left(self.letters, column + 1, lo, end)
+        return self.targets[lo:hi]
+
+    def enabled_letters(self, state: State, ignore_epsilon=False) -> Set[Hashable]:
+        """
+        Returns the letters enabled in the given state
+
+        Parameters
+        ----------
+        state : State
+            State
+        ignore_epsilon: bool
+            If true, then epsilon will not be returned
+
+        Returns
+        -------
+        Set[Hashable]
+            Set of letters enabled in the given state
+
+        """
+        letters = set(self.labels[self.letters[i]]
+                      for i in range(self.offsets[state.state_id], self.offsets[state.state_id + 1]))
+        if ignore_epsilon:
+            letters.discard(Epsilon())
+        return letters
+
+    def get_successor(self, source: Union[State, Collection[State]], letter: Hashable) -> Set[State]:
+        """
+        Returns the set of successor state for a state or set of states and letter
+
+        Parameters
+        ----------
+        source : Union[State, Collection[State]]
+            State or set of states
+        letter : Hashable
+            Letter
+
+        Returns
+        -------
+        Set[State]
+            Set of states that can be reached from source via the given letter
+        """
+        if isinstance(source, State):
+            source = [source]
+        return set(self.state(target) for state in source for target in self.successor_ids(state.state_id, letter))
@@ -0,0 +1,574 @@
+import threading
+from array import array
+from collections import deque, OrderedDict
+from typing import Hashable, Iterable, Dict, List, Sequence, Tuple
+
+from automatapy.automata.charclass import letter_index, symbols
+from automatapy.automata.core import State, TransitionSystem, Epsilon
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class CompiledDFA:
+    """Read-only, array-backed deterministic finite automaton, it can be matched from several threads at once"""
+
+    __slots__ = ("alphabet", "letter_to_index", "table", "final", "initial", "dead", "stride", "states")
+
+    def __init__(self, alphabet: Sequence[Hashable], table: Sequence[int], final: Sequence[int], initial: int,
+                 states: Tuple[State, ...] = None):
+        """
+        Creates a compiled DFA from a dense transition table
+
+        Parameters
+        ----------
+        alphabet : Sequence[Hashable]
+            Letters of the automaton, the position of a letter is its column in the transition table
+        table : Sequence[int]
+            Row-major transition table with one row per state and one column per letter
+        final : Sequence[int]
+            Final-state table, ``final[q]`` is 1 if ``q`` is final and 0 otherwise. The last state is the dead state
+        initial : int
+            Initial state
+        states : Tuple[State, ...]
+            Optional states of the source transition system, ``states[q]`` is the state compiled to ``q``
+        """
+        self.alphabet: Tuple[Hashable, ...] = tuple(alphabet)
+        self.letter_to_index: Dict[Hashable, int] = letter_index(self.alphabet)
+        self.table = table
+        self.final = final
+        self.initial = initial
+        self.dead = len(final) - 1
+        self.stride = len(self.alphabet)
+        self.states = states
+
+    @classmethod
+    def from_transition_system(cls, ts: TransitionSystem) -> "CompiledDFA":
+        """
+        Compiles a deterministic transition system. Only the states reachable from the initial state are kept, they are
+        numbered in breadth-first order starting with 0 for the initial state
+
+        Parameters
+        ----------
+        ts : TransitionSystem
+            Deterministic transition system
+
+        Returns
+        -------
+        CompiledDFA
+            Compiled automaton
+
+        Raises
+        ------
+        ValueError
+            If the transition system is not deterministic
+        """
+        if len(ts.initial_states) > 1:
+            raise ValueError("Transition system has more than one initial state")
+        # Character classes may overlap, so symbolic systems are compiled over their minterms, a character read by two
+        # overlapping classes leading to different states makes the system nondeterministic
+        symbolic = getattr(ts, "symbolic", False)
+        letters = symbols(ts.alphabet) if symbolic else [(letter, letter) for letter in ts.alphabet]
+        alphabet = tuple(label for label, _ in letters)
+        letter_to_index = {letter: i for i, letter in enumerate(alphabet)}
+        stride = len(alphabet)
+        index: Dict[State, int] = dict()
+        states: List[State] = list(ts.initial_states)
+        for state in states:
+            index[state] = 0
+        queue = deque(states)
+        table = array("i")
+        while queue:
+            state = queue.popleft()
+            row = [-1] * stride
+            action_succ = ts.state_to_action_succ.get(state, dict())
+            if Epsilon() in action_succ:
+                raise ValueError(f"State {state} has an epsilon transition")
+            if symbolic:
+                action_succ = {label: ts.get_successor(state, letter) for label, letter in letters}
+            for letter, targets in action_succ.items():
+                if len(targets) > 1:
+                    raise ValueError(f"State {state} has more than one successor for letter {letter}")
+                for target in targets:
+                    if target not in index:
+                        index[target] = len(states)
+                        states.append(target)
+                        queue.append(target)
+                    row[letter_to_index[letter]] = index[target]
+            table.extend(row)
+        # Missing transitions lead to the dead state, which loops on every letter
+        dead = len(states)
+        table.extend([dead] * stride)
+        for i in range(len(table)):
+            if table[i] < 0:
+                table[i] = dead
+        final = bytearray(dead + 1)
+        for state in states:
+            if state in ts.final_states:
+                final[index[state]] = 1
+        initial = 0 if states else dead
+        return cls(alphabet, table, bytes(final), initial, states=tuple(states))
+
+    def step(self, state: int, letter: Hashable) -> int:
+        """
+        Returns the successor of a state for the given letter
+
+        Parameters
+        ----------
+        state : int
+            Source state
+        letter : Hashable
+            Letter
+
+        Returns
+        -------
+        int
+            Successor state, the dead state if the letter is not in the alphabet
+        """
+        column = self.letter_to_index.get(letter)
+        if column is None:
+            return self.dead
+        return self.table[state * self.stride + column]
+
+    def run(self, state: int, word: Iterable[Hashable]) -> int:
+        """
+        Reads a word starting in the given state
+
+        Parameters
+        ----------
+        state : int
+            State to start in
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        int
+            State reached after reading the word
+        """
+        table, stride, dead, letter_to_index = self.table, self.stride, self.dead, self.letter_to_index
+        for letter in word:
+            column = letter_to_index.get(letter)
+            if column is None:
+                return dead
+            state = table[state * stride + column]
+            if state == dead:
+                return dead
+        return state
+
+    def is_final(self, state: int) -> bool:
+        """
+        Checks whether the given state is final
+
+        Parameters
+        ----------
+        state : int
+            State
+
+        Returns
+        -------
+        bool
+        """
+        return self.final[state] == 1
+
+    def accepts(self, word: Iterable[Hashable]) -> bool:
+        """
+        Checks whether the automaton accepts the given word
+
+        Parameters
+        ----------
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        bool
+            True if it is accepted, False otherwise
+        """
+        return self.final[self.run(self.initial, word)] == 1
+
+    def accepts_many(self, words: Iterable[Iterable[Hashable]]):
+        """
+        Checks a batch of words at once. With NumPy installed and a batch of strings or of byte strings, the batch is
+        concatenated and decoded into code points, which are mapped to columns with a lookup table. All words are then
+        advanced in lockstep through the transition table, step i gathers the i-th letter of every word from the
+        concatenated columns, so the memory stays linear in the total length of the batch. Words are sorted by length
+        so that each step only touches the words that are still being read. Other words are checked one after another
+
+        Parameters
+        ----------
+        words : Iterable[Iterable[Hashable]]
+            Words to be checked
+
+        Returns
+        -------
+        Sequence[bool]
+            Boolean NumPy array, or list without NumPy, whose i-th entry tells whether the i-th word is accepted
+        """
+        if numpy is None:
+            return [self.accepts(word) for word in words]
+        words = list(words)
+        symbols = self._encode(words)
+        if symbols is None:
+            return numpy.fromiter((self.accepts(word) for word in words), dtype=bool, count=len(words))
+        lengths = numpy.fromiter(map(len, words), dtype=numpy.intp, count=len(words))
+        order = numpy.argsort(-lengths, kind="stable")
+        sorted_lengths = lengths[order]
+        longest = int(sorted_lengths[0]) if len(words) > 0 else 0
+        # Start of every word in the concatenated columns, by decreasing length
+        starts = (numpy.cumsum(lengths) - lengths)[order]
+        # An extra column maps letters outside of the alphabet to the dead state
+        table = numpy.full((len(self.final), self.stride + 1), self.dead, dtype=numpy.intp)
+        table[:, :self.stride] = numpy.asarray(self.table, dtype=numpy.intp).reshape(len(self.final), self.stride)
+        table = table.reshape(-1)
+        # Number of words that are longer than i, for every row i
+        active = numpy.searchsorted(-sorted_lengths, -numpy.arange(longest), side="left")
+        current = numpy.full(len(words), self.initial, dtype=numpy.intp)
+        for i in range(longest):
+            count = active[i]
+            current[:count] = table[current[:count] * (self.stride + 1) + symbols[starts[:count] + i]]
+        final = numpy.frombuffer(bytes(self.final), dtype=numpy.uint8)
+        result = numpy.empty(len(words), dtype=bool)
+        result[order] = final[current] == 1
+        return result
+
+    def _encode(self, words: List[Iterable[Hashable]]):
+        # Column of every letter of the concatenated batch, None unless the words are all strings or all byte strings
+        types = set(map(type, words))
+        if types <= {str}:
+            codes = numpy.frombuffer("".join(words).encode("utf-32-le", "surrogatepass"), dtype=numpy.uint32)
+            letter = chr
+        elif types <= {bytes, bytearray}:
+            codes = numpy.frombuffer(b"".join(words), dtype=numpy.uint8)
+            letter = int
+        else:
+            return None
+        if len(codes) == 0:
+            return numpy.empty(0, dtype=numpy.intp)
+        # Only the distinct code points of the batch are looked up in the alphabet
+        lookup = numpy.full(int(codes.max()) + 1, self.stride, dtype=numpy.intp)
+        letter_to_index, unknown = self.letter_to_index, self.stride
+        for code in numpy.flatnonzero(numpy.bincount(codes)).tolist():
+            lookup[code] = letter_to_index.get(letter(code), unknown)
+        return lookup[codes]
+
+
+class CompiledNFA:
+    """Read-only nondeterministic finite automaton that simulates state sets as integer bitmasks, it can be matched from
+    several threads at once"""
+
+    __slots__ = ("alphabet", "letter_to_index", "successors", "final", "initial", "dead", "states")
+
+    def __init__(self, alphabet: Sequence[Hashable], successors: Sequence[Sequence[int]], final: int, initial: int,
+                 states: Tuple[State, ...] = None):
+        """
+        Creates a compiled NFA from per-letter successor masks
+
+        Parameters
+        ----------
+        alphabet : Sequence[Hashable]
+            Letters of the automaton, the position of a letter is its index in ``successors``
+        successors : Sequence[Sequence[int]]
+            ``successors[a][q]`` is the bitmask of the states reachable from ``q`` with the ``a``-th letter
+        final : int
+            Bitmask of the final states
+        initial : int
+            Bitmask of the initial states
+        states : Tuple[State, ...]
+            Optional states of the source transition system, ``states[q]`` is the state compiled to bit ``q``
+        """
+        self.alphabet: Tuple[Hashable, ...] = tuple(alphabet)
+        self.letter_to_index: Dict[Hashable, int] = letter_index(self.alphabet)
+        self.successors = successors
+        self.final = final
+        self.initial = initial
+        self.dead = 0
+        self.states = states
+
+    @classmethod
+    def from_transition_system(cls, ts: TransitionSystem) -> "CompiledNFA":
+        """
+        Compiles an epsilon-free transition system. Only the states reachable from the initial states are kept, they
+        are numbered in breadth-first order
+
+        Parameters
+        ----------
+        ts : TransitionSystem
+            Transition system without epsilon transitions
+
+        Returns
+        -------
+        CompiledNFA
+            Compiled automaton
+
+        Raises
+        ------
+        ValueError
+            If the transition system contains epsilon transitions
+        """
+        # Character classes may overlap, so symbolic systems are compiled over their minterms
+        symbolic = getattr(ts, "symbolic", False)
+        letters = symbols(ts.alphabet) if symbolic else [(letter, letter) for letter in ts.alphabet]
+        alphabet = tuple(label for label, _ in letters)
+        letter_to_index = {letter: i for i, letter in enumerate(alphabet)}
+        index: Dict[State, int] = dict()
+        states: List[State] = list(ts.initial_states)
+        for i, state in enumerate(states):
+            index[state] = i
+        queue = deque(states)
+        successors: List[List[int]] = [[] for _ in alphabet]
+        while queue:
+            state = queue.popleft()
+            for column in successors:
+                column.append(0)
+            action_succ = ts.state_to_action_succ.get(state, dict())
+            if Epsilon() in action_succ:
+                raise ValueError(f"State {state} has an epsilon transition")
+            if symbolic:
+                action_succ = {label: ts.get_successor(state, letter) for label, letter in letters}
+            for letter, targets in action_succ.items():
+                mask = 0
+                for target in targets:
+                    if target not in index:
+                        index[target] = len(states)
+                        states.append(target)
+                        queue.append(target)
+                    mask |= 1 << index[target]
+                successors[letter_to_index[letter]][index[state]] = mask
+        final = 0
+        for state in states:
+            if state in ts.final_states:
+                final |= 1 << index[state]
+        initial = (1 << len(ts.initial_states)) - 1
+        return cls(alphabet, tuple(tuple(column) for column in successors), final, initial, states=tuple(states))
+
+    def step(self, current: int, letter: Hashable) -> int:
+        """
+        Returns the set of successors of a set of states for the given letter
+
+        Parameters
+        ----------
+        current : int
+            Bitmask of the current states
+        letter : Hashable
+            Letter
+
+        Returns
+        -------
+        int
+            Bitmask of the successor states
+        """
+        return self.run(current, (letter,))
+
+    def run(self, current: int, word: Iterable[Hashable]) -> int:
+        """
+        Reads a word starting in the given set of states
+
+        Parameters
+        ----------
+        current : int
+            Bitmask of the states to start in
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        int
+            Bitmask of the states reached after reading the word
+        """
+        successors, letter_to_index = self.successors, self.letter_to_index
+        for letter in word:
+            column = letter_to_index.get(letter)
+            if column is None:
+                return 0
+            succ = successors[column]
+            following = 0
+            while current:
+                lowest = current & -current
+                following |= succ[lowest.bit_length() - 1]
+                current ^= lowest
+            if not following:
+                return 0
+            current = following
+        return current
+
+    def is_final(self, current: int) -> bool:
+        """
+        Checks whether the given set of states contains a final state
+
+        Parameters
+        ----------
+        current : int
+            Bitmask of states
+
+        Returns
+        -------
+        bool
+        """
+        return current & self.final != 0
+
+    def accepts(self, word: Iterable[Hashable]) -> bool:
+        """
+        Checks whether the automaton accepts the given word
+
+        Parameters
+        ----------
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        bool
+            True if it is accepted, False otherwise
+        """
+        return self.run(self.initial, word) & self.final != 0
+
+
+class LazyDFA:
+    """Deterministic automaton whose states are built on demand from a compiled NFA"""
+
+    def __init__(self, nfa: CompiledNFA, cache_size: int = 4096, thrash_ratio: float = 0.5, min_steps: int = 256):
+        """
+        Creates a lazy DFA. Subsets of NFA states reached while matching are cached together with their outgoing
+        transitions, the least recently used subset is evicted once the cache is full. If a run keeps creating new
+        subsets on a full cache, it falls back to the NFA simulation for the rest of the word. Every cache access is
+        guarded by a lock, so several threads can run on the same lazy DFA at once
+
+        Parameters
+        ----------
+        nfa : CompiledNFA
+            Compiled NFA that is determinized
+        cache_size : int
+            Maximal number of cached subsets
+        thrash_ratio : float
+            Fraction of steps that may create a subset on a full cache before a run falls back to the NFA simulation
+        min_steps : int
+            Number of steps a run makes before the fallback is considered
+        """
+        self.nfa = nfa
+        self.alphabet = nfa.alphabet
+        self.letter_to_index = nfa.letter_to_index
+        self.initial = nfa.initial
+        self.final = nfa.final
+        self.dead = 0
+        self.cache_size = cache_size
+        self.thrash_ratio = thrash_ratio
+        self.min_steps = min_steps
+        self.cache: OrderedDict[int, Dict[int, int]] = OrderedDict()
+        self.evictions = 0
+        self.fallbacks = 0
+        self.lock = threading.Lock()
+
+    def step(self, current: int, letter: Hashable) -> int:
+        """
+        Returns the successor of a subset state for the given letter
+
+        Parameters
+        ----------
+        current : int
+            Bitmask of the current NFA states
+        letter : Hashable
+            Letter
+
+        Returns
+        -------
+        int
+            Bitmask of the successor NFA states
+        """
+        return self.run(current, (letter,))
+
+    def run(self, current: int, word: Iterable[Hashable]) -> int:
+        """
+        Reads a word starting in the given subset state, adding the subsets it reaches to the cache
+
+        Parameters
+        ----------
+        current : int
+            Bitmask of the NFA states to start in
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        int
+            Bitmask of the NFA states reached after reading the word
+        """
+        cache, letter_to_index, nfa = self.cache, self.letter_to_index, self.nfa
+        steps, misses = 0, 0
+        letters = iter(word)
+        acquire, release = self.lock.acquire, self.lock.release
+        for letter in letters:
+            column = letter_to_index.get(letter)
+            if column is None:
+                return 0
+            # Only the cache is guarded, successors are computed outside of the lock so runs of several threads overlap
+            acquire()
+            try:
+                row = cache.get(current)
+                if row is None:
+                    misses += 1
+                    if len(cache) >= self.cache_size:
+                        cache.popitem(last=False)
+                        self.evictions += 1
+                    row = cache[current] = dict()
+                else:
+                    cache.move_to_end(current)
+                following = row.get(column)
+            finally:
+                release()
+            if following is None:
+                # The row may have been evicted in the meantime, then the entry is simply lost
+                following = row[column] = nfa.run(current, (letter,))
+            current = following
+            if not current:
+                return 0
+            steps += 1
+            if steps >= self.min_steps and len(cache) >= self.cache_size and misses > self.thrash_ratio * steps:
+                with self.lock:
+                    self.fallbacks += 1
+                return nfa.run(current, letters)
+        return current
+
+    def is_final(self, current: int) -> bool:
+        """
+        Checks whether the given subset state is final
+
+        Parameters
+        ----------
+        current : int
+            Bitmask of NFA states
+
+        Returns
+        -------
+        bool
+        """
+        return current & self.final != 0
+
+    def accepts(self, word: Iterable[Hashable]) -> bool:
+        """
+        Checks whether the automaton accepts the given word
+
+        Parameters
+        ----------
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        bool
+            True if it is accepted, False otherwise
+        """
+        return self.run(self.initial, word) & self.final != 0
+
+    def clear(self):
+        """
+        Empties the subset cache
+
+        Returns
+        -------
+
+        """
+        with self.lock:
+            self.cache.clear()
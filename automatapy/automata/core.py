@@ -1,22 +1,29 @@
-from typing import Hashable, Set, Dict, List, Union
+import threading
+from collections.abc import Set as AbstractSet
+from typing import Hashable, Iterable, Iterator, Set, Dict, List, Union
 
 from automatapy.utils import SingletonMetaclass
+from automatapy.automata.charclass import CharClass
 
 
 class State:
 
-    def __init__(self, state_id, name=None, properties=None):
+    __slots__ = ("name", "state_id", "properties", "owner")
+
+    def __init__(self, state_id, name=None, properties=None, owner=None):
         self.name = name
         self.state_id = state_id
         self.properties = properties
+        # Id allocator of the transition system the state belongs to, ids are only unique per transition system
+        self.owner = owner
 
     def __eq__(self, other):
         if isinstance(other, State):
-            return self.state_id == other.state_id
+            return self.state_id == other.state_id and self.owner is other.owner
         return False
 
     def __hash__(self):
-        return hash(self.state_id) + hash(self.name)
+        return hash(self.state_id)
 
     def __str__(self):
         return f"q{self.state_id}" if self.name is None else self.name
@@ -42,6 +49,8 @@ class Epsilon(metaclass=SingletonMetaclass):
 
 class Transition:
 
+    __slots__ = ("source", "letter", "target")
+
     def __init__(self, source: State, letter: Hashable, target: State):
         self.source = source
         self.letter = letter
@@ -53,28 +62,94 @@ class Transition:
         return False
 
     def __hash__(self):
-        return hash(self.source) + hash(self.letter) + hash(self.target)
+        return hash((self.source, self.letter, self.target))
 
     def __str__(self):
         return f"{str(self.source)} -{str(self.letter)}-> {str(self.target)}"
 
 
-STATE_ID = -1
+class StateIds:
+    """Thread-safe allocator of the dense state ids 0, 1, 2, ... of a transition system"""
+
+    __slots__ = ("lock", "next_id")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.next_id = 0
+
+    def allocate(self, count: int = 1) -> int:
+        """
+        Reserves consecutive ids
+
+        Parameters
+        ----------
+        count : int
+            Number of ids
+
+        Returns
+        -------
+        int
+            First reserved id
+        """
+        with self.lock:
+            first = self.next_id
+            self.next_id += count
+        return first
+
+    def __getstate__(self):
+        return self.next_id
+
+    def __setstate__(self, next_id):
+        self.lock = threading.Lock()
+        self.next_id = next_id
+
+
+class _TransitionSet(AbstractSet):
+    """Live set of the transitions of a transition system, transition objects are created on iteration"""
+
+    def __init__(self, ts: "TransitionSystem"):
+        self.ts = ts
+
+    def __contains__(self, transition):
+        if not isinstance(transition, Transition):
+            return False
+        targets = self.ts.state_to_action_succ.get(transition.source, dict()).get(transition.letter, ())
+        return transition.target in targets
+
+    def __iter__(self) -> Iterator[Transition]:
+        for source, action_succ in list(self.ts.state_to_action_succ.items()):
+            for letter, targets in list(action_succ.items()):
+                for target in list(targets):
+                    yield Transition(source, letter, target)
+
+    def __len__(self):
+        return self.ts.transition_count
+
+    def __repr__(self):
+        return f"{{{', '.join(str(transition) for transition in self)}}}"
 
 
 class TransitionSystem:
 
     def __init__(self):
         self.states: Set[State] = set()
-        self.transitions: Set[Transition] = set()
+        # States are numbered densely in the order they are added, so their ids can index arrays
+        self.state_ids = StateIds()
+        # Transitions are stored in the adjacency dictionaries only, this is a live view of them
+        self.transitions: AbstractSet[Transition] = _TransitionSet(self)
+        self.transition_count = 0
         self.state_to_action_succ: Dict[State, Dict[Hashable, Set[State]]] = dict()
+        self.state_to_action_pred: Dict[State, Dict[Hashable, Set[State]]] = dict()
         self.alphabet: Set[Hashable] = set()
         self.initial_states: Set[State] = set()
         self.final_states: Set[State] = set()
+        # True once a transition is labeled with a character class
+        self.symbolic = False
 
     def add_state(self, name=None, properties=None, initial=False, final=False) -> State:
         """
-        Adds a state to the transition system
+        Adds a state to the transition system. States get the ids 0, 1, 2, ... in the order they are added, the ids are
+        allocated under a lock of the transition system
 
         Parameters
         ----------
@@ -91,9 +166,7 @@ class TransitionSystem:
         -------
 
         """
-        global STATE_ID
-        STATE_ID += 1
-        state = State(STATE_ID, name=name, properties=properties)
+        state = State(self.state_ids.allocate(), name=name, properties=properties, owner=self.state_ids)
         self.states.add(state)
         if initial:
             self.set_initial(state)
@@ -120,13 +193,144 @@ class TransitionSystem:
             Transition from source state to target state reading the specified letter
 
         """
-        transition = Transition(source, letter, target)
-        if letter != Epsilon():
-            self.alphabet.add(letter)
-        self.transitions.add(transition)
-        action_succ = self.state_to_action_succ.setdefault(source, dict())
-        action_succ.setdefault(letter, set()).add(target)
-        return transition
+        if letter not in self.alphabet:
+            self._add_letters((letter,))
+        self._add_edge(source, letter, target)
+        return Transition(source, letter, target)
+
+    def add_transitions(self, sources: Iterable[State], letters: Iterable[Hashable], targets: Iterable[State]):
+        """
+        Adds many transitions at once, the i-th transition goes from the i-th source to the i-th target reading the
+        i-th letter. The alphabet is only updated once per distinct letter
+
+        Parameters
+        ----------
+        sources : Iterable[State]
+            Source states
+        letters : Iterable[Hashable]
+            Letters read by the transitions
+        targets : Iterable[State]
+            Target states
+
+        Returns
+        -------
+
+        """
+        sources, letters, targets = list(sources), list(letters), list(targets)
+        if not len(sources) == len(letters) == len(targets):
+            raise ValueError("Sources, letters and targets must have the same length")
+        self._add_letters(set(letters) - self.alphabet)
+        add_edge = self._add_edge
+        for source, letter, target in zip(sources, letters, targets):
+            add_edge(source, letter, target)
+
+    def _add_letters(self, letters: Iterable[Hashable]):
+        for letter in letters:
+            if not isinstance(letter, Epsilon):
+                self.alphabet.add(letter)
+                if isinstance(letter, CharClass):
+                    self.symbolic = True
+
+    def _add_edge(self, source: State, letter: Hashable, target: State):
+        action_succ = self.state_to_action_succ.get(source)
+        if action_succ is None:
+            action_succ = self.state_to_action_succ[source] = dict()
+        successors = action_succ.get(letter)
+        if successors is None:
+            action_succ[letter] = {target}
+        elif target in successors:
+            return
+        else:
+            successors.add(target)
+        self.transition_count += 1
+        action_pred = self.state_to_action_pred.get(target)
+        if action_pred is None:
+            action_pred = self.state_to_action_pred[target] = dict()
+        predecessors = action_pred.get(letter)
+        if predecessors is None:
+            action_pred[letter] = {source}
+        else:
+            predecessors.add(source)
+
+    @classmethod
+    def from_edges(cls, sources: Iterable[int], letters: Iterable[Hashable], targets: Iterable[int],
+                   initial: Iterable[int] = (), final: Iterable[int] = (), states: int = None) -> "TransitionSystem":
+        """
+        Builds a transition system from parallel edge arrays over the state indices 0..n-1, the i-th edge goes from
+        state sources[i] to state targets[i] reading letters[i]. The arrays may be lists, arrays or NumPy arrays,
+        NumPy scalars are converted to Python values
+
+        Parameters
+        ----------
+        sources : Iterable[int]
+            Source index of every edge
+        letters : Iterable[Hashable]
+            Letter of every edge
+        targets : Iterable[int]
+            Target index of every edge
+        initial : Iterable[int]
+            Indices of the initial states
+        final : Iterable[int]
+            Indices of the final states
+        states : int
+            Number of states. If None, it is one more than the largest index
+
+        Returns
+        -------
+        TransitionSystem
+            Transition system whose i-th added state is the state with index i
+        """
+        def values(array) -> list:
+            return array.tolist() if hasattr(array, "tolist") else list(array)
+
+        sources, letters, targets, initial, final = map(values, (sources, letters, targets, initial, final))
+        if states is None:
+            states = 1 + max(max(indices, default=-1) for indices in (sources, targets, initial, final))
+        if not len(sources) == len(letters) == len(targets):
+            raise ValueError("Sources, letters and targets must have the same length")
+        if any(indices and not 0 <= min(indices) <= max(indices) < states
+               for indices in (sources, targets, initial, final)):
+            raise ValueError(f"State indices must be between 0 and {states - 1}")
+        ts = cls()
+        first, owner = ts.state_ids.allocate(states), ts.state_ids
+        state_list = [State(first + i, owner=owner) for i in range(states)]
+        ts.states.update(state_list)
+        ts.initial_states.update(map(state_list.__getitem__, initial))
+        ts.final_states.update(map(state_list.__getitem__, final))
+        ts._add_letters(set(letters))
+        # The adjacency dictionaries of the states are looked up by index, so state objects are only hashed when they
+        # are added to a successor or predecessor set
+        succ: List[Dict[Hashable, Set[State]]] = [dict() for _ in state_list]
+        pred: List[Dict[Hashable, Set[State]]] = [dict() for _ in state_list]
+        for source, letter, target in zip(sources, letters, targets):
+            successors = succ[source].get(letter)
+            if successors is None:
+                successors = succ[source][letter] = set()
+            successors.add(state_list[target])
+            predecessors = pred[target].get(letter)
+            if predecessors is None:
+                predecessors = pred[target][letter] = set()
+            predecessors.add(state_list[source])
+        for q, state in enumerate(state_list):
+            if succ[q]:
+                ts.state_to_action_succ[state] = succ[q]
+                ts.transition_count += sum(map(len, succ[q].values()))
+            if pred[q]:
+                ts.state_to_action_pred[state] = pred[q]
+        return ts
+
+    def freeze(self):
+        """
+        Returns an immutable, hashable snapshot of the transition system stored in compact integer arrays. Snapshots
+        of transition systems with the same structure and state order are equal
+
+        Returns
+        -------
+        CompactTransitionSystem
+            Read-only snapshot, later modifications of the transition system are not reflected
+        """
+        from automatapy.automata.compact import CompactTransitionSystem
+        return CompactTransitionSystem.from_transition_system(self)
 
     def set_initial(self, state: State):
         """
@@ -181,7 +385,8 @@ class TransitionSystem:
 
     def get_successor(self, source: Union[State, Set[State]], letter: Hashable) -> Set[State]:
         """
-        Returns the set of successor state for a state or set of states and letter
+        Returns the set of successor state for a state or set of states and letter. Transitions labeled with a
+        character class are taken for every character in the class
 
         Parameters
         ----------
@@ -197,8 +402,91 @@ class TransitionSystem:
         """
         if isinstance(source, State):
             source = set([source])
+        if self.symbolic:
+            return set(succ for state in source
+                       for label, targets in self.state_to_action_succ.get(state, dict()).items()
+                       if label == letter or isinstance(label, CharClass) and letter in label for succ in targets)
         return set(succ for state in source for succ in self.state_to_action_succ.get(state, dict()).get(letter, set()))
 
+    def get_predecessor(self, target: Union[State, Set[State]], letter: Hashable) -> Set[State]:
+        """
+        Returns the set of predecessor states of a state or set of states and letter
+
+        Parameters
+        ----------
+        target : Union[State, Set[State]]
+            State or set of states
+        letter : Hashable
+            Letter
+
+        Returns
+        -------
+        Set[State]
+            Set of states from which target can be reached via the given letter
+        """
+        if isinstance(target, State):
+            target = set([target])
+        return set(pred for state in target for pred in self.state_to_action_pred.get(state, dict()).get(letter, set()))
+
+    def useful_states(self) -> Set[State]:
+        """
+        Returns the useful states, i.e. the states that are reachable from an initial state and from which a final
+        state is reachable. Both searches take time linear in the size of the transition system
+
+        Returns
+        -------
+        Set[State]
+            Set of useful states
+        """
+        def search(start, adjacency):
+            visited, worklist = set(start), list(start)
+            while worklist:
+                for targets in adjacency.get(worklist.pop(), dict()).values():
+                    for target in targets:
+                        if target not in visited:
+                            visited.add(target)
+                            worklist.append(target)
+            return visited
+
+        accessible = search(self.initial_states, self.state_to_action_succ)
+        return search(accessible.intersection(self.final_states), self.state_to_action_pred) & accessible
+
+    def trim(self):
+        """
+        Removes the states that are not useful together with their transitions. The alphabet is kept
+
+        Returns
+        -------
+
+        """
+        useful = self.useful_states()
+        if len(useful) == len(self.states):
+            return
+        for state in self.states - useful:
+            for letter, targets in self.state_to_action_succ.pop(state, dict()).items():
+                for target in targets:
+                    self._discard_edge(self.state_to_action_pred, target, letter, state)
+            for letter, sources in self.state_to_action_pred.pop(state, dict()).items():
+                for source in sources:
+                    self._discard_edge(self.state_to_action_succ, source, letter, state)
+        self.states = useful
+        self.initial_states = self.initial_states & useful
+        self.final_states = self.final_states & useful
+        self.transition_count = sum(len(targets) for action_succ in self.state_to_action_succ.values()
+                                    for targets in action_succ.values())
+
+    @staticmethod
+    def _discard_edge(adjacency: Dict[State, Dict[Hashable, Set[State]]], state: State, letter: Hashable,
+                      other: State):
+        action_states = adjacency.get(state)
+        if action_states is None or letter not in action_states:
+            return
+        action_states[letter].discard(other)
+        if not action_states[letter]:
+            del action_states[letter]
+        if not action_states:
+            del adjacency[state]
+
     def to_dot(self, properties=None):
         """
         Returns a graphviz string representation of the transition system
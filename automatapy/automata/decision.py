@@ -0,0 +1,229 @@
+from collections import deque
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+from automatapy.automata.charclass import CharClass, symbols
+from automatapy.automata.compiled import CompiledDFA
+from automatapy.automata.core import State, TransitionSystem
+from automatapy.automata.product import LazyProduct
+
+
+class Decision:
+    """Answer of a decision procedure, negative answers come with a shortest counterexample"""
+
+    __slots__ = ("holds", "counterexample")
+
+    def __init__(self, holds: bool, counterexample: List[Hashable] = None):
+        self.holds = holds
+        self.counterexample = counterexample
+
+    def __bool__(self):
+        return self.holds
+
+    def __repr__(self):
+        return f"Decision({self.holds}, counterexample={self.counterexample})"
+
+
+def _word(parent: Dict, node) -> List[Hashable]:
+    word = []
+    while parent[node] is not None:
+        node, letter = parent[node]
+        word.append(letter)
+    return word[::-1]
+
+
+class _Antichain:
+    """Sets of states kept per key, a set is only added if no subset of it has been added before"""
+
+    def __init__(self):
+        self.minimal: Dict[Hashable, List[FrozenSet[State]]] = dict()
+
+    def add(self, key: Hashable, states: FrozenSet[State]) -> bool:
+        minimal = self.minimal.setdefault(key, [])
+        if any(other <= states for other in minimal):
+            return False
+        minimal[:] = [other for other in minimal if not states <= other]
+        minimal.append(states)
+        return True
+
+
+def _concrete(letter: Hashable) -> Hashable:
+    # Counterexamples contain characters rather than character classes
+    return chr(letter.starts[0]) if isinstance(letter, CharClass) else letter
+
+
+def is_empty(ts: TransitionSystem) -> Decision:
+    """
+    Checks whether the epsilon-free transition system accepts no word
+
+    Parameters
+    ----------
+    ts : TransitionSystem
+        Transition system
+
+    Returns
+    -------
+    Decision
+        Negative answers contain a shortest accepted word
+    """
+    parent: Dict[State, Optional[Tuple[State, Hashable]]] = {state: None for state in ts.initial_states}
+    queue = deque(parent)
+    while queue:
+        state = queue.popleft()
+        if state in ts.final_states:
+            return Decision(False, _word(parent, state))
+        for letter, targets in ts.state_to_action_succ.get(state, dict()).items():
+            for target in targets:
+                if target not in parent:
+                    parent[target] = (state, _concrete(letter))
+                    queue.append(target)
+    return Decision(True)
+
+
+def is_subset_of(left: TransitionSystem, right: TransitionSystem) -> Decision:
+    """
+    Checks whether the language of the left transition system is included in the language of the right one. The
+    pairs of a left state and a set of right states are searched breadth-first, pairs whose set contains the set of an
+    already visited pair with the same left state are pruned (antichain), so the right side is never fully determinized
+
+    Parameters
+    ----------
+    left : TransitionSystem
+        Epsilon-free transition system
+    right : TransitionSystem
+        Epsilon-free transition system
+
+    Returns
+    -------
+    Decision
+        Negative answers contain a shortest word accepted by the left but not by the right transition system
+    """
+    antichain = _Antichain()
+    initial = frozenset(right.initial_states)
+    symbolic = getattr(left, "symbolic", False) or getattr(right, "symbolic", False)
+    letters = [letter for _, letter in symbols(left.alphabet | right.alphabet)] if symbolic else None
+    parent: Dict[Tuple[State, FrozenSet[State]], Optional[Tuple]] = dict()
+    queue = deque()
+    for state in left.initial_states:
+        if antichain.add(state, initial):
+            parent[(state, initial)] = None
+            queue.append((state, initial))
+    while queue:
+        node = state, states = queue.popleft()
+        if state in left.final_states and not any(q in right.final_states for q in states):
+            return Decision(False, _word(parent, node))
+        if symbolic:
+            action_succ = {letter: left.get_successor(state, letter) for letter in letters}
+        else:
+            action_succ = left.state_to_action_succ.get(state, dict())
+        for letter, targets in action_succ.items():
+            successors = frozenset(right.get_successor(states, letter))
+            for target in targets:
+                if antichain.add(target, successors):
+                    parent[(target, successors)] = (node, letter)
+                    queue.append((target, successors))
+    return Decision(True)
+
+
+def is_universal(ts: TransitionSystem, alphabet: Iterable[Hashable] = None) -> Decision:
+    """
+    Checks whether the epsilon-free transition system accepts every word over the alphabet. Sets of states are searched
+    breadth-first, sets that contain an already visited set are pruned (antichain)
+
+    Parameters
+    ----------
+    ts : TransitionSystem
+        Transition system
+    alphabet : Iterable[Hashable]
+        Alphabet, if None the alphabet of the transition system is used
+
+    Returns
+    -------
+    Decision
+        Negative answers contain a shortest rejected word
+    """
+    alphabet = [letter for _, letter in symbols(alphabet if alphabet is not None else ts.alphabet)]
+    antichain = _Antichain()
+    initial = frozenset(ts.initial_states)
+    antichain.add(None, initial)
+    parent: Dict[FrozenSet[State], Optional[Tuple]] = {initial: None}
+    queue = deque([initial])
+    while queue:
+        states = queue.popleft()
+        if not any(q in ts.final_states for q in states):
+            return Decision(False, _word(parent, states))
+        for letter in alphabet:
+            successors = frozenset(ts.get_successor(states, letter))
+            if antichain.add(None, successors):
+                parent[successors] = (states, letter)
+                queue.append(successors)
+    return Decision(True)
+
+
+def _shortest_difference(left: TransitionSystem, right: TransitionSystem) -> List[Hashable]:
+    return LazyProduct(left, right, lambda l, r: l != r).find_word()
+
+
+def is_equivalent_dfa(left: TransitionSystem, right: TransitionSystem) -> Decision:
+    """
+    Checks whether two deterministic transition systems accept the same language with the Hopcroft-Karp algorithm,
+    merging the classes of pairs of states that have to be equivalent in a union-find structure
+
+    Parameters
+    ----------
+    left : TransitionSystem
+        Deterministic transition system
+    right : TransitionSystem
+        Deterministic transition system
+
+    Returns
+    -------
+    Decision
+        Negative answers contain a shortest word accepted by exactly one of the transition systems
+    """
+    dfa1, dfa2 = CompiledDFA.from_transition_system(left), CompiledDFA.from_transition_system(right)
+    offset = len(dfa1.final)
+    alphabet = [letter for _, letter in symbols(set(dfa1.alphabet) | set(dfa2.alphabet))]
+    parent = list(range(offset + len(dfa2.final)))
+
+    def find(q: int) -> int:
+        while parent[q] != q:
+            parent[q] = parent[parent[q]]
+            q = parent[q]
+        return q
+
+    parent[offset + dfa2.initial] = dfa1.initial
+    stack = [(dfa1.initial, dfa2.initial)]
+    while stack:
+        p, q = stack.pop()
+        if dfa1.final[p] != dfa2.final[q]:
+            return Decision(False, _shortest_difference(left, right))
+        for letter in alphabet:
+            p1, q1 = dfa1.step(p, letter), dfa2.step(q, letter)
+            r1, r2 = find(p1), find(offset + q1)
+            if r1 != r2:
+                parent[r2] = r1
+                stack.append((p1, q1))
+    return Decision(True)
+
+
+def is_equivalent(left: TransitionSystem, right: TransitionSystem) -> Decision:
+    """
+    Checks whether two epsilon-free transition systems accept the same language with two antichain inclusion checks
+
+    Parameters
+    ----------
+    left : TransitionSystem
+        Epsilon-free transition system
+    right : TransitionSystem
+        Epsilon-free transition system
+
+    Returns
+    -------
+    Decision
+        Negative answers contain a shortest word accepted by exactly one of the transition systems
+    """
+    included, includes = is_subset_of(left, right), is_subset_of(right, left)
+    if included and includes:
+        return Decision(True)
+    counterexamples = [d.counterexample for d in [included, includes] if not d]
+    return Decision(False, min(counterexamples, key=len))
@@ -1,84 +1,212 @@
 import abc
-from typing import Set, Hashable, Dict, Tuple, Union, Sequence
+from typing import Set, Hashable, Dict, FrozenSet, Tuple, Union, Sequence, Callable, List
 
+from automatapy.automata.charclass import symbols
 from automatapy.automata.core import State, Transition, TransitionSystem, Epsilon
+from automatapy.automata.compiled import CompiledDFA
+from automatapy.automata.instrumentation import Instrumented
 from typing import Collection
 
 from collections import deque
 
 
-class Engine:
+class Engine(Instrumented):
 
     def __init__(self):
+        super().__init__()
         self.ts: TransitionSystem = None
 
     def set_transition_system(self, ts: TransitionSystem):
         self.ts = ts
 
+    def add_state(self, ts: TransitionSystem, **kwargs) -> State:
+        """Adds a state to a transition system built by the engine, recording it if the engine is instrumented"""
+        state = ts.add_state(**kwargs)
+        if self.instrumented:
+            if self.stats is not None:
+                self.stats.states_created += 1
+            self.emit("on_state_created", state)
+        return state
+
+    def add_transition(self, ts: TransitionSystem, source: State, letter: Hashable, target: State) -> Transition:
+        """Adds a transition to a transition system built by the engine, recording it if the engine is instrumented"""
+        transition = ts.add_transition(source, letter, target)
+        if self.instrumented:
+            if self.stats is not None:
+                self.stats.transitions_created += 1
+            self.emit("on_transition_created", transition)
+        return transition
+
+    def reverse(self) -> TransitionSystem:
+        """
+        Returns the reversal of the transition system. Transitions are reversed and initial and final states are
+        swapped, names and properties of the states are kept
+
+        Returns
+        -------
+        TransitionSystem
+            Transition system accepting the reversed words
+        """
+        ts = TransitionSystem()
+        new_states: Dict[State, State] = dict()
+        for state in self.ts.states:
+            new_states[state] = ts.add_state(name=state.name, properties=state.properties,
+                                             initial=state in self.ts.final_states,
+                                             final=state in self.ts.initial_states)
+        for transition in self.ts.transitions:
+            ts.add_transition(new_states[transition.target], transition.letter, new_states[transition.source])
+        return ts
+
+    def record_worklist(self, size: int):
+        """Records the current size of a worklist"""
+        if self.stats is not None and size > self.stats.peak_worklist:
+            self.stats.peak_worklist = size
+
 
 class EpsilonEngine(Engine):
 
+    def epsilon_components(self, epsilon_succ: List[List[int]]) -> List[List[int]]:
+        """
+        Computes the strongly connected components of the epsilon transitions with Tarjan's algorithm, using an explicit
+        stack instead of recursion
+
+        Parameters
+        ----------
+        epsilon_succ : List[List[int]]
+            Epsilon successors of every state, states are numbered 0..n-1
+
+        Returns
+        -------
+        List[List[int]]
+            Components in reverse topological order, i.e. every component comes after the components it reaches
+        """
+        n = len(epsilon_succ)
+        index, low = [-1] * n, [0] * n
+        on_stack = [False] * n
+        stack, components = [], []
+        counter = 0
+        for root in range(n):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            call_stack = [(root, iter(epsilon_succ[root]))]
+            while call_stack:
+                q, successors = call_stack[-1]
+                descended = False
+                for r in successors:
+                    if index[r] < 0:
+                        index[r] = low[r] = counter
+                        counter += 1
+                        stack.append(r)
+                        on_stack[r] = True
+                        call_stack.append((r, iter(epsilon_succ[r])))
+                        descended = True
+                        break
+                    if on_stack[r] and index[r] < low[q]:
+                        low[q] = index[r]
+                if descended:
+                    continue
+                call_stack.pop()
+                if call_stack:
+                    parent = call_stack[-1][0]
+                    if low[q] < low[parent]:
+                        low[parent] = low[q]
+                if low[q] == index[q]:
+                    component = []
+                    while True:
+                        r = stack.pop()
+                        on_stack[r] = False
+                        component.append(r)
+                        if r == q:
+                            break
+                    components.append(component)
+        return components
+
     def remove_epsilon(self) -> TransitionSystem:
         """
         Removes the epsilon transitions from a transition system. The resulting transition system does not contain any
         epsilon transitions
 
+        The strongly connected components of the epsilon transitions are collapsed first. The epsilon closure and the
+        letter successors of the closure are then computed once per component in reverse topological order as
+        bitsets, and the states reachable from the initial states are added to the result in a single pass. States from
+        which no final state can be reached are trimmed from the result
+
         Returns
         -------
         TransitionSystem
             Transition system without epsilon transitions
 
         """
-        # Add transitions from initial states to worklist
-        worklist = []
-        for state in self.ts.initial_states:
-            for letter in self.ts.enabled_letters(state):
-                for target in self.ts.get_successor(state, letter):
-                    worklist.append(Transition(state, letter, target))
-        ts = TransitionSystem()
-        state_dict: Dict[State, State] = dict()
-        # Add initial states to visited dictionary
-        for state in self.ts.initial_states:
-            state_dict[state] = ts.add_state(initial=True)
-            if state in self.ts.final_states:
-                ts.set_final(state_dict[state])
-        # delta contains non-epsilon transitions, epsilon_delta contains epsilon transitions
-        delta, epsilon_delta = set(), set()
-        while worklist:
-            t = worklist.pop()
-            print(t)
-            # Create new state if it has not been visited before
-            if t.target not in state_dict:
-                state_dict[t.target] = ts.add_state()
-                if t.target in self.ts.final_states:
-                    ts.set_final(state_dict[t.target])
-            # Check whether the transition is an epsilon transition
-            if t.letter == Epsilon():
-                # Epsilon case
-                epsilon_delta.add(t)
-                if state_dict[t.target] in ts.final_states:
-                    ts.set_final(state_dict[t.source])
-                for letter in self.ts.enabled_letters(t.target):
-                    for target in self.ts.get_successor(t.target, letter):
-                        t1 = Transition(t.source, letter, target)
-                        if t1 not in delta and t1 not in epsilon_delta:
-                            worklist.append(t1)
-            else:
-                delta.add(t)
-                # Add to transition system
-                ts.add_transition(state_dict[t.source], t.letter, state_dict[t.target])
-                # Iterate over epsilon successors of target
-                for target in self.ts.get_successor(t.target, Epsilon()):
-                    t1 = Transition(t.source, t.letter, target)
-                    if t1 not in delta:
-                        worklist.append(t1)
-                for letter in self.ts.enabled_letters(t.target, ignore_epsilon=True):
-                    for target in self.ts.get_successor(t.target, letter):
-                        t1 = Transition(t.target, letter, target)
-                        if t1 not in delta:
-                            worklist.append(t1)
-        print([str(t) for t in epsilon_delta])
-        print([str(t) for t in delta])
+        with self.phase("remove_epsilon.closure"):
+            states = list(self.ts.states)
+            index = {state: i for i, state in enumerate(states)}
+            epsilon, n = Epsilon(), len(states)
+            # Epsilon successors and letter successor bitmasks of every state
+            epsilon_succ: List[List[int]] = [[] for _ in range(n)]
+            letter_succ: List[Dict[Hashable, int]] = [dict() for _ in range(n)]
+            for q, state in enumerate(states):
+                for letter, targets in self.ts.state_to_action_succ.get(state, dict()).items():
+                    if letter == epsilon:
+                        epsilon_succ[q] = [index[target] for target in targets]
+                    else:
+                        mask = 0
+                        for target in targets:
+                            mask |= 1 << index[target]
+                        letter_succ[q][letter] = mask
+            final_mask = 0
+            for state in self.ts.final_states:
+                final_mask |= 1 << index[state]
+            # Closure and successors of the closure, shared by all states of a component
+            component_of = [0] * n
+            closures: List[int] = []
+            closure_succ: List[Dict[Hashable, int]] = []
+            for c, component in enumerate(self.epsilon_components(epsilon_succ)):
+                closure, succ = 0, dict()
+                for q in component:
+                    component_of[q] = c
+                for q in component:
+                    closure |= 1 << q
+                    for letter, mask in letter_succ[q].items():
+                        succ[letter] = succ.get(letter, 0) | mask
+                    for r in epsilon_succ[q]:
+                        d = component_of[r]
+                        if d != c:
+                            closure |= closures[d]
+                            for letter, mask in closure_succ[d].items():
+                                succ[letter] = succ.get(letter, 0) | mask
+                closures.append(closure)
+                closure_succ.append(succ)
+                if self.instrumented:
+                    if self.stats is not None:
+                        self.stats.closures += 1
+                    self.emit("on_closure", [states[q] for q in component])
+        # Build the epsilon-free transition system from the initial states
+        with self.phase("remove_epsilon.build"):
+            ts = TransitionSystem()
+            new_states: Dict[int, State] = dict()
+            worklist = []
+            for state in self.ts.initial_states:
+                q = index[state]
+                new_states[q] = self.add_state(ts, initial=True, final=closures[component_of[q]] & final_mask != 0)
+                worklist.append(q)
+            self.record_worklist(len(worklist))
+            while worklist:
+                q = worklist.pop()
+                for letter, mask in closure_succ[component_of[q]].items():
+                    while mask:
+                        lowest = mask & -mask
+                        r = lowest.bit_length() - 1
+                        mask ^= lowest
+                        if r not in new_states:
+                            new_states[r] = self.add_state(ts, final=closures[component_of[r]] & final_mask != 0)
+                            worklist.append(r)
+                        self.add_transition(ts, new_states[q], letter, new_states[r])
+                self.record_worklist(len(worklist))
+            ts.trim()
         return ts
 
 
@@ -99,37 +227,243 @@ class NondeterministicEngine(Engine):
         bool
             True if it is accepted, False otherwise
         """
-        current = self.ts.initial_states
-        while len(word) > 0:
-            current = self.ts.get_successor(current, word[0])
-            word = word[1:]
+        current = set(self.ts.initial_states)
+        instrumented = self.instrumented
+        for letter in word:
+            current = self.ts.get_successor(current, letter)
+            if instrumented:
+                if self.stats is not None:
+                    self.stats.steps += 1
+                self.emit("on_step", letter, current)
+            if not current:
+                return False
         return len(current.intersection(self.ts.final_states)) > 0
 
-    def determinize(self, alphabet=None):
+    def determinize(self, alphabet=None) -> TransitionSystem:
         """
-        Returns a deterministic version of the nondeterministic transition system
+        Returns a deterministic version of the nondeterministic transition system. States that are unreachable or from
+        which no final state is reachable are left out of the subsets, the transition system itself is not modified
+
+        Parameters
+        ----------
+        alphabet: Set[Hashable]
+            Alphabet of the powerset construction. If None, the alphabet of the transition system is used
 
         Returns
         -------
         TransitionSystem
             Deterministic transition system
         """
-        ts = TransitionSystem()
-        alphabet = self.ts.alphabet if alphabet is None else alphabet
-        worklist = [ts.add_state(name=f"q0", properties={"states": frozenset(self.ts.initial_states)}, initial=True,
-                                 final=len(frozenset(self.ts.initial_states).intersection(self.ts.final_states)) > 0)]
-        set_to_state = {worklist[0].properties["states"]: worklist[0]}
-        counter = 0
-        while worklist:
-            current = worklist.pop()
-            for letter in alphabet:
-                succ = frozenset(self.ts.get_successor(current.properties["states"], letter))
-                if succ not in set_to_state:
-                    counter += 1
-                    state = ts.add_state(name=f"q{counter}", properties={"states": succ})
-                    if len(succ.intersection(self.ts.final_states)) > 0:
-                        ts.set_final(state)
-                    worklist.append(state)
-                    set_to_state[succ] = state
-                ts.add_transition(current, letter, set_to_state[succ])
-        return ts
+        return self.subset_construction(alphabet)[0]
+
+    def subset_construction(self, alphabet=None) -> Tuple[TransitionSystem, Dict[State, int], List[State]]:
+        """
+        Runs the powerset construction on bitsets. The useful states are numbered and the successor masks of every
+        state and letter are computed once, a subset is the bitmask of its states and is mapped to its deterministic
+        state by a single dictionary lookup
+
+        Parameters
+        ----------
+        alphabet: Set[Hashable]
+            Alphabet of the powerset construction. If None, the alphabet of the transition system is used
+
+        Returns
+        -------
+        Tuple[TransitionSystem, Dict[State, int], List[State]]
+            Deterministic transition system, the subset of every deterministic state as a bitmask and the states of the
+            nondeterministic transition system in bit order
+        """
+        with self.phase("determinize"):
+            ts = TransitionSystem()
+            alphabet = self.ts.alphabet if alphabet is None else alphabet
+            # Character classes are explored once per minterm instead of once per character
+            letters = symbols(alphabet)
+            # Subsets only keep useful states, dead branches of the NFA are never explored
+            states = list(self.ts.useful_states())
+            index = {state: q for q, state in enumerate(states)}
+            successors: List[Dict[Hashable, int]] = [dict() for _ in states]
+            symbolic = getattr(self.ts, "symbolic", False)
+            for q, state in enumerate(states):
+                if symbolic:
+                    action_succ = {label: self.ts.get_successor(state, letter) for label, letter in letters}
+                else:
+                    action_succ = self.ts.state_to_action_succ.get(state, dict())
+                for label, targets in action_succ.items():
+                    mask = 0
+                    for target in targets:
+                        if target in index:
+                            mask |= 1 << index[target]
+                    if mask:
+                        successors[q][label] = mask
+            final_mask = 0
+            for state in self.ts.final_states:
+                if state in index:
+                    final_mask |= 1 << index[state]
+            initial = 0
+            for state in self.ts.initial_states:
+                if state in index:
+                    initial |= 1 << index[state]
+            instrumented = self.instrumented
+            mask_to_state: Dict[int, State] = {initial: self.add_state(ts, name="q0", initial=True,
+                                                                       final=initial & final_mask != 0)}
+            if instrumented:
+                self._record_subset(self._states_of(initial, states))
+            worklist = [initial]
+            while worklist:
+                if instrumented:
+                    self.record_worklist(len(worklist))
+                current = worklist.pop()
+                source = mask_to_state[current]
+                # Successor masks of the subset for all letters at once
+                image: Dict[Hashable, int] = dict()
+                mask = current
+                while mask:
+                    lowest = mask & -mask
+                    mask ^= lowest
+                    for label, succ in successors[lowest.bit_length() - 1].items():
+                        image[label] = image.get(label, 0) | succ
+                for label, _ in letters:
+                    succ = image.get(label, 0)
+                    target = mask_to_state.get(succ)
+                    if target is None:
+                        target = mask_to_state[succ] = self.add_state(ts, name=f"q{len(mask_to_state)}",
+                                                                      final=succ & final_mask != 0)
+                        if instrumented:
+                            self._record_subset(self._states_of(succ, states))
+                        worklist.append(succ)
+                    self.add_transition(ts, source, label, target)
+        return ts, {state: mask for mask, state in mask_to_state.items()}, states
+
+    @staticmethod
+    def _states_of(mask: int, states: List[State]) -> FrozenSet[State]:
+        return frozenset(states[q] for q in range(mask.bit_length()) if mask >> q & 1)
+
+    def _record_subset(self, subset: Collection[State]):
+        if self.stats is not None:
+            self.stats.subset_sizes[len(subset)] += 1
+        self.emit("on_subset", subset)
+
+
+class DeterministicEngine(NondeterministicEngine):
+    """Deterministic engine implementation"""
+
+    def minimize(self, partition_key: Callable[[State], Hashable] = None) -> Tuple[TransitionSystem, Dict[State, State]]:
+        """
+        Minimizes the deterministic transition system with Hopcroft's partition refinement algorithm. Only states
+        reachable from the initial state are kept. Missing transitions are treated as transitions to a dead state, the
+        dead state is only part of the result if the transition system already contains states equivalent to it
+
+        Parameters
+        ----------
+        partition_key: Callable[[State], Hashable]
+            Optional function on final states. Final states with different keys are never merged
+
+        Returns
+        -------
+        Tuple[TransitionSystem, Dict[State, State]]
+            Minimal transition system and mapping from the reachable states to the states of the minimal system
+        """
+        with self.phase("minimize.refine"):
+            compiled = CompiledDFA.from_transition_system(self.ts)
+            table, stride, dead, size = compiled.table, compiled.stride, compiled.dead, len(compiled.final)
+            # Initial partition: non-final states together with the dead state, final states grouped by their key
+            initial_blocks: Dict[Hashable, List[int]] = {None: [dead]}
+            for q, state in enumerate(compiled.states):
+                key = None
+                if compiled.final[q]:
+                    key = (partition_key(state),) if partition_key is not None else ()
+                initial_blocks.setdefault(key, []).append(q)
+            # Refinable partition: the states of block b are elements[first[b]:end[b]], marked states are moved to the
+            # front of their block, i.e. to elements[first[b]:marked[b]]
+            elements: List[int] = []
+            block_of, location = [0] * size, [0] * size
+            first, end, marked = [], [], []
+            for block, members in enumerate(initial_blocks.values()):
+                first.append(len(elements))
+                marked.append(len(elements))
+                for q in members:
+                    block_of[q] = block
+                    location[q] = len(elements)
+                    elements.append(q)
+                end.append(len(elements))
+            # Inverse transition function in CSR form, predecessors[a][offsets[a][q]:offsets[a][q + 1]] are the
+            # predecessors of q with the a-th letter
+            offsets, predecessors = [], []
+            for a in range(stride):
+                count = [0] * (size + 1)
+                for q in range(size):
+                    count[table[q * stride + a] + 1] += 1
+                for q in range(size):
+                    count[q + 1] += count[q]
+                position, pred = count[:-1], [0] * size
+                for q in range(size):
+                    target = table[q * stride + a]
+                    pred[position[target]] = q
+                    position[target] += 1
+                offsets.append(count)
+                predecessors.append(pred)
+            largest = max(range(len(first)), key=lambda b: end[b] - first[b])
+            worklist = [b for b in range(len(first)) if b != largest]
+            while worklist:
+                splitter = worklist.pop()
+                members = elements[first[splitter]:end[splitter]]
+                for a in range(stride):
+                    offset, pred = offsets[a], predecessors[a]
+                    touched = []
+                    for target in members:
+                        for i in range(offset[target], offset[target + 1]):
+                            q = pred[i]
+                            block = block_of[q]
+                            m = marked[block]
+                            if location[q] < m:
+                                continue
+                            if m == first[block]:
+                                touched.append(block)
+                            # Swap q with the first unmarked state of its block
+                            other = elements[m]
+                            elements[m], elements[location[q]] = q, other
+                            location[other], location[q] = location[q], m
+                            marked[block] = m + 1
+                    for block in touched:
+                        m = marked[block]
+                        if m == end[block]:
+                            marked[block] = first[block]
+                            continue
+                        # Split off the smaller part as a new block
+                        new = len(first)
+                        if m - first[block] <= end[block] - m:
+                            first.append(first[block])
+                            end.append(m)
+                            first[block] = m
+                        else:
+                            first.append(m)
+                            end.append(end[block])
+                            end[block] = m
+                        marked[block] = first[block]
+                        marked.append(first[new])
+                        for i in range(first[new], end[new]):
+                            block_of[elements[i]] = new
+                        # The new block is the smaller half and always becomes a splitter, if the old block is still
+                        # pending then it keeps the other half in the worklist
+                        worklist.append(new)
+                        self.record_worklist(len(worklist))
+        with self.phase("minimize.build"):
+            # Build the minimal transition system, dropping the block of the dead state if it only contains that state
+            ts = TransitionSystem()
+            dead_block = block_of[dead] if end[block_of[dead]] - first[block_of[dead]] == 1 else None
+            block_to_state: Dict[int, State] = dict()
+            for block in range(len(first)):
+                if block != dead_block:
+                    q = elements[first[block]]
+                    block_to_state[block] = self.add_state(ts, final=compiled.final[q] == 1)
+            for block, state in block_to_state.items():
+                q = elements[first[block]]
+                for a, letter in enumerate(compiled.alphabet):
+                    target = block_of[table[q * stride + a]]
+                    if target != dead_block:
+                        self.add_transition(ts, state, letter, block_to_state[target])
+            if compiled.states:
+                ts.set_initial(block_to_state[block_of[compiled.initial]])
+            mapping = {state: block_to_state[block_of[q]] for q, state in enumerate(compiled.states)
+                       if block_of[q] != dead_block}
+        return ts, mapping
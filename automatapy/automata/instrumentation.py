@@ -0,0 +1,128 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+EVENTS = ("on_state_created", "on_transition_created", "on_step", "on_subset", "on_closure", "on_phase")
+
+
+class EngineStats:
+    """Statistics collected by an engine while it is instrumented"""
+
+    def __init__(self):
+        self.states_created = 0
+        self.transitions_created = 0
+        self.peak_worklist = 0
+        self.subset_sizes: Counter = Counter()
+        self.closures = 0
+        self.steps = 0
+        self.phase_times: Dict[str, float] = dict()
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Returns the statistics as a dictionary
+
+        Returns
+        -------
+        Dict[str, Any]
+            Counters, a histogram of the subset sizes seen during determinization and the wall time per phase in seconds
+        """
+        return {"states_created": self.states_created, "transitions_created": self.transitions_created,
+                "peak_worklist": self.peak_worklist, "subset_sizes": dict(self.subset_sizes),
+                "closures": self.closures, "steps": self.steps, "phase_times": dict(self.phase_times)}
+
+    def __repr__(self):
+        return f"EngineStats({self.report()})"
+
+
+class Instrumented:
+    """Hooks and statistics shared by all engines"""
+
+    def __init__(self):
+        self.hooks: Dict[str, list] = dict()
+        self.stats: EngineStats = None
+
+    def register_hook(self, event: str, callback):
+        """
+        Registers a callback for an event. The events are ``on_state_created(state)``,
+        ``on_transition_created(transition)``, ``on_step(letter, current)``, ``on_subset(subset)``,
+        ``on_closure(states)`` and ``on_phase(name, seconds)``
+
+        Parameters
+        ----------
+        event : str
+            Name of the event
+        callback : Callable
+            Function called with the arguments of the event
+
+        Returns
+        -------
+
+        """
+        if event not in EVENTS:
+            raise ValueError(f"Unknown event {event}, expected one of {', '.join(EVENTS)}")
+        self.hooks.setdefault(event, []).append(callback)
+
+    def remove_hook(self, event: str, callback):
+        """
+        Removes a previously registered callback
+
+        Parameters
+        ----------
+        event : str
+            Name of the event
+        callback : Callable
+            Registered function
+
+        Returns
+        -------
+
+        """
+        self.hooks[event].remove(callback)
+        if not self.hooks[event]:
+            del self.hooks[event]
+
+    @property
+    def instrumented(self) -> bool:
+        return self.stats is not None or bool(self.hooks)
+
+    def emit(self, event: str, *args):
+        for callback in self.hooks.get(event, ()):
+            callback(*args)
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.instrumented:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if self.stats is not None:
+                self.stats.phase_times[name] = self.stats.phase_times.get(name, 0.0) + elapsed
+            self.emit("on_phase", name, elapsed)
+
+
+@contextmanager
+def collect_stats(target) -> Iterator[EngineStats]:
+    """
+    Collects statistics of an engine, or of the engine of an automaton, for the duration of the block
+
+    Parameters
+    ----------
+    target : Union[FiniteAutomaton, Engine]
+        Automaton or engine
+
+    Returns
+    -------
+    Iterator[EngineStats]
+        Statistics that are filled while the block runs
+    """
+    engine = getattr(target, "engine", target)
+    previous, engine.stats = engine.stats, EngineStats()
+    try:
+        yield engine.stats
+    finally:
+        engine.stats = previous
@@ -0,0 +1,130 @@
+import codecs
+import mmap
+import os
+from typing import Hashable, Iterable, Union
+
+from automatapy.automata.compiled import CompiledDFA, CompiledNFA
+
+
+class Matcher:
+    """Resumable matcher that reads a word chunk by chunk"""
+
+    def __init__(self, automaton: Union[CompiledDFA, CompiledNFA]):
+        """
+        Creates a matcher in the initial configuration of the automaton
+
+        Parameters
+        ----------
+        automaton : Union[CompiledDFA, CompiledNFA]
+            Compiled automaton to be run
+        """
+        self.automaton = automaton
+        self.current = automaton.initial
+
+    def feed(self, chunk: Iterable[Hashable]) -> "Matcher":
+        """
+        Reads the next chunk of the word. Chunks are iterated over and never copied
+
+        Parameters
+        ----------
+        chunk : Iterable[Hashable]
+            Next part of the word
+
+        Returns
+        -------
+        Matcher
+            The matcher itself
+        """
+        if self.current != self.automaton.dead:
+            self.current = self.automaton.run(self.current, chunk)
+        return self
+
+    def is_accepting(self) -> bool:
+        """
+        Checks whether the word read so far is accepted
+
+        Returns
+        -------
+        bool
+            True if it is accepted, False otherwise
+        """
+        return self.automaton.is_final(self.current)
+
+    def is_dead(self) -> bool:
+        """
+        Checks whether no extension of the word read so far can be accepted anymore
+
+        Returns
+        -------
+        bool
+        """
+        return self.current == self.automaton.dead
+
+    def reset(self):
+        """
+        Resets the matcher to the initial configuration
+
+        Returns
+        -------
+
+        """
+        self.current = self.automaton.initial
+
+    def snapshot(self) -> int:
+        """
+        Returns the current configuration, i.e. a state of a compiled DFA or a state bitmask of a compiled NFA
+
+        Returns
+        -------
+        int
+            Configuration that can be passed to :meth:`restore`
+        """
+        return self.current
+
+    def restore(self, snapshot: int):
+        """
+        Restores a configuration previously returned by :meth:`snapshot`
+
+        Parameters
+        ----------
+        snapshot : int
+            Configuration
+
+        Returns
+        -------
+
+        """
+        self.current = snapshot
+
+    def match_file(self, path: Union[str, os.PathLike], chunk_size: int = 1 << 20, encoding: str = None) -> bool:
+        """
+        Memory-maps a file and streams its content through the automaton, starting from the current configuration.
+        Without an encoding the letters are the byte values of the file, with an encoding they are the decoded
+        characters
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            Path of the file
+        chunk_size : int
+            Number of bytes fed at once
+        encoding : str
+            Optional encoding used to decode the file
+
+        Returns
+        -------
+        bool
+            True if the word read so far is accepted, False otherwise
+        """
+        decoder = codecs.getincrementaldecoder(encoding)() if encoding is not None else None
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    for offset in range(0, len(view), chunk_size):
+                        if self.is_dead():
+                            break
+                        with view[offset:offset + chunk_size] as chunk:
+                            self.feed(chunk if decoder is None else decoder.decode(chunk))
+        if decoder is not None:
+            self.feed(decoder.decode(b"", final=True))
+        return self.is_accepting()
@@ -0,0 +1,143 @@
+import itertools
+import mmap
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from typing import Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+from automatapy.automata.compiled import CompiledDFA
+
+# Automaton of a worker process, attached to the shared memory block by _initialize
+_worker: Optional[Tuple[shared_memory.SharedMemory, CompiledDFA]] = None
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the block again with the resource tracker, which the workers share
+        # with the parent, so the block is still unregistered once by the parent
+        return shared_memory.SharedMemory(name=name)
+
+
+def _initialize(name: str, alphabet: Tuple[Hashable, ...], table_size: int, states: int, initial: int):
+    global _worker
+    block = _attach(name)
+    table = block.buf[:table_size].cast("i")
+    final = block.buf[table_size:table_size + states]
+    _worker = (block, CompiledDFA(alphabet, table, final, initial))
+
+
+def _match_records(records: List[Sequence[Hashable]]) -> List[bool]:
+    automaton = _worker[1]
+    return [automaton.accepts(record) for record in records]
+
+
+def _match_lines(path: str, start: int, end: int, encoding: Optional[str]) -> List[bool]:
+    automaton = _worker[1]
+    result = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        while start < end:
+            newline = mm.find(b"\n", start, end)
+            stop = newline if newline >= 0 else end
+            line = mm[start:stop]
+            result.append(automaton.accepts(line if encoding is None else line.decode(encoding)))
+            start = stop + 1
+    return result
+
+
+class ParallelMatcher:
+    """Process pool that matches a corpus against a compiled DFA whose tables live in shared memory"""
+
+    def __init__(self, automaton: CompiledDFA, processes: int = None, chunk_size: int = 4096):
+        """
+        Copies the transition table and the final-state table of the automaton into a shared memory block and starts
+        the worker processes, which attach to the block instead of receiving a copy of the automaton
+
+        Parameters
+        ----------
+        automaton : CompiledDFA
+            Compiled automaton
+        processes : int
+            Number of worker processes, if None the number of CPUs
+        chunk_size : int
+            Number of records sent to a worker at once
+        """
+        self.automaton = automaton
+        self.chunk_size = chunk_size
+        self.processes = processes if processes is not None else os.cpu_count()
+        table = memoryview(automaton.table).cast("B")
+        final = bytes(automaton.final)
+        self.block = shared_memory.SharedMemory(create=True, size=max(1, len(table) + len(final)))
+        self.block.buf[:len(table)] = table
+        self.block.buf[len(table):len(table) + len(final)] = final
+        self.pool = multiprocessing.Pool(self.processes, initializer=_initialize,
+                                         initargs=(self.block.name, automaton.alphabet, len(table), len(final),
+                                                   automaton.initial))
+
+    def map(self, records: Iterable[Sequence[Hashable]]) -> List[bool]:
+        """
+        Checks every record of a corpus. Records are read lazily in chunks, so the corpus can be an iterator
+
+        Parameters
+        ----------
+        records : Iterable[Sequence[Hashable]]
+            Records to be checked
+
+        Returns
+        -------
+        List[bool]
+            Whether the i-th record is accepted, in input order
+        """
+        records = iter(records)
+        chunks = iter(lambda: list(itertools.islice(records, self.chunk_size)), [])
+        return [accepted for chunk in self.pool.imap(_match_records, chunks) for accepted in chunk]
+
+    def match_file(self, path: Union[str, os.PathLike], encoding: Optional[str] = "utf-8") -> List[bool]:
+        """
+        Checks every line of a file, without the line break. The file is split into byte ranges at line breaks and each
+        worker memory-maps the file and reads its ranges itself
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            Path of the file
+        encoding : Optional[str]
+            Encoding of the lines, if None the letters are the byte values
+
+        Returns
+        -------
+        List[bool]
+            Whether the i-th line is accepted, in file order
+        """
+        path = os.fspath(path)
+        size = os.path.getsize(path)
+        if size == 0:
+            return []
+        boundaries = [0]
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            step = max(1, size // (4 * self.processes))
+            while boundaries[-1] < size:
+                newline = mm.find(b"\n", min(boundaries[-1] + step, size) - 1)
+                boundaries.append(newline + 1 if newline >= 0 else size)
+        ranges = [(path, start, end, encoding) for start, end in zip(boundaries, boundaries[1:])]
+        return [accepted for chunk in self.pool.starmap(_match_lines, ranges) for accepted in chunk]
+
+    def close(self):
+        """
+        Stops the worker processes and releases the shared memory block
+
+        Returns
+        -------
+
+        """
+        self.pool.terminate()
+        self.pool.join()
+        self.block.close()
+        self.block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,253 @@
+from collections import deque
+from typing import Callable, Collection, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+from automatapy.automata.charclass import symbols
+from automatapy.automata.core import State, TransitionSystem
+
+Configuration = Tuple[FrozenSet[State], FrozenSet[State]]
+
+
+def _contains_final(ts: TransitionSystem, states: Collection[State]) -> bool:
+    return any(state in ts.final_states for state in states)
+
+
+class LazyProduct:
+    """Boolean combination of two automata whose product states are only explored on demand"""
+
+    def __init__(self, left: TransitionSystem, right: TransitionSystem, operation: Callable[[bool, bool], bool],
+                 alphabet: Iterable[Hashable] = None):
+        """
+        Creates the lazy product of two epsilon-free transition systems. A product state is a pair of sets of states,
+        one per operand, so nondeterministic operands are determinized on the fly and complements are exact
+
+        Parameters
+        ----------
+        left : TransitionSystem
+            Left operand
+        right : TransitionSystem
+            Right operand
+        operation : Callable[[bool, bool], bool]
+            Decides whether a product state is final from whether the left and right sets contain a final state
+        alphabet : Iterable[Hashable]
+            Alphabet explored by the emptiness check and by :meth:`to_transition_system`. If None, the union of the
+            alphabets of the operands is used
+        """
+        self.left = left
+        self.right = right
+        self.operation = operation
+        self.alphabet: Set[Hashable] = set(alphabet) if alphabet is not None else left.alphabet | right.alphabet
+        # Pairs (label, letter), character classes are split into minterms that are explored through one character
+        self.letters: List[Tuple[Hashable, Hashable]] = symbols(self.alphabet)
+        self.initial: Configuration = (frozenset(left.initial_states), frozenset(right.initial_states))
+        self.dead = None
+
+    def step(self, current: Configuration, letter: Hashable) -> Configuration:
+        """
+        Returns the successor of a product state for the given letter
+
+        Parameters
+        ----------
+        current : Configuration
+            Product state
+        letter : Hashable
+            Letter
+
+        Returns
+        -------
+        Configuration
+            Successor product state
+        """
+        return (frozenset(self.left.get_successor(current[0], letter)),
+                frozenset(self.right.get_successor(current[1], letter)))
+
+    def run(self, current: Configuration, word: Iterable[Hashable]) -> Configuration:
+        """
+        Reads a word starting in the given product state
+
+        Parameters
+        ----------
+        current : Configuration
+            Product state to start in
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        Configuration
+            Product state reached after reading the word
+        """
+        for letter in word:
+            current = self.step(current, letter)
+        return current
+
+    def is_final(self, current: Configuration) -> bool:
+        """
+        Checks whether the given product state is final
+
+        Parameters
+        ----------
+        current : Configuration
+            Product state
+
+        Returns
+        -------
+        bool
+        """
+        return self.operation(_contains_final(self.left, current[0]), _contains_final(self.right, current[1]))
+
+    def accepts(self, word: Iterable[Hashable]) -> bool:
+        """
+        Checks whether the product accepts the given word
+
+        Parameters
+        ----------
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        bool
+            True if it is accepted, False otherwise
+        """
+        return self.is_final(self.run(self.initial, word))
+
+    def find_word(self) -> Optional[List[Hashable]]:
+        """
+        Searches the reachable product states breadth-first for a final one
+
+        Returns
+        -------
+        Optional[List[Hashable]]
+            A shortest accepted word, None if the product accepts no word
+        """
+        parent: Dict[Configuration, Tuple[Configuration, Hashable]] = {self.initial: None}
+        queue = deque([self.initial])
+        while queue:
+            current = queue.popleft()
+            if self.is_final(current):
+                word = []
+                while parent[current] is not None:
+                    current, letter = parent[current]
+                    word.append(letter)
+                return word[::-1]
+            for _, letter in self.letters:
+                successor = self.step(current, letter)
+                if successor not in parent:
+                    parent[successor] = (current, letter)
+                    queue.append(successor)
+        return None
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the product accepts no word, exploring only reachable product states
+
+        Returns
+        -------
+        bool
+        """
+        return self.find_word() is None
+
+    def to_transition_system(self) -> TransitionSystem:
+        """
+        Materializes the reachable product states as a deterministic transition system over the alphabet
+
+        Returns
+        -------
+        TransitionSystem
+            Deterministic transition system
+        """
+        ts = TransitionSystem()
+        states = {self.initial: ts.add_state(initial=True, final=self.is_final(self.initial))}
+        worklist = [self.initial]
+        while worklist:
+            current = worklist.pop()
+            for label, letter in self.letters:
+                successor = self.step(current, letter)
+                if successor not in states:
+                    states[successor] = ts.add_state(final=self.is_final(successor))
+                    worklist.append(successor)
+                ts.add_transition(states[current], label, states[successor])
+        return ts
+
+
+def pair_product(left: TransitionSystem, right: TransitionSystem, operation: Callable[[bool, bool], bool],
+                 complete: bool = False) -> TransitionSystem:
+    """
+    Builds the reachable part of the product of two epsilon-free transition systems, whose states are pairs of states
+
+    Parameters
+    ----------
+    left : TransitionSystem
+        Left operand
+    right : TransitionSystem
+        Right operand
+    operation : Callable[[bool, bool], bool]
+        Decides whether a pair is final from whether its left and right states are final
+    complete : bool
+        If true, a missing successor on one side is represented by None, so the product continues as long as one side
+        can move. Otherwise both sides have to move
+
+    Returns
+    -------
+    TransitionSystem
+        Product transition system, deterministic if both operands are
+    """
+    ts = TransitionSystem()
+    missing = {None} if complete else set()
+    states: Dict[Tuple[Optional[State], Optional[State]], State] = dict()
+    worklist = []
+
+    def add(pair, initial=False) -> State:
+        if pair not in states:
+            p, q = pair
+            states[pair] = ts.add_state(initial=initial,
+                                        final=operation(p in left.final_states, q in right.final_states))
+            worklist.append(pair)
+        return states[pair]
+
+    for p in left.initial_states or missing:
+        for q in right.initial_states or missing:
+            if p is not None or q is not None:
+                add((p, q), initial=True)
+    # Character classes of the operands may overlap without being equal, so symbolic products move on minterms
+    symbolic = getattr(left, "symbolic", False) or getattr(right, "symbolic", False)
+    labeled = symbols(left.alphabet | right.alphabet) if symbolic else None
+    while worklist:
+        p, q = pair = worklist.pop()
+        if symbolic:
+            left_succ = {label: left.get_successor(p, letter) for label, letter in labeled} if p is not None else {}
+            right_succ = {label: right.get_successor(q, letter) for label, letter in labeled} if q is not None else {}
+        else:
+            left_succ = left.state_to_action_succ.get(p, dict()) if p is not None else dict()
+            right_succ = right.state_to_action_succ.get(q, dict()) if q is not None else dict()
+        letters = left_succ.keys() | right_succ.keys() if complete else left_succ.keys() & right_succ.keys()
+        for letter in letters:
+            for p1 in left_succ.get(letter) or missing:
+                for q1 in right_succ.get(letter) or missing:
+                    ts.add_transition(states[pair], letter, add((p1, q1)))
+    return ts
+
+
+def disjoint_union(left: TransitionSystem, right: TransitionSystem) -> TransitionSystem:
+    """
+    Builds the disjoint union of two transition systems
+
+    Parameters
+    ----------
+    left : TransitionSystem
+        Left operand
+    right : TransitionSystem
+        Right operand
+
+    Returns
+    -------
+    TransitionSystem
+        Transition system accepting the union of the languages of the operands
+    """
+    ts = TransitionSystem()
+    for operand in [left, right]:
+        states = {state: ts.add_state(initial=state in operand.initial_states, final=state in operand.final_states)
+                  for state in operand.states}
+        for t in operand.transitions:
+            ts.add_transition(states[t.source], t.letter, states[t.target])
+    return ts
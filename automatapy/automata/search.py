@@ -0,0 +1,251 @@
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from automatapy.automata.compiled import CompiledDFA
+from automatapy.automata.core import TransitionSystem
+from automatapy.automata.engine import NondeterministicEngine
+
+
+class Searcher:
+    """Finds leftmost-longest matches of an automaton in a text with a forward and a reverse DFA, it can be used from
+    several threads at once"""
+
+    def __init__(self, ts: TransitionSystem):
+        """
+        Creates a searcher for the language of an epsilon-free transition system. The forward DFA accepts the language,
+        the reverse DFA accepts the reversed words of the language preceded by arbitrary letters. Reading a text
+        backwards with the reverse DFA marks every position at which some match starts, so a search reads the text
+        once backwards and then forwards from the leftmost start. Searches, prefix matches and iterating over all
+        matches take linear time
+
+        Parameters
+        ----------
+        ts : TransitionSystem
+            Epsilon-free transition system
+        """
+        engine = NondeterministicEngine()
+        engine.set_transition_system(ts)
+        self.forward = CompiledDFA.from_transition_system(engine.determinize())
+        engine.set_transition_system(self._unanchored(engine.reverse()))
+        self.backward = CompiledDFA.from_transition_system(engine.determinize(ts.alphabet))
+        # States of the forward DFA from which a final state can still be reached
+        forward, size = self.forward, len(self.forward.final)
+        predecessors = [[] for _ in range(size)]
+        for q in range(size):
+            for a in range(forward.stride):
+                predecessors[forward.table[q * forward.stride + a]].append(q)
+        self.live = bytearray(forward.final)
+        worklist = [q for q in range(size) if forward.final[q]]
+        while worklist:
+            q = worklist.pop()
+            for p in predecessors[q]:
+                if not self.live[p]:
+                    self.live[p] = 1
+                    worklist.append(p)
+
+    @staticmethod
+    def _unanchored(ts: TransitionSystem) -> TransitionSystem:
+        # Adds an initial state that loops on every letter and can continue like the initial states
+        initial = list(ts.initial_states)
+        start = ts.add_state(final=any(state in ts.final_states for state in initial))
+        for letter in list(ts.alphabet):
+            ts.add_transition(start, letter, start)
+        for state in initial:
+            for letter, targets in list(ts.state_to_action_succ.get(state, dict()).items()):
+                for target in list(targets):
+                    ts.add_transition(start, letter, target)
+        ts.set_initial(start)
+        return ts
+
+    def starts(self, text: Sequence[Hashable], pos: int = 0, endpos: int = None) -> bytearray:
+        """
+        Marks the positions at which a match starts by reading the text backwards
+
+        Parameters
+        ----------
+        text : Sequence[Hashable]
+            Text
+        pos : int
+            Start of the searched part of the text
+        endpos : int
+            End of the searched part of the text. If None, the text is searched to its end
+
+        Returns
+        -------
+        bytearray
+            Table whose entry i - pos is 1 if a match in text[pos:endpos] starts at position i and 0 otherwise
+        """
+        endpos = len(text) if endpos is None else min(endpos, len(text))
+        backward = self.backward
+        table, stride, final, initial = backward.table, backward.stride, backward.final, backward.initial
+        letter_to_index = backward.letter_to_index
+        starts = bytearray(max(endpos - pos, 0) + 1)
+        state = initial
+        starts[-1] = final[state]
+        for i in range(endpos - 1, pos - 1, -1):
+            column = letter_to_index.get(text[i])
+            # Letters outside the alphabet can only be read by the looping initial state
+            state = initial if column is None else table[state * stride + column]
+            starts[i - pos] = final[state]
+        return starts
+
+    def longest(self, text: Sequence[Hashable], pos: int = 0, endpos: int = None) -> int:
+        """
+        Returns the end of the longest match starting at the given position
+
+        Parameters
+        ----------
+        text : Sequence[Hashable]
+            Text
+        pos : int
+            Start of the match
+        endpos : int
+            Position the match must not extend beyond. If None, the match may extend to the end of the text
+
+        Returns
+        -------
+        int
+            End of the longest match, or -1 if no match starts at pos
+        """
+        endpos = len(text) if endpos is None else min(endpos, len(text))
+        forward, live = self.forward, self.live
+        table, stride, final, letter_to_index = forward.table, forward.stride, forward.final, forward.letter_to_index
+        state = forward.initial
+        last = pos if final[state] else -1
+        for i in range(pos, endpos):
+            column = letter_to_index.get(text[i])
+            if column is None:
+                break
+            state = table[state * stride + column]
+            if not live[state]:
+                break
+            if final[state]:
+                last = i + 1
+        return last
+
+    def match_prefix(self, text: Sequence[Hashable], pos: int = 0, endpos: int = None) -> Optional[Tuple[int, int]]:
+        """
+        Returns the longest match that starts at the given position
+
+        Parameters
+        ----------
+        text : Sequence[Hashable]
+            Text
+        pos : int
+            Start of the match
+        endpos : int
+            Position the match must not extend beyond. If None, the match may extend to the end of the text
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            Span (start, end) of the match, or None if there is no match
+        """
+        end = self.longest(text, pos, endpos)
+        return (pos, end) if end >= 0 else None
+
+    def search(self, text: Sequence[Hashable], pos: int = 0, endpos: int = None) -> Optional[Tuple[int, int]]:
+        """
+        Returns the leftmost-longest match in the text, i.e. the longest of the matches that start first
+
+        Parameters
+        ----------
+        text : Sequence[Hashable]
+            Text
+        pos : int
+            Start of the searched part of the text
+        endpos : int
+            End of the searched part of the text. If None, the text is searched to its end
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            Span (start, end) of the match, or None if there is no match
+        """
+        start = self.starts(text, pos, endpos).find(1)
+        if start < 0:
+            return None
+        return pos + start, self.longest(text, pos + start, endpos)
+
+    def finditer(self, text: Sequence[Hashable], pos: int = 0, endpos: int = None) -> Iterator[Tuple[int, int]]:
+        """
+        Iterates over the non-overlapping leftmost-longest matches in the text. The text is read backwards once, every
+        match is then extended forwards from its start. After an empty match the search continues one position later.
+        A forward scan may read beyond the end of its match, so the scans remember the end they found for every pair of
+        position and state, and a later scan stops as soon as it reaches a pair an earlier scan has visited. Every pair
+        is thus read at most once and, for a fixed automaton, the running time is linear in the length of the text
+
+        Parameters
+        ----------
+        text : Sequence[Hashable]
+            Text
+        pos : int
+            Start of the searched part of the text
+        endpos : int
+            End of the searched part of the text. If None, the text is searched to its end
+
+        Returns
+        -------
+        Iterator[Tuple[int, int]]
+            Spans (start, end) of the matches from left to right
+        """
+        endpos = len(text) if endpos is None else min(endpos, len(text))
+        starts = self.starts(text, pos, endpos)
+        size = len(self.forward.final)
+        memo: Dict[int, int] = dict()
+        previous: Tuple[List[int], int] = None
+        horizon = -1
+        start = starts.find(1)
+        while start >= 0:
+            if pos + start > horizon:
+                # The scan starts beyond every position read so far, it cannot meet an earlier scan
+                memo.clear()
+            elif previous is not None:
+                self._remember(memo, *previous)
+            path, end, tail = self._scan(text, pos + start, endpos, memo)
+            previous = (path, tail)
+            if path:
+                horizon = max(horizon, path[-1] // size)
+            yield pos + start, end
+            following = end - pos if end > pos + start else start + 1
+            start = starts.find(1, following)
+
+    def _scan(self, text: Sequence[Hashable], pos: int, endpos: int,
+              memo: Dict[int, int]) -> Tuple[List[int], int, int]:
+        # Reads forwards from pos until no match can be extended or a pair of position and state recorded in memo is
+        # reached. Returns the keys position * states + state of the pairs read, the end of the longest match and the
+        # end recorded for the pair the scan stopped at, or -1
+        forward, live = self.forward, self.live
+        table, stride, final, letter_to_index = forward.table, forward.stride, forward.final, forward.letter_to_index
+        size = len(final)
+        lookup = memo.get if memo else None
+        state, i, last = forward.initial, pos, -1
+        path: List[int] = []
+        while True:
+            key = i * size + state
+            if lookup is not None:
+                known = lookup(key)
+                if known is not None:
+                    return path, known if known >= 0 else last, known
+            path.append(key)
+            if final[state]:
+                last = i
+            if i >= endpos:
+                break
+            column = letter_to_index.get(text[i])
+            if column is None:
+                break
+            state = table[state * stride + column]
+            if not live[state]:
+                break
+            i += 1
+        return path, last, -1
+
+    def _remember(self, memo: Dict[int, int], path: List[int], tail: int):
+        # Records for every pair on the path of a scan the end of the longest match that continues from it. Ends found
+        # later are larger, so it is the last end at or after the pair
+        final, size = self.forward.final, len(self.forward.final)
+        best = tail
+        for key in reversed(path):
+            if best < 0 and final[key % size]:
+                best = key // size
+            memo[key] = best
@@ -0,0 +1,195 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Hashable, List, Sequence, Tuple, Union
+
+from automatapy.automata.charclass import CharClass
+from automatapy.automata.compact import CompactTransitionSystem
+from automatapy.automata.compiled import CompiledDFA, CompiledNFA
+from automatapy.automata.core import TransitionSystem, Epsilon
+
+MAGIC = b"ATPY"
+VERSION = 1
+KIND_DFA, KIND_NFA = 0, 1
+# Magic, version, kind, number of states, number of letters, number of transitions, number of initial states and
+# size of the alphabet table in bytes
+HEADER = struct.Struct("<4sHH5Q")
+LETTER_STR, LETTER_INT, LETTER_BYTES, LETTER_CLASS = 0, 1, 2, 3
+LETTER = struct.Struct("<BQ")
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _encode_alphabet(alphabet: Sequence[Hashable]) -> bytes:
+    chunks = []
+    for letter in alphabet:
+        if isinstance(letter, str):
+            tag, payload = LETTER_STR, letter.encode("utf-8")
+        elif isinstance(letter, bytes):
+            tag, payload = LETTER_BYTES, letter
+        elif isinstance(letter, int) and not isinstance(letter, bool):
+            tag, payload = LETTER_INT, str(letter).encode("ascii")
+        elif isinstance(letter, CharClass):
+            tag, payload = LETTER_CLASS, _little_endian(array("I", [code for interval in letter.intervals
+                                                                    for code in interval]))
+        else:
+            raise ValueError(f"Letter {letter!r} cannot be serialized, only str, bytes, int and character class "
+                             f"letters are supported")
+        chunks.append(LETTER.pack(tag, len(payload)) + payload)
+    return b"".join(chunks)
+
+
+def _decode_alphabet(buffer: memoryview, count: int) -> Tuple[Hashable, ...]:
+    letters: List[Hashable] = []
+    offset = 0
+    for _ in range(count):
+        tag, size = LETTER.unpack_from(buffer, offset)
+        payload = bytes(buffer[offset + LETTER.size:offset + LETTER.size + size])
+        offset += LETTER.size + size
+        if tag == LETTER_STR:
+            letters.append(payload.decode("utf-8"))
+        elif tag == LETTER_BYTES:
+            letters.append(payload)
+        elif tag == LETTER_CLASS:
+            codes = array("I", payload)
+            if sys.byteorder != "little":
+                codes.byteswap()
+            letters.append(CharClass(zip(codes[0::2], codes[1::2])))
+        else:
+            letters.append(int(payload))
+    return tuple(letters)
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _write(path: Union[str, os.PathLike], kind: int, states: int, alphabet: Sequence[Hashable], transitions: int,
+           initial: int, sections: List[bytes]):
+    table = _encode_alphabet(alphabet)
+    with open(path, "wb") as f:
+        for chunk in [HEADER.pack(MAGIC, VERSION, kind, states, len(alphabet), transitions, initial, len(table)),
+                      table] + sections:
+            f.write(chunk)
+            f.write(b"\0" * (_align(len(chunk)) - len(chunk)))
+
+
+def save_dfa(compiled: CompiledDFA, path: Union[str, os.PathLike]):
+    """
+    Writes a compiled DFA to a file. After the header and the alphabet table, the file contains the dense transition
+    table as 32-bit integers, the final-state table with one byte per state and the initial state
+
+    Parameters
+    ----------
+    compiled : CompiledDFA
+        Compiled automaton
+    path : Union[str, os.PathLike]
+        Path of the file
+
+    Returns
+    -------
+
+    """
+    table = array("i", compiled.table)
+    _write(path, KIND_DFA, len(compiled.final), compiled.alphabet, len(table), 1,
+           [_little_endian(table), bytes(compiled.final), _little_endian(array("i", [compiled.initial]))])
+
+
+def save_nfa(ts: TransitionSystem, path: Union[str, os.PathLike]):
+    """
+    Writes an epsilon-free transition system to a file. After the header and the alphabet table, the file contains the
+    CSR transition arrays (64-bit offsets, 32-bit letters and 32-bit targets), the initial states and the final-state
+    bitmap
+
+    Parameters
+    ----------
+    ts : TransitionSystem
+        Transition system without epsilon transitions
+    path : Union[str, os.PathLike]
+        Path of the file
+
+    Returns
+    -------
+
+    """
+    compact = ts if isinstance(ts, CompactTransitionSystem) else CompactTransitionSystem.from_transition_system(ts)
+    if Epsilon() in compact.label_to_index:
+        raise ValueError("Transition system contains epsilon transitions")
+    states = len(compact.offsets) - 1
+    initial = array("i", sorted(compact.initial_states.ids))
+    final = bytearray((states + 7) // 8)
+    for i in compact.final_states.ids:
+        final[i >> 3] |= 1 << (i & 7)
+    _write(path, KIND_NFA, states, compact.labels, len(compact.targets), len(initial),
+           [_little_endian(array("q", compact.offsets)), _little_endian(array("i", compact.letters)),
+            _little_endian(array("i", compact.targets)), _little_endian(initial),
+            bytes(final)])
+
+
+def load(path: Union[str, os.PathLike]) -> Union[CompiledDFA, CompiledNFA]:
+    """
+    Loads an automaton written by :func:`save_dfa` or :func:`save_nfa`. A DFA is memory-mapped and matched directly on
+    the mapped transition table, so its pages are shared between processes loading the same file. An NFA is turned into
+    successor bitmasks straight from the mapped CSR arrays
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        Path of the file
+
+    Returns
+    -------
+    Union[CompiledDFA, CompiledNFA]
+        Compiled automaton
+
+    Raises
+    ------
+    ValueError
+        If the file is not a serialized automaton or has an unsupported version
+    """
+    with open(path, "rb") as f:
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"{path} is not a serialized automaton")
+    magic, version, kind, states, letters, transitions, initial, table_size = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a serialized automaton")
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported version {version}")
+    offset = _align(HEADER.size)
+    alphabet = _decode_alphabet(buffer[offset:offset + table_size], letters)
+    offset += _align(table_size)
+
+    def section(size: int, typecode: str):
+        nonlocal offset
+        values = buffer[offset:offset + size * array(typecode).itemsize]
+        offset += _align(len(values))
+        if sys.byteorder != "little":
+            values = array(typecode, values.tobytes())
+            values.byteswap()
+            return values
+        return values.cast(typecode)
+
+    if kind == KIND_DFA:
+        table = section(transitions, "i")
+        final = section(states, "B")
+        return CompiledDFA(alphabet, table, final, section(1, "i")[0])
+    offsets = section(states + 1, "q")
+    letter_indices, targets = section(transitions, "i"), section(transitions, "i")
+    initial_states = section(initial, "i")
+    final = int.from_bytes(buffer[offset:offset + (states + 7) // 8], "little")
+    successors = [[0] * states for _ in alphabet]
+    for source in range(states):
+        for i in range(offsets[source], offsets[source + 1]):
+            successors[letter_indices[i]][source] |= 1 << targets[i]
+    initial_mask = 0
+    for state in initial_states:
+        initial_mask |= 1 << state
+    return CompiledNFA(alphabet, tuple(tuple(column) for column in successors), final, initial_mask)
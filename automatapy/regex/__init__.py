@@ -3,8 +3,17 @@ from abc import abstractmethod
 
 from typing import Any
 
+from automatapy.automata.charclass import CharClass
+from automatapy.utils import HashConsMetaclass
 
-class Regex:
+
+class Regex(metaclass=HashConsMetaclass):
+    """
+    Immutable regular expression. Nodes are hash-consed, i.e. structurally equal expressions are the same object, so
+    equality and hashing take constant time
+    """
+
+    __slots__ = ("_args", "_kwargs", "__weakref__")
 
     @abstractmethod
     def accept(self, regex_visitor: RegexVisitor):
@@ -14,12 +23,59 @@ class Regex:
     def __str__(self):
         pass
 
+    def __setattr__(self, name, value):
+        # The metaclass sets _args once the node is initialized, afterwards the node is shared and must not change
+        if hasattr(self, "_args"):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return id(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return _intern, (type(self), self._args, self._kwargs)
+
+
+def _intern(cls, args, kwargs):
+    return cls(*args, **kwargs)
+
 
 class Letter(Regex):
 
+    __slots__ = ("letter",)
+
     def __init__(self, letter):
         self.letter = letter
 
+    @classmethod
+    def char_class(cls, spec: str) -> Letter:
+        """
+        Returns the letter matching every character of a class, e.g. ``Letter.char_class("a-z0-9_")``
+
+        Parameters
+        ----------
+        spec : str
+            Class specification, see :meth:`CharClass.parse`
+
+        Returns
+        -------
+        Letter
+            Letter labeled with the character class
+        """
+        return cls(CharClass.parse(spec))
+
     def accept(self, regex_visitor: RegexVisitor):
         return regex_visitor.visit_letter(self)
 
@@ -29,6 +85,8 @@ class Letter(Regex):
 
 class Alternation(Regex):
 
+    __slots__ = ("r1", "r2")
+
     def __init__(self, r1: Regex, r2: Regex):
         self.r1 = r1
         self.r2 = r2
@@ -42,6 +100,8 @@ class Alternation(Regex):
 
 class KleeneStar(Regex):
 
+    __slots__ = ("r",)
+
     def __init__(self, r: Regex):
         self.r = r
 
@@ -54,6 +114,8 @@ class KleeneStar(Regex):
 
 class Concatenation(Regex):
 
+    __slots__ = ("r1", "r2")
+
     def __init__(self, r1: Regex, r2: Regex):
         self.r1 = r1
         self.r2 = r2
@@ -0,0 +1,113 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+from automatapy.automata import EpsilonNFA, NFA, DFA
+from automatapy.automata.automata import FiniteAutomaton
+from automatapy.regex import Regex
+from automatapy.regex.glushkov_converter import GlushkovConverter
+from automatapy.regex.regex_converter import RegexConverter
+
+
+class CompileCache:
+    """Size-aware LRU cache of automata compiled from regular expressions"""
+
+    def __init__(self, max_size: int = 1 << 20):
+        """
+        Creates an empty cache. Regular expressions are hash-consed, so structurally equal expressions share their
+        entries. The size of an automaton is its number of states plus its number of transitions
+
+        Parameters
+        ----------
+        max_size : int
+            Maximal total size of the cached automata, automata larger than this are not cached
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.entries: OrderedDict[Tuple[str, Regex], Tuple[FiniteAutomaton, int]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _get(self, kind: str, regex: Regex, compile_regex: Callable[[Regex], FiniteAutomaton]) -> FiniteAutomaton:
+        key = (kind, regex)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        automaton = compile_regex(regex)
+        size = len(automaton.get_states()) + len(automaton.get_transitions())
+        if size <= self.max_size:
+            with self.lock:
+                if key not in self.entries:
+                    self.entries[key] = (automaton, size)
+                    self.size += size
+                    while self.size > self.max_size:
+                        _, (_, evicted) = self.entries.popitem(last=False)
+                        self.size -= evicted
+        return automaton
+
+    def epsilon_nfa(self, regex: Regex) -> EpsilonNFA:
+        """
+        Returns the Thompson epsilon NFA of the regular expression. The returned automaton is shared and must not be
+        modified
+
+        Parameters
+        ----------
+        regex : Regex
+            Regular expression
+
+        Returns
+        -------
+        EpsilonNFA
+            Epsilon nondeterministic finite automaton
+        """
+        return self._get("epsilon_nfa", regex, lambda r: RegexConverter().convert(r))
+
+    def nfa(self, regex: Regex) -> NFA:
+        """
+        Returns the position automaton of the regular expression. The returned automaton is shared and must not be
+        modified
+
+        Parameters
+        ----------
+        regex : Regex
+            Regular expression
+
+        Returns
+        -------
+        NFA
+            Nondeterministic finite automaton
+        """
+        return self._get("nfa", regex, lambda r: GlushkovConverter().convert(r))
+
+    def dfa(self, regex: Regex) -> DFA:
+        """
+        Returns the minimal DFA of the regular expression. The returned automaton is shared and must not be modified
+
+        Parameters
+        ----------
+        regex : Regex
+            Regular expression
+
+        Returns
+        -------
+        DFA
+            Minimal deterministic finite automaton
+        """
+        return self._get("dfa", regex, lambda r: self.nfa(r).determinize().minimize()[0])
+
+    def clear(self):
+        """
+        Removes all entries from the cache
+
+        Returns
+        -------
+
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
@@ -0,0 +1,221 @@
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Tuple
+
+from automatapy.automata import DFA
+from automatapy.automata.charclass import CharClass, symbols
+from automatapy.regex import RegexVisitor, Alternation, KleeneStar, Regex, Letter, Concatenation
+
+EMPTY, EPSILON, LETTER, CONCATENATION, ALTERNATION, STAR = range(6)
+
+
+class DerivativeMatcher(RegexVisitor):
+    """Matches words against a regular expression with memoized Brzozowski derivatives"""
+
+    def __init__(self, regex: Regex):
+        """
+        Creates a matcher for the given regular expression. Expressions are normalized by smart constructors and
+        hash-consed into integer ids, every derivative is computed at most once. The derivatives reached while matching
+        are the states of a lazily built DFA
+
+        Parameters
+        ----------
+        regex : Regex
+            Regular expression
+        """
+        self.nodes: List[Tuple] = []
+        self.node_to_id: Dict[Tuple, int] = dict()
+        self.nullable: List[bool] = []
+        self.derivatives: Dict[Tuple[int, Hashable], int] = dict()
+        self.empty = self._node((EMPTY,), False)
+        self.epsilon = self._node((EPSILON,), True)
+        self.dead = self.empty
+        self.initial = regex.accept(self)
+
+    def _node(self, node: Tuple, nullable: bool) -> int:
+        node_id = self.node_to_id.get(node)
+        if node_id is None:
+            node_id = self.node_to_id[node] = len(self.nodes)
+            self.nodes.append(node)
+            self.nullable.append(nullable)
+        return node_id
+
+    def letter(self, letter: Hashable) -> int:
+        """Returns the id of the expression matching the given letter"""
+        return self._node((LETTER, letter), False)
+
+    def concatenation(self, r1: int, r2: int) -> int:
+        """Returns the id of the concatenation, simplified with the neutral and absorbing elements"""
+        if r1 == self.empty or r2 == self.empty:
+            return self.empty
+        if r1 == self.epsilon:
+            return r2
+        if r2 == self.epsilon:
+            return r1
+        node = self.nodes[r1]
+        if node[0] == CONCATENATION:
+            # Associate to the right so that equal suffixes share their ids
+            return self.concatenation(node[1], self.concatenation(node[2], r2))
+        return self._node((CONCATENATION, r1, r2), self.nullable[r1] and self.nullable[r2])
+
+    def alternation(self, regexes: Iterable[int]) -> int:
+        """Returns the id of the alternation, normalized with associativity, commutativity and idempotence"""
+        # Flatten nested alternations into a set without the empty set
+        alternatives = set()
+        for r in regexes:
+            node = self.nodes[r]
+            if node[0] == ALTERNATION:
+                alternatives.update(node[1])
+            elif r != self.empty:
+                alternatives.add(r)
+        if not alternatives:
+            return self.empty
+        if len(alternatives) == 1:
+            return alternatives.pop()
+        alternatives = frozenset(alternatives)
+        return self._node((ALTERNATION, alternatives), any(self.nullable[r] for r in alternatives))
+
+    def star(self, r: int) -> int:
+        """Returns the id of the Kleene star, simplified for the empty set, the empty word and nested stars"""
+        if r == self.empty or r == self.epsilon:
+            return self.epsilon
+        if self.nodes[r][0] == STAR:
+            return r
+        return self._node((STAR, r), True)
+
+    def derivative(self, r: int, letter: Hashable) -> int:
+        """
+        Returns the derivative of an expression with respect to a letter
+
+        Parameters
+        ----------
+        r : int
+            Id of the expression
+        letter : Hashable
+            Letter
+
+        Returns
+        -------
+        int
+            Id of the derivative
+        """
+        key = (r, letter)
+        derivative = self.derivatives.get(key)
+        if derivative is not None:
+            return derivative
+        node = self.nodes[r]
+        kind = node[0]
+        if kind == EMPTY or kind == EPSILON:
+            derivative = self.empty
+        elif kind == LETTER:
+            matches = node[1] == letter or isinstance(node[1], CharClass) and letter in node[1]
+            derivative = self.epsilon if matches else self.empty
+        elif kind == CONCATENATION:
+            derivative = self.concatenation(self.derivative(node[1], letter), node[2])
+            if self.nullable[node[1]]:
+                derivative = self.alternation((derivative, self.derivative(node[2], letter)))
+        elif kind == ALTERNATION:
+            derivative = self.alternation([self.derivative(s, letter) for s in node[1]])
+        else:
+            derivative = self.concatenation(self.derivative(node[1], letter), r)
+        self.derivatives[key] = derivative
+        return derivative
+
+    def letters(self) -> FrozenSet[Hashable]:
+        """
+        Returns the letters occurring in the expressions built so far
+
+        Returns
+        -------
+        FrozenSet[Hashable]
+        """
+        return frozenset(node[1] for node in self.nodes if node[0] == LETTER)
+
+    def run(self, current: int, word: Iterable[Hashable]) -> int:
+        """
+        Reads a word starting in the given expression
+
+        Parameters
+        ----------
+        current : int
+            Id of the expression to start in
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        int
+            Id of the derivative of the expression with respect to the word
+        """
+        derivatives, empty = self.derivatives, self.empty
+        for letter in word:
+            following = derivatives.get((current, letter))
+            current = following if following is not None else self.derivative(current, letter)
+            if current == empty:
+                return empty
+        return current
+
+    def is_final(self, current: int) -> bool:
+        """
+        Checks whether the given expression accepts the empty word
+
+        Parameters
+        ----------
+        current : int
+            Id of the expression
+
+        Returns
+        -------
+        bool
+        """
+        return self.nullable[current]
+
+    def accepts(self, word: Iterable[Hashable]) -> bool:
+        """
+        Checks whether the regular expression matches the given word
+
+        Parameters
+        ----------
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        bool
+            True if it is matched, False otherwise
+        """
+        return self.nullable[self.run(self.initial, word)]
+
+    def to_dfa(self) -> DFA:
+        """
+        Builds the DFA of all derivatives reachable from the expression over the letters occurring in it. Character
+        classes are split into minterms, each minterm is explored through one of its characters
+
+        Returns
+        -------
+        DFA
+            Deterministic finite automaton whose states are the reachable derivatives
+        """
+        alphabet = symbols(self.letters())
+        dfa = DFA()
+        states = {self.initial: dfa.add_state(initial=True, final=self.nullable[self.initial])}
+        worklist = [self.initial]
+        while worklist:
+            r = worklist.pop()
+            for label, letter in alphabet:
+                derivative = self.derivative(r, letter)
+                if derivative not in states:
+                    states[derivative] = dfa.add_state(final=self.nullable[derivative])
+                    worklist.append(derivative)
+                dfa.add_transition(states[r], label, states[derivative])
+        return dfa
+
+    def visit_letter(self, regex: Letter) -> int:
+        return self.letter(regex.letter)
+
+    def visit_concatenation(self, regex: Concatenation) -> int:
+        return self.concatenation(regex.r1.accept(self), regex.r2.accept(self))
+
+    def visit_kleenestar(self, regex: KleeneStar) -> int:
+        return self.star(regex.r.accept(self))
+
+    def visit_alternation(self, regex: Alternation) -> int:
+        return self.alternation((regex.r1.accept(self), regex.r2.accept(self)))
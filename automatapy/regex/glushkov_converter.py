@@ -0,0 +1,68 @@
+from typing import Hashable, List, Set, Tuple
+
+from automatapy.automata import NFA
+from automatapy.regex import RegexVisitor, Alternation, KleeneStar, Regex, Letter, Concatenation
+
+# Nullability, first positions and last positions of a subexpression
+Fragment = Tuple[bool, Set[int], Set[int]]
+
+
+class GlushkovConverter(RegexVisitor):
+    """Converts a regular expression into an epsilon-free NFA with the Glushkov (position automaton) construction"""
+
+    def __init__(self):
+        self.letters: List[Hashable] = []
+        self.follow: List[Set[int]] = []
+
+    def convert(self, regex: Regex) -> NFA:
+        """
+        Converts the regular expression into its position automaton. The automaton has one state per letter occurrence
+        in the expression plus an initial state
+
+        Parameters
+        ----------
+        regex : Regex
+            Regular expression
+
+        Returns
+        -------
+        NFA
+            Nondeterministic finite automaton without epsilon transitions
+        """
+        self.letters, self.follow = [], []
+        nullable, first, last = regex.accept(self)
+        nfa = NFA()
+        initial = nfa.add_state(initial=True, final=nullable)
+        positions = [nfa.add_state(final=p in last) for p in range(len(self.letters))]
+        for p in first:
+            nfa.add_transition(initial, self.letters[p], positions[p])
+        for p, follow in enumerate(self.follow):
+            for r in follow:
+                nfa.add_transition(positions[p], self.letters[r], positions[r])
+        return nfa
+
+    def visit_letter(self, regex: Letter) -> Fragment:
+        position = len(self.letters)
+        self.letters.append(regex.letter)
+        self.follow.append(set())
+        return False, {position}, {position}
+
+    def visit_concatenation(self, regex: Concatenation) -> Fragment:
+        nullable1, first1, last1 = regex.r1.accept(self)
+        nullable2, first2, last2 = regex.r2.accept(self)
+        for p in last1:
+            self.follow[p].update(first2)
+        first = first1 | first2 if nullable1 else first1
+        last = last1 | last2 if nullable2 else last2
+        return nullable1 and nullable2, first, last
+
+    def visit_kleenestar(self, regex: KleeneStar) -> Fragment:
+        _, first, last = regex.r.accept(self)
+        for p in last:
+            self.follow[p].update(first)
+        return True, first, last
+
+    def visit_alternation(self, regex: Alternation) -> Fragment:
+        nullable1, first1, last1 = regex.r1.accept(self)
+        nullable2, first2, last2 = regex.r2.accept(self)
+        return nullable1 or nullable2, first1 | first2, last1 | last2
@@ -0,0 +1,87 @@
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Sequence, Tuple
+
+from automatapy.automata import NFA, CompiledDFA
+from automatapy.automata.core import State
+from automatapy.regex import Regex
+from automatapy.regex.glushkov_converter import GlushkovConverter
+
+
+class PatternSet:
+    """Single automaton that matches a word against many regular expressions at once"""
+
+    def __init__(self, regexes: Sequence[Regex], minimize: bool = True):
+        """
+        Compiles the regular expressions into one combined DFA. Every final state is tagged with the ids of the
+        patterns it accepts, the id of a pattern is its position in ``regexes``. Determinization and minimization keep
+        states with different tags apart
+
+        Parameters
+        ----------
+        regexes : Sequence[Regex]
+            Regular expressions
+        minimize : bool
+            Determines whether the combined DFA is minimized
+        """
+        self.regexes = tuple(regexes)
+        self.nfa, nfa_tags = self._combine()
+        dfa, subsets = self.nfa.subset_construction()
+        tags: Dict[State, FrozenSet[int]] = dict()
+        for state, subset in subsets.items():
+            tags[state] = frozenset(pattern for q in subset for pattern in nfa_tags.get(q, ()))
+        if minimize:
+            dfa, mapping = dfa.minimize(partition_key=tags.get)
+            tags = {mapping[state]: tag for state, tag in tags.items() if state in mapping}
+        self.dfa = dfa
+        self.compiled: CompiledDFA = dfa.compile()
+        self.tags: Tuple[FrozenSet[int], ...] = tuple(tags[state] for state in self.compiled.states) + (frozenset(),)
+
+    def _combine(self) -> Tuple[NFA, Dict[State, FrozenSet[int]]]:
+        # Disjoint union of the position automata, final states are tagged with their pattern
+        nfa = NFA()
+        nfa_tags: Dict[State, FrozenSet[int]] = dict()
+        for pattern, regex in enumerate(self.regexes):
+            part = GlushkovConverter().convert(regex)
+            states = dict()
+            for state in part.get_states():
+                states[state] = nfa.add_state(initial=state in part.get_initial_states(),
+                                              final=state in part.get_final_states())
+                if state in part.get_final_states():
+                    nfa_tags[states[state]] = frozenset([pattern])
+            for t in part.get_transitions():
+                nfa.add_transition(states[t.source], t.letter, states[t.target])
+        return nfa, nfa_tags
+
+    def match(self, word: Iterable[Hashable]) -> FrozenSet[int]:
+        """
+        Returns the ids of all patterns that match the given word
+
+        Parameters
+        ----------
+        word : Iterable[Hashable]
+            Word
+
+        Returns
+        -------
+        FrozenSet[int]
+            Ids of the matching patterns
+        """
+        return self.tags[self.compiled.run(self.compiled.initial, word)]
+
+    def match_many(self, words: Iterable[Iterable[Hashable]]) -> List[FrozenSet[int]]:
+        """
+        Returns the ids of the matching patterns for every word
+
+        Parameters
+        ----------
+        words : Iterable[Iterable[Hashable]]
+            Words
+
+        Returns
+        -------
+        List[FrozenSet[int]]
+            Ids of the matching patterns per word
+        """
+        return [self.match(word) for word in words]
+
+    def __len__(self):
+        return len(self.regexes)
@@ -1,57 +1,87 @@
-from typing import Any
+from typing import List, Tuple
 
 from automatapy.automata import EpsilonNFA, Epsilon
-from regex import RegexVisitor, Alternation, KleeneStar, Regex, Letter, Concatenation
+from automatapy.automata.core import State
+from automatapy.regex import RegexVisitor, Alternation, KleeneStar, Regex, Letter, Concatenation
+
+# Start and end state of the automaton of a subexpression
+Fragment = Tuple[State, State]
 
 
 class RegexConverter(RegexVisitor):
+    """Converts a regular expression into an epsilon NFA with the Thompson construction"""
 
-    def visit_letter(self, regex: Letter) -> EpsilonNFA:
+    def convert(self, regex: Regex) -> EpsilonNFA:
+        """
+        Converts the regular expression into an epsilon NFA with the Thompson construction and trims the result. The
+        expression is traversed in post-order with an explicit stack and the fragments of all subexpressions are added
+        to a single transition system, so the construction takes linear time and works for arbitrarily deep
+        expressions
+
+        Parameters
+        ----------
+        regex : Regex
+            Regular expression
+
+        Returns
+        -------
+        EpsilonNFA
+            Epsilon nondeterministic finite automaton
+        """
         nfa = EpsilonNFA()
-        q1, q2 = nfa.add_state(initial=True), nfa.add_state(final=True)
-        nfa.add_transition(q1, regex.letter, q2)
+        ts, epsilon = nfa.ts, Epsilon()
+        fragments: List[Fragment] = []
+        stack: List[Tuple[Regex, bool]] = [(regex, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if isinstance(node, Letter):
+                start, end = ts.add_state(), ts.add_state()
+                ts.add_transition(start, node.letter, end)
+            elif not expanded:
+                # Revisit the node once the fragments of its operands are on the fragment stack
+                stack.append((node, True))
+                if isinstance(node, KleeneStar):
+                    stack.append((node.r, False))
+                elif isinstance(node, (Concatenation, Alternation)):
+                    stack.append((node.r2, False))
+                    stack.append((node.r1, False))
+                else:
+                    raise ValueError(f"Unsupported regular expression {node}")
+                continue
+            elif isinstance(node, Concatenation):
+                (start, middle), (following, end) = fragments[-2], fragments[-1]
+                del fragments[-2:]
+                ts.add_transition(middle, epsilon, following)
+            elif isinstance(node, Alternation):
+                (start1, end1), (start2, end2) = fragments[-2], fragments[-1]
+                del fragments[-2:]
+                start, end = ts.add_state(), ts.add_state()
+                ts.add_transition(start, epsilon, start1)
+                ts.add_transition(start, epsilon, start2)
+                ts.add_transition(end1, epsilon, end)
+                ts.add_transition(end2, epsilon, end)
+            else:
+                inner_start, inner_end = fragments.pop()
+                start, end = ts.add_state(), ts.add_state()
+                ts.add_transition(start, epsilon, inner_start)
+                ts.add_transition(inner_end, epsilon, end)
+                ts.add_transition(end, epsilon, start)
+                ts.add_transition(start, epsilon, end)
+            fragments.append((start, end))
+        start, end = fragments.pop()
+        ts.set_initial(start)
+        ts.set_final(end)
+        nfa.trim()
         return nfa
 
+    def visit_letter(self, regex: Letter) -> EpsilonNFA:
+        return self.convert(regex)
+
     def visit_concatenation(self, regex: Concatenation) -> EpsilonNFA:
-        nfa1: EpsilonNFA = regex.r1.accept(self)
-        nfa2: EpsilonNFA = regex.r2.accept(self)
-        nfa1.ts.states = nfa1.ts.states.union(nfa2.ts.states)
-        for s1 in nfa1.get_final_states():
-            for s2 in nfa2.get_initial_states():
-                nfa1.add_transition(s1, Epsilon(), s2)
-        nfa1.ts.final_states = nfa2.ts.final_states
-        for t in nfa2.get_transitions():
-            nfa1.add_transition(t.source, t.letter, t.target)
-        return nfa1
+        return self.convert(regex)
 
     def visit_kleenestar(self, regex: KleeneStar) -> EpsilonNFA:
-        nfa: EpsilonNFA = regex.r.accept(self)
-        q_init, q_final = nfa.add_state(), nfa.add_state()
-        for q in nfa.get_initial_states():
-            nfa.add_transition(q_init, Epsilon(), q)
-        for q in nfa.get_final_states():
-            nfa.add_transition(q, Epsilon(), q_final)
-        nfa.ts.initial_states = set([q_init])
-        nfa.ts.final_states = set([q_final])
-        nfa.add_transition(q_final, Epsilon(), q_init)
-        nfa.add_transition(q_init, Epsilon(), q_final)
-        return nfa
+        return self.convert(regex)
 
     def visit_alternation(self, regex: Alternation) -> EpsilonNFA:
-        nfa1: EpsilonNFA = regex.r1.accept(self)
-        nfa2: EpsilonNFA = regex.r2.accept(self)
-        nfa1.ts.states = nfa1.ts.states.union(nfa2.ts.states)
-        for t in nfa2.get_transitions():
-            nfa1.add_transition(t.source, t.letter, t.target)
-        q_init, q_final = nfa1.add_state(), nfa1.add_state()
-        for q in nfa1.get_initial_states():
-            nfa1.add_transition(q_init, Epsilon(), q)
-        for q in nfa2.get_initial_states():
-            nfa1.add_transition(q_init, Epsilon(), q)
-        for q in nfa1.get_final_states():
-            nfa1.add_transition(q, Epsilon(), q_final)
-        for q in nfa2.get_final_states():
-            nfa1.add_transition(q, Epsilon(), q_final)
-        nfa1.ts.initial_states = set([q_init])
-        nfa1.ts.final_states = set([q_final])
-        return nfa1
+        return self.convert(regex)
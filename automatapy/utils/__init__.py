@@ -1,4 +1,7 @@
 import abc
+import inspect
+import threading
+import weakref
 
 
 class SingletonMetaclass(abc.ABCMeta):
@@ -11,3 +14,32 @@ class SingletonMetaclass(abc.ABCMeta):
         if cls.obj is None:
             cls.obj = super().__call__(*args, **kwargs)
         return cls.obj
+
+
+class HashConsMetaclass(abc.ABCMeta):
+    """
+    Metaclass that interns instances, creating an instance with equal arguments returns the existing object. The
+    arguments are bound to the signature of ``__init__`` first, so positional, keyword and default arguments give the
+    same object. ``_args`` and ``_kwargs`` of an instance are set once it is initialized
+    """
+
+    def __init__(cls, name, bases, attrs, **kwargs):
+        super().__init__(name, bases, attrs)
+        cls.instances = weakref.WeakValueDictionary()
+        cls.lock = threading.Lock()
+        cls.signature = inspect.signature(cls.__init__)
+
+    def __call__(cls, *args, **kwargs):
+        bound = cls.signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        args, kwargs = bound.args[1:], bound.kwargs
+        # Arguments are keyed together with their type so that e.g. 1 and True are kept apart
+        key = tuple((type(arg), arg) for arg in args) + tuple((k, type(v), v) for k, v in sorted(kwargs.items()))
+        with cls.lock:
+            obj = cls.instances.get(key)
+            if obj is None:
+                obj = super().__call__(*args, **kwargs)
+                object.__setattr__(obj, "_args", args)
+                object.__setattr__(obj, "_kwargs", kwargs)
+                cls.instances[key] = obj
+        return obj
@@ -0,0 +1,84 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.workloads import BENCHMARKS
+
+
+def measure(name: str, size: int, repeat: int) -> Dict:
+    run = BENCHMARKS[name].setup(size)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return {"name": name, "size": size, "repeat": repeat, "min": min(timings),
+            "median": statistics.median(timings), "mean": statistics.fmean(timings)}
+
+
+def commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> List[Dict]:
+    names = args.benchmarks or list(BENCHMARKS)
+    results = []
+    for name in names:
+        for size in args.sizes or BENCHMARKS[name].sizes:
+            result = measure(name, size, args.repeat)
+            results.append(result)
+            print(f"{name:<24} {size:>9} {result['min'] * 1000:>12.3f} ms", file=sys.stderr)
+    report = {"commit": commit(), "python": platform.python_version(), "implementation": platform.python_implementation(),
+              "machine": platform.machine(), "timestamp": time.time(), "results": results}
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    return results
+
+
+def compare(args):
+    reports = []
+    for path in [args.baseline, args.candidate]:
+        with open(path) as f:
+            reports.append({(r["name"], r["size"]): r for r in json.load(f)["results"]})
+    baseline, candidate = reports
+    for key in sorted(baseline.keys() & candidate.keys()):
+        ratio = candidate[key]["min"] / baseline[key]["min"]
+        flag = " regression" if ratio > 1 + args.threshold else ""
+        print(f"{key[0]:<24} {key[1]:>9} {baseline[key]['min'] * 1000:>12.3f} ms {candidate[key]['min'] * 1000:>12.3f} ms"
+              f" {ratio:>7.2f}x{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="automatapy benchmark suite")
+    subparsers = parser.add_subparsers(dest="command")
+    run_parser = subparsers.add_parser("run", help="run benchmarks and write the results as JSON")
+    run_parser.add_argument("benchmarks", nargs="*", help=f"benchmarks to run, out of {', '.join(BENCHMARKS)}")
+    run_parser.add_argument("--sizes", type=int, nargs="+", help="sizes overriding the defaults")
+    run_parser.add_argument("--repeat", type=int, default=5, help="number of timed runs per size")
+    run_parser.add_argument("--output", default="benchmark.json", help="path of the JSON report")
+    compare_parser = subparsers.add_parser("compare", help="compare two JSON reports")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown reported as regression")
+    args = parser.parse_args()
+    if args.command == "compare":
+        compare(args)
+    elif args.command == "run":
+        unknown = set(args.benchmarks) - BENCHMARKS.keys()
+        if unknown:
+            parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+        run(args)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import random
+from typing import Callable, Dict, List, NamedTuple, Sequence
+
+from automatapy.automata import NFA
+from automatapy.automata.core import TransitionSystem
+from automatapy.regex import Letter, Alternation, KleeneStar, Concatenation, Regex
+from automatapy.regex.regex_converter import RegexConverter
+
+
+class Benchmark(NamedTuple):
+    name: str
+    sizes: Sequence[int]
+    # Receives the size and returns the function that is timed, so that the setup is not measured
+    setup: Callable[[int], Callable[[], object]]
+
+
+BENCHMARKS: Dict[str, Benchmark] = dict()
+
+
+def benchmark(name: str, sizes: Sequence[int]):
+    """
+    Registers a workload under the given name
+
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark
+    sizes : Sequence[int]
+        Default sizes the workload is run with
+
+    Returns
+    -------
+    Callable
+        Decorator
+    """
+    def register(setup: Callable[[int], Callable[[], object]]):
+        BENCHMARKS[name] = Benchmark(name, tuple(sizes), setup)
+        return setup
+    return register
+
+
+def blowup_nfa(n: int) -> NFA:
+    """
+    Returns the NFA of (a|b)*a(a|b)^n, whose minimal DFA has 2^(n+1) states
+
+    Parameters
+    ----------
+    n : int
+        Number of letters after the distinguished a
+
+    Returns
+    -------
+    NFA
+    """
+    nfa = NFA()
+    states = [nfa.add_state(initial=True)] + [nfa.add_state() for _ in range(n + 1)]
+    nfa.set_final(states[-1])
+    nfa.add_transition(states[0], "a", states[0])
+    nfa.add_transition(states[0], "b", states[0])
+    nfa.add_transition(states[0], "a", states[1])
+    for source, target in zip(states[1:], states[2:]):
+        nfa.add_transition(source, "a", target)
+        nfa.add_transition(source, "b", target)
+    return nfa
+
+
+def deep_regex(depth: int) -> Regex:
+    """
+    Returns a left-deep regular expression ((a(a|b*))(a|b*))... with the given number of concatenations
+
+    Parameters
+    ----------
+    depth : int
+        Number of concatenations
+
+    Returns
+    -------
+    Regex
+    """
+    regex = Letter("a")
+    for _ in range(depth):
+        regex = Concatenation(regex, Alternation(Letter("a"), KleeneStar(Letter("b"))))
+    return regex
+
+
+def random_word(length: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [rng.choice("ab") for _ in range(length)]
+
+
+@benchmark("nfa_accepts", sizes=[1000, 10000, 100000])
+def nfa_accepts(size: int):
+    nfa, word = blowup_nfa(8), random_word(size)
+    return lambda: nfa.accepts(word)
+
+
+@benchmark("compiled_nfa_accepts", sizes=[1000, 10000, 100000])
+def compiled_nfa_accepts(size: int):
+    nfa, word = blowup_nfa(8).compile(), random_word(size)
+    return lambda: nfa.accepts(word)
+
+
+@benchmark("compiled_dfa_accepts", sizes=[1000, 10000, 100000])
+def compiled_dfa_accepts(size: int):
+    dfa, word = blowup_nfa(8).determinize().compile(), random_word(size)
+    return lambda: dfa.accepts(word)
+
+
+@benchmark("compiled_dfa_batch", sizes=[1000, 10000, 100000])
+def compiled_dfa_batch(size: int):
+    rng = random.Random(0)
+    dfa = blowup_nfa(8).determinize().compile()
+    words = ["".join(random_word(rng.randint(5, 40), seed=i)) for i in range(size)]
+    return lambda: dfa.accepts_many(words)
+
+
+@benchmark("nfa_determinize", sizes=[4, 8, 12])
+def nfa_determinize(size: int):
+    nfa = blowup_nfa(size)
+    return lambda: nfa.determinize()
+
+
+@benchmark("regex_convert", sizes=[50, 100, 200])
+def regex_convert(size: int):
+    regex = deep_regex(size)
+    return lambda: RegexConverter().convert(regex)
+
+
+@benchmark("epsilon_nfa_to_nfa", sizes=[50, 100, 200])
+def epsilon_nfa_to_nfa(size: int):
+    epsilon_nfa = RegexConverter().convert(deep_regex(size))
+    return lambda: epsilon_nfa.to_nfa()
+
+
+@benchmark("add_transition", sizes=[10000, 100000, 1000000])
+def add_transition(size: int):
+    rng = random.Random(0)
+    # Ten transitions per state, but at least one state for small sizes
+    n = max(1, size // 10)
+    edges = [(rng.randrange(n), rng.choice("abcd"), rng.randrange(n)) for _ in range(size)]
+
+    def run():
+        ts = TransitionSystem()
+        states = [ts.add_state() for _ in range(n)]
+        for source, letter, target in edges:
+            ts.add_transition(states[source], letter, states[target])
+        return ts
+    return run
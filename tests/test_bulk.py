@@ -0,0 +1,84 @@
+import unittest
+
+from automatapy.automata import NFA, Epsilon, CompactTransitionSystem
+from automatapy.automata.core import TransitionSystem
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class BulkConstructionTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Words over {a, b} that end with "ab"
+        self.edges = ([0, 0, 0, 1], ["a", "b", "a", "b"], [0, 0, 1, 2])
+
+    def test_from_edges(self):
+        ts = TransitionSystem.from_edges(*self.edges, initial=[0], final=[2])
+        self.assertEqual(len(ts.states), 3)
+        self.assertEqual(len(ts.transitions), 4)
+        self.assertEqual(ts.alphabet, {"a", "b"})
+        nfa = NFA(ts=ts)
+        self.assertTrue(nfa.accepts("abab"))
+        self.assertFalse(nfa.accepts("aba"))
+        self.assertEqual(len(TransitionSystem.from_edges([], [], [], states=4).states), 4)
+        with self.assertRaises(ValueError):
+            TransitionSystem.from_edges([0, -1], ["a", "a"], [1, 0])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_from_numpy(self):
+        sources, letters, targets = (numpy.array(values) for values in self.edges)
+        ts = TransitionSystem.from_edges(sources, letters, targets, initial=numpy.array([0]), final=numpy.array([2]))
+        self.assertEqual(ts.alphabet, {"a", "b"})
+        self.assertTrue(all(type(letter) is str for letter in ts.alphabet))
+        self.assertTrue(NFA(ts=ts).accepts("bab"))
+
+    def test_add_transitions(self):
+        ts = TransitionSystem()
+        q0, q1 = ts.add_state(initial=True), ts.add_state(final=True)
+        ts.add_transitions([q0, q0, q1], ["a", Epsilon(), "b"], [q1, q1, q0])
+        self.assertEqual(ts.alphabet, {"a", "b"})
+        self.assertEqual(ts.get_successor(q0, Epsilon()), {q1})
+        self.assertEqual(ts.get_predecessor(q0, "b"), {q1})
+        self.assertEqual(len(ts.transitions), 3)
+        with self.assertRaises(ValueError):
+            ts.add_transitions([q0], ["a", "b"], [q1])
+
+    def test_freeze(self):
+        ts = TransitionSystem.from_edges(*self.edges, initial=[0], final=[2])
+        frozen = ts.freeze()
+        self.assertIsInstance(frozen, CompactTransitionSystem)
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertEqual(frozen, ts.freeze())
+        self.assertEqual(hash(frozen), hash(ts.freeze()))
+        self.assertEqual(len({frozen, ts.freeze()}), 1)
+        ts.add_transition(next(iter(ts.final_states)), "a", next(iter(ts.initial_states)))
+        self.assertNotEqual(frozen, ts.freeze())
+        self.assertEqual(len(frozen.transitions), 4)
+        self.assertTrue(NFA(ts=frozen).accepts("bab"))
+
+    def test_freeze_canonical(self):
+        sources, letters, targets = self.edges
+        frozen = TransitionSystem.from_edges(sources, letters, targets, initial=[0], final=[2]).freeze()
+        reordered = TransitionSystem.from_edges(sources[::-1], letters[::-1], targets[::-1], initial=[0], final=[2])
+        self.assertEqual(frozen, reordered.freeze())
+        self.assertEqual(hash(frozen), hash(reordered.freeze()))
+        # With many letters the iteration order of the alphabet depends on the order the letters were added in
+        letters = [chr(code) for code in range(ord("a"), ord("z") + 1)]
+        forward, backward = TransitionSystem(), TransitionSystem()
+        for ts, order in ((forward, letters), (backward, letters[::-1])):
+            q0, q1 = ts.add_state(initial=True), ts.add_state(final=True)
+            for letter in order:
+                ts.add_transition(q0, letter, q1)
+        self.assertEqual(forward.freeze(), backward.freeze())
+        # Targets of the same letter are stored in the same order whatever order they were added in
+        first = TransitionSystem.from_edges([0, 0], ["a", "a"], [1, 9], states=10)
+        second = TransitionSystem.from_edges([0, 0], ["a", "a"], [9, 1], states=10)
+        self.assertEqual(first.freeze(), second.freeze())
+        self.assertEqual(hash(first.freeze()), hash(second.freeze()))
+
+
+if __name__ == '__main__':
+    unittest.main()
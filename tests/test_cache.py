@@ -0,0 +1,66 @@
+import pickle
+import unittest
+
+from automatapy.regex import Letter, Alternation, KleeneStar, Concatenation
+from automatapy.regex.cache import CompileCache
+
+
+class RegexInterningTest(unittest.TestCase):
+
+    def test_structural_sharing(self):
+        r1 = Concatenation(KleeneStar(Letter("a")), Alternation(Letter("a"), Letter("b")))
+        r2 = Concatenation(KleeneStar(Letter("a")), Alternation(Letter("a"), Letter("b")))
+        self.assertIs(r1, r2)
+        self.assertEqual(hash(r1), hash(r2))
+        self.assertIsNot(Alternation(Letter("a"), Letter("b")), Alternation(Letter("b"), Letter("a")))
+        self.assertIsNot(Letter(1), Letter(True))
+
+    def test_keyword_arguments(self):
+        self.assertIs(Letter("a"), Letter(letter="a"))
+        self.assertIs(Alternation(Letter("a"), r2=Letter("b")), Alternation(r1=Letter("a"), r2=Letter("b")))
+        cache = CompileCache()
+        cache.nfa(KleeneStar(Letter("a")))
+        cache.nfa(KleeneStar(r=Letter(letter="a")))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_immutable(self):
+        letter = Letter("z")
+        with self.assertRaises(AttributeError):
+            letter.letter = "q"
+        with self.assertRaises(AttributeError):
+            del letter.letter
+        with self.assertRaises(AttributeError):
+            KleeneStar(letter).cached = True
+        self.assertEqual(Letter("z").letter, "z")
+        self.assertIs(pickle.loads(pickle.dumps(Concatenation(letter, letter))), Concatenation(letter, letter))
+
+
+class CompileCacheTest(unittest.TestCase):
+
+    def test_hit(self):
+        cache = CompileCache()
+        nfa = cache.nfa(Concatenation(KleeneStar(Letter("a")), Letter("b")))
+        self.assertIs(cache.nfa(Concatenation(KleeneStar(Letter("a")), Letter("b"))), nfa)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertTrue(nfa.accepts("aab"))
+        dfa = cache.dfa(Concatenation(KleeneStar(Letter("a")), Letter("b")))
+        self.assertTrue(dfa.accepts("aab"))
+        self.assertIs(cache.epsilon_nfa(Letter("a")), cache.epsilon_nfa(Letter("a")))
+
+    def test_eviction(self):
+        cache = CompileCache(max_size=10)
+        a, b = Letter("a"), Letter("b")
+        cache.nfa(a)
+        cache.nfa(b)
+        self.assertEqual(cache.size, 6)
+        cache.nfa(Concatenation(a, b))
+        self.assertEqual(cache.size, 8)
+        self.assertEqual(len(cache.entries), 2)
+        cache.nfa(a)
+        self.assertEqual(cache.hits, 0)
+        cache.nfa(KleeneStar(Concatenation(Concatenation(a, b), Concatenation(a, b))))
+        self.assertLessEqual(cache.size, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import os
+import random
+import tempfile
+import unittest
+from itertools import product
+
+from automatapy.automata import NFA, CharClass, CompiledDFA, load
+from automatapy.automata.charclass import SymbolicIndex, minterms, symbols
+from automatapy.regex import Letter, Concatenation, KleeneStar, Alternation
+from automatapy.regex.derivatives import DerivativeMatcher
+from automatapy.regex.glushkov_converter import GlushkovConverter
+
+
+def words(alphabet, max_length):
+    for length in range(max_length + 1):
+        for word in product(alphabet, repeat=length):
+            yield "".join(word)
+
+
+class CharClassTest(unittest.TestCase):
+
+    def test_parse(self):
+        digits = CharClass.parse("0-9")
+        self.assertIn("5", digits)
+        self.assertNotIn("a", digits)
+        self.assertIn(ord("7"), digits)
+        self.assertNotIn("55", digits)
+        self.assertEqual(len(CharClass.parse("a-z0-9_")), 37)
+        self.assertEqual(CharClass.parse("a\\-z"), CharClass.of("a-z"))
+        self.assertNotIn("x", CharClass.parse("^a-z"))
+        self.assertIn("A", CharClass.parse("^a-z"))
+        self.assertEqual(str(CharClass.parse("0-9a")), "[0-9a]")
+        with self.assertRaises(ValueError):
+            CharClass.parse("z-a")
+
+    def test_operations(self):
+        lower, vowels = CharClass.parse("a-z"), CharClass.of("aeiou")
+        self.assertEqual(lower & vowels, vowels)
+        self.assertEqual(len(lower - vowels), 21)
+        self.assertEqual(vowels | CharClass.of("y"), CharClass.of("aeiouy"))
+        self.assertEqual(lower.complement().complement(), lower)
+        self.assertFalse(CharClass())
+
+    def test_minterms(self):
+        terms = minterms([CharClass.parse("a-m"), CharClass.parse("h-z"), CharClass.of("q")])
+        self.assertEqual(terms, [CharClass.parse("a-g"), CharClass.parse("h-m"), CharClass.parse("n-pr-z"),
+                                 CharClass.of("q")])
+        self.assertEqual(symbols(["a", "b"]), [("a", "a"), ("b", "b")])
+        labels = [label for label, _ in symbols(["b", CharClass.parse("a-c"), 1.5])]
+        self.assertEqual(set(labels), {"b", CharClass.of("ac"), 1.5})
+
+    def test_letter_types(self):
+        labels = [label for label, _ in symbols([CharClass.parse("a-c"), "b", ord("b")])]
+        self.assertEqual(len(labels), 3)
+        self.assertIn("b", labels)
+        self.assertIn(ord("b"), labels)
+        nfa = NFA()
+        q0, q1, q2 = nfa.add_state(initial=True), nfa.add_state(), nfa.add_state(final=True)
+        nfa.add_transition(q0, CharClass.parse("a-c"), q1)
+        nfa.add_transition(q0, "b", q2)
+        nfa.add_transition(q0, ord("b"), q1)
+        nfa.add_transition(q1, ord("b"), q2)
+        for automaton in [nfa.determinize().compile(), nfa.compile()]:
+            for word in [["b"], [ord("b")], ["a", ord("b")], [ord("b"), ord("b")], ["a"]]:
+                self.assertEqual(automaton.accepts(word), nfa.accepts(word), word)
+
+    def test_index_cache(self):
+        index = SymbolicIndex([CharClass.parse("a-z"), "0"], cache_size=4)
+        for letter in "abcdefghij":
+            self.assertEqual(index.get(letter), 0)
+        self.assertEqual(index.get("0"), 1)
+        self.assertIsNone(index.get("1"))
+        self.assertEqual(len(index), 2 + 4)
+
+
+class SymbolicAutomatonTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # [a-z][a-z0-9]* followed by "="
+        self.nfa = NFA()
+        q0, q1, q2 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        self.nfa.add_transition(q0, CharClass.parse("a-z"), q1)
+        self.nfa.add_transition(q1, CharClass.parse("a-z0-9"), q1)
+        self.nfa.add_transition(q1, "=", q2)
+        self.nfa.add_transition(q1, "x", q2)
+
+    def test_accepts(self):
+        self.assertTrue(self.nfa.accepts("key1="))
+        self.assertTrue(self.nfa.accepts("kx"))
+        self.assertFalse(self.nfa.accepts("1key="))
+        self.assertFalse(self.nfa.accepts("key"))
+
+    def test_compile_overlapping(self):
+        for labels in [(CharClass.parse("a-c"), CharClass.parse("b-d")), (CharClass.parse("a-z"), "q")]:
+            nfa = NFA()
+            q0, q1, q2 = nfa.add_state(initial=True), nfa.add_state(final=True), nfa.add_state()
+            nfa.add_transition(q0, labels[0], q1)
+            nfa.add_transition(q0, labels[1], q2)
+            with self.assertRaises(ValueError):
+                CompiledDFA.from_transition_system(nfa.ts)
+        compiled = self.nfa.determinize().compile()
+        for word in ["key1=", "kx", "x", "1key=", "key", "k=x"]:
+            self.assertEqual(compiled.accepts(word), self.nfa.accepts(word), word)
+
+    def test_determinize(self):
+        dfa = self.nfa.determinize()
+        self.assertLessEqual(len(dfa.ts.transitions), 4 * len(dfa.ts.states))
+        minimal, _ = dfa.minimize()
+        for automaton in [dfa, minimal, dfa.compile(), self.nfa.compile(), self.nfa.lazy_determinize()]:
+            self.assertTrue(automaton.accepts("key1="))
+            self.assertTrue(automaton.accepts("kx"))
+            self.assertTrue(automaton.accepts("kxx"))
+            self.assertFalse(automaton.accepts("1key="))
+            self.assertFalse(automaton.accepts("key"))
+            self.assertFalse(automaton.accepts("k=="))
+
+    def test_search_and_products(self):
+        self.assertEqual(self.nfa.search("  ab9= "), (2, 6))
+        other = NFA()
+        q0, q1 = other.add_state(initial=True), other.add_state(final=True)
+        other.add_transition(q0, CharClass.parse("k-m"), q0)
+        other.add_transition(q0, CharClass.parse("=x"), q1)
+        intersection = self.nfa.intersect(other)
+        self.assertTrue(intersection.accepts("kl="))
+        self.assertFalse(intersection.accepts("ab="))
+        self.assertTrue(intersection.is_subset_of(self.nfa))
+        self.assertFalse(self.nfa.is_subset_of(intersection))
+        self.assertTrue(self.nfa.is_equivalent(self.nfa.determinize()))
+
+    def test_serialization(self):
+        path = os.path.join(tempfile.mkdtemp(), "dfa.atpy")
+        self.nfa.determinize().save(path)
+        self.assertTrue(load(path).accepts("key1="))
+        self.nfa.save(path)
+        loaded = load(path)
+        self.assertTrue(loaded.accepts("key1="))
+        self.assertTrue(loaded.accepts("kx"))
+        self.assertFalse(loaded.accepts("key"))
+
+    def test_regex(self):
+        word = Letter.char_class("a-z")
+        regex = Concatenation(word, Concatenation(KleeneStar(Alternation(word, Letter.char_class("0-9"))),
+                                                  Letter("=")))
+        self.assertEqual(str(Letter.char_class("a-z")), "[a-z]")
+        self.assertIs(Letter.char_class("a-z"), word)
+        matcher = DerivativeMatcher(regex)
+        nfa = GlushkovConverter().convert(regex)
+        dfa = matcher.to_dfa()
+        for automaton in [matcher, nfa, dfa]:
+            self.assertTrue(automaton.accepts("key1="))
+            self.assertFalse(automaton.accepts("1key="))
+
+    def test_random(self):
+        rng = random.Random(3)
+        letters = "abcdef"
+        classes = [CharClass.parse(spec) for spec in ["a-c", "b-e", "f", "a", "ace", "^b-f"]]
+        for _ in range(25):
+            symbolic, expanded = NFA(), NFA()
+            states = [(symbolic.add_state(initial=i == 0, final=rng.random() < 0.4),
+                       expanded.add_state(initial=i == 0, final=False)) for i in range(4)]
+            for s, e in states:
+                if s in symbolic.ts.final_states:
+                    expanded.set_final(e)
+            for _ in range(7):
+                (s1, e1), (s2, e2) = rng.choice(states), rng.choice(states)
+                label = rng.choice(classes + list(letters))
+                symbolic.add_transition(s1, label, s2)
+                for letter in (letter for letter in letters if letter in label or letter == label):
+                    expanded.add_transition(e1, letter, e2)
+            dfa = symbolic.determinize()
+            minimal, _ = dfa.minimize()
+            for word in words(letters, 3):
+                expected = expanded.accepts(word)
+                self.assertEqual(symbolic.accepts(word), expected)
+                self.assertEqual(dfa.accepts(word), expected)
+                self.assertEqual(minimal.compile().accepts(word), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from automatapy.automata import NFA, EpsilonNFA, Epsilon, CompactTransitionSystem
+
+
+class CompactTransitionSystemTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nfa = NFA()
+        q1, q2 = self.nfa.add_state(initial=True), self.nfa.add_state(name="q2")
+        self.nfa.add_transition(q1, "a", q2)
+        self.nfa.add_transition(q1, "a", q1)
+        self.nfa.add_transition(q2, "b", q1)
+        self.nfa.set_final(q1)
+        self.compact = self.nfa.compact()
+
+    def test_structure(self):
+        ts = self.compact.ts
+        self.assertIsInstance(ts, CompactTransitionSystem)
+        self.assertEqual(len(ts.states), 2)
+        self.assertEqual(len(ts.transitions), 3)
+        self.assertEqual(ts.alphabet, {"a", "b"})
+        self.assertEqual(sorted(state.state_id for state in ts.states), [0, 1])
+        self.assertIn("q2", [state.name for state in ts.states])
+        self.assertEqual({str(t.letter) for t in ts.transitions}, {"a", "b"})
+        initial = next(iter(ts.initial_states))
+        self.assertIn(initial, ts.final_states)
+        self.assertEqual(ts.get_successor(initial, "a"), set(ts.states))
+        self.assertEqual(ts.enabled_letters(initial), {"a"})
+
+    def test_accept(self):
+        for word in ["abba", "abab", "ab", "", "b", "aab"]:
+            self.assertEqual(self.nfa.accepts(word), self.compact.accepts(word), word)
+
+    def test_determinize(self):
+        dfa = self.compact.determinize()
+        for word in ["abba", "abab", "ab", "", "b", "aab"]:
+            self.assertEqual(self.nfa.accepts(word), dfa.accepts(word), word)
+        compiled = dfa.compact().compile()
+        self.assertEqual(compiled.accepts("abab"), True)
+
+    def test_epsilon(self):
+        eps_nfa = EpsilonNFA()
+        q1, q2 = eps_nfa.add_state(initial=True), eps_nfa.add_state(final=True)
+        eps_nfa.add_transition(q1, Epsilon(), q2)
+        eps_nfa.add_transition(q2, "a", q2)
+        compact = eps_nfa.compact()
+        self.assertEqual(compact.ts.alphabet, {"a"})
+        self.assertEqual(compact.ts.enabled_letters(next(iter(compact.ts.initial_states)), ignore_epsilon=True), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
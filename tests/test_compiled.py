@@ -0,0 +1,144 @@
+import unittest
+from unittest import mock
+
+from automatapy.automata import NFA, DFA
+
+
+class CompiledDFATest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        nfa = NFA()
+        q1, q2 = nfa.add_state(initial=True), nfa.add_state()
+        nfa.add_transition(q1, "a", q2)
+        nfa.add_transition(q1, "a", q1)
+        nfa.add_transition(q2, "b", q1)
+        nfa.set_final(q1)
+        self.dfa = nfa.determinize()
+        self.compiled = self.dfa.compile()
+
+    def test_accept(self):
+        for word in ["", "a", "ab", "abab", "aab", "abba", "ba", "b", "abc", "aaaaab"]:
+            self.assertEqual(self.dfa.accepts(word), self.compiled.accepts(word), word)
+
+    def test_unknown_letter(self):
+        self.assertFalse(self.compiled.accepts("xab"))
+        self.assertEqual(self.compiled.step(self.compiled.initial, "x"), self.compiled.dead)
+
+    def test_dead_state(self):
+        dead = self.compiled.dead
+        self.assertFalse(self.compiled.is_final(dead))
+        for letter in self.compiled.alphabet:
+            self.assertEqual(self.compiled.step(dead, letter), dead)
+
+    def test_accepts_many(self):
+        words = ["", "a", "ab", "abab", "aab", "abba", "ba", "b", "abc", "aaaaab", "ab" * 50]
+        expected = [self.compiled.accepts(word) for word in words]
+        self.assertEqual(list(self.compiled.accepts_many(words)), expected)
+        self.assertEqual(list(self.dfa.accepts_many(words)), expected)
+        self.assertEqual(list(self.compiled.accepts_many([])), [])
+        with mock.patch("automatapy.automata.compiled.numpy", None):
+            self.assertEqual(list(self.compiled.accepts_many(words)), expected)
+
+    def test_accepts_many_encodings(self):
+        words = ["", "a", "ab", "abab", "xab", "aab", "ab" * 50, "\u20ac"]
+        expected = [self.compiled.accepts(word) for word in words]
+        self.assertEqual(list(self.compiled.accepts_many([list(word) for word in words])), expected)
+        self.assertEqual(list(self.compiled.accepts_many(["", ""])), [True, True])
+        bytes_dfa = NFA()
+        q0, q1 = bytes_dfa.add_state(initial=True), bytes_dfa.add_state(final=True)
+        bytes_dfa.add_transition(q0, ord("a"), q1)
+        bytes_dfa.add_transition(q1, ord("b"), q0)
+        compiled = bytes_dfa.determinize().compile()
+        byte_words = [b"", b"a", b"aba", b"ab", bytearray(b"abx"), b"\xffa"]
+        self.assertEqual(list(compiled.accepts_many(byte_words)), [compiled.accepts(word) for word in byte_words])
+
+    def test_partial_dfa(self):
+        dfa = DFA()
+        q1, q2 = dfa.add_state(initial=True), dfa.add_state(final=True)
+        dfa.add_transition(q1, "a", q2)
+        compiled = dfa.compile()
+        self.assertTrue(compiled.accepts("a"))
+        self.assertFalse(compiled.accepts("aa"))
+        self.assertFalse(compiled.accepts(""))
+
+    def test_nondeterministic(self):
+        dfa = DFA()
+        q1, q2 = dfa.add_state(initial=True), dfa.add_state(final=True)
+        dfa.add_transition(q1, "a", q1)
+        dfa.add_transition(q1, "a", q2)
+        with self.assertRaises(ValueError):
+            dfa.compile()
+
+
+class CompiledNFATest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nfa = NFA()
+        q1, q2, q3 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        self.nfa.add_transition(q1, "a", q1)
+        self.nfa.add_transition(q1, "b", q1)
+        self.nfa.add_transition(q1, "a", q2)
+        self.nfa.add_transition(q2, "b", q3)
+        self.compiled = self.nfa.compile()
+
+    def test_accept(self):
+        for word in ["", "a", "ab", "abab", "aab", "abba", "ba", "b", "abc", "bbbbab"]:
+            self.assertEqual(self.nfa.accepts(word), self.compiled.accepts(word), word)
+
+    def test_accepts_many(self):
+        words = ["", "a", "ab", "abab", "aab", "abba", "ba", "b", "abc", "bbbbab"]
+        expected = [self.nfa.accepts(word) for word in words]
+        self.assertEqual(list(self.nfa.accepts_many(words)), expected)
+
+    def test_long_word(self):
+        word = "ab" * 100000
+        self.assertTrue(self.compiled.accepts(word))
+        self.assertTrue(self.compiled.accepts(iter(word)))
+        self.assertFalse(self.compiled.accepts(word + "a"))
+
+    def test_step(self):
+        current = self.compiled.step(self.compiled.initial, "a")
+        self.assertEqual(bin(current).count("1"), 2)
+        self.assertTrue(self.compiled.is_final(self.compiled.step(current, "b")))
+        self.assertEqual(self.compiled.step(current, "x"), 0)
+
+
+class LazyDFATest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # (a|b)*a(a|b)^8
+        self.nfa = NFA()
+        states = [self.nfa.add_state(initial=True)] + [self.nfa.add_state() for _ in range(9)]
+        self.nfa.set_final(states[-1])
+        self.nfa.add_transition(states[0], "a", states[0])
+        self.nfa.add_transition(states[0], "b", states[0])
+        self.nfa.add_transition(states[0], "a", states[1])
+        for source, target in zip(states[1:], states[2:]):
+            self.nfa.add_transition(source, "a", target)
+            self.nfa.add_transition(source, "b", target)
+        self.words = ["", "a", "ab", "abbbbbbbb", "bbbabbbbbbbb", "aaaaaaaaaa", "abc" + "b" * 8]
+
+    def test_accept(self):
+        lazy = self.nfa.lazy_determinize()
+        for word in self.words:
+            self.assertEqual(self.nfa.accepts(word), lazy.accepts(word), word)
+            self.assertEqual(self.nfa.accepts(word), lazy.accepts(word), word)
+        self.assertEqual(lazy.evictions, 0)
+
+    def test_eviction(self):
+        lazy = self.nfa.lazy_determinize(cache_size=4)
+        for word in self.words:
+            self.assertEqual(self.nfa.accepts(word), lazy.accepts(word), word)
+        self.assertLessEqual(len(lazy.cache), 4)
+        self.assertGreater(lazy.evictions, 0)
+
+    def test_fallback(self):
+        lazy = self.nfa.lazy_determinize(cache_size=4)
+        lazy.min_steps = 8
+        word = "abaabbbaababbbaaabab" * 10
+        self.assertEqual(self.nfa.accepts(word), lazy.accepts(word))
+        self.assertEqual(lazy.fallbacks, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
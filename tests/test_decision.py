@@ -0,0 +1,71 @@
+import unittest
+
+from automatapy.automata import NFA, DFA
+
+
+class DecisionTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Words over {a, b} whose second to last letter is a
+        self.nfa = NFA()
+        q1, q2, q3 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        self.nfa.add_transition(q1, "a", q1)
+        self.nfa.add_transition(q1, "b", q1)
+        self.nfa.add_transition(q1, "a", q2)
+        self.nfa.add_transition(q2, "a", q3)
+        self.nfa.add_transition(q2, "b", q3)
+        # Words over {a, b} that contain an a
+        self.contains_a = NFA()
+        p1, p2 = self.contains_a.add_state(initial=True), self.contains_a.add_state(final=True)
+        for letter in "ab":
+            self.contains_a.add_transition(p1, letter, p1)
+            self.contains_a.add_transition(p2, letter, p2)
+        self.contains_a.add_transition(p1, "a", p2)
+
+    def test_is_empty(self):
+        self.assertFalse(self.nfa.is_empty())
+        self.assertEqual(self.nfa.is_empty().counterexample, ["a", "a"])
+        self.assertTrue(self.nfa.intersect(self.nfa.complement()).is_empty())
+
+    def test_is_subset_of(self):
+        self.assertTrue(self.nfa.is_subset_of(self.contains_a))
+        decision = self.contains_a.is_subset_of(self.nfa)
+        self.assertFalse(decision)
+        self.assertEqual(decision.counterexample, ["a"])
+        self.assertTrue(self.nfa.is_subset_of(self.nfa.determinize()))
+
+    def test_is_universal(self):
+        decision = self.contains_a.is_universal()
+        self.assertFalse(decision)
+        self.assertEqual(decision.counterexample, [])
+        self.assertTrue(self.contains_a.union(self.contains_a.complement()).is_universal())
+        self.assertTrue(self.nfa.union(self.nfa.complement()).is_universal())
+        decision = self.nfa.union(self.contains_a.complement()).is_universal()
+        self.assertEqual(len(decision.counterexample), 1)
+
+    def test_is_equivalent(self):
+        dfa = self.nfa.determinize()
+        self.assertTrue(self.nfa.is_equivalent(dfa))
+        self.assertTrue(dfa.is_equivalent(dfa.minimize()[0]))
+        decision = dfa.is_equivalent(self.contains_a.determinize())
+        self.assertFalse(decision)
+        self.assertEqual(decision.counterexample, ["a"])
+        decision = self.nfa.is_equivalent(self.contains_a)
+        self.assertEqual(decision.counterexample, ["a"])
+
+    def test_shortest_counterexample(self):
+        # Words of length at least 3 compared with words of length at least 5
+        def at_least(n):
+            dfa = DFA()
+            states = [dfa.add_state(initial=i == 0, final=i == n) for i in range(n + 1)]
+            for source, target in zip(states, states[1:] + states[-1:]):
+                dfa.add_transition(source, "a", target)
+            return dfa
+        decision = at_least(3).is_equivalent(at_least(5))
+        self.assertEqual(decision.counterexample, ["a"] * 3)
+        self.assertEqual(at_least(3).is_subset_of(at_least(5)).counterexample, ["a"] * 3)
+        self.assertTrue(at_least(5).is_subset_of(at_least(3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import itertools
+import unittest
+
+from automatapy.automata import Matcher
+from automatapy.regex import Letter, Alternation, KleeneStar, Concatenation
+from automatapy.regex.derivatives import DerivativeMatcher
+from automatapy.regex.regex_converter import RegexConverter
+
+
+class DerivativeMatcherTest(unittest.TestCase):
+
+    def assertSameLanguage(self, regex, length=6):
+        matcher = DerivativeMatcher(regex)
+        nfa = regex.accept(RegexConverter()).to_nfa()
+        for n in range(length + 1):
+            for word in itertools.product("abc", repeat=n):
+                self.assertEqual(matcher.accepts(word), nfa.accepts(word), "".join(word))
+
+    def test_regex_1(self):
+        a, b = Letter("a"), Letter("b")
+        self.assertSameLanguage(Alternation(Concatenation(a, b), KleeneStar(a)))
+
+    def test_regex_2(self):
+        a, b, c = Letter("a"), Letter("b"), Letter("c")
+        self.assertSameLanguage(
+            Concatenation(KleeneStar(Alternation(a, Concatenation(b, KleeneStar(c)))), Concatenation(a, KleeneStar(b))))
+
+    def test_normalization(self):
+        a, b = Letter("a"), Letter("b")
+        matcher = DerivativeMatcher(Alternation(Alternation(a, b), Alternation(b, a)))
+        self.assertEqual(matcher.initial, matcher.alternation([matcher.letter("b"), matcher.letter("a")]))
+        self.assertEqual(matcher.star(matcher.star(matcher.letter("a"))), matcher.star(matcher.letter("a")))
+
+    def test_finite_derivatives(self):
+        a, b = Letter("a"), Letter("b")
+        matcher = DerivativeMatcher(KleeneStar(Alternation(Concatenation(a, b), KleeneStar(a))))
+        matcher.accepts("ab" * 1000)
+        size = len(matcher.nodes)
+        matcher.accepts("ab" * 1000 + "aaab")
+        self.assertLess(size, 20)
+        self.assertLessEqual(len(matcher.to_dfa().get_states()), 4)
+
+    def test_matcher(self):
+        a, b = Letter("a"), Letter("b")
+        matcher = Matcher(DerivativeMatcher(Concatenation(KleeneStar(a), b)))
+        self.assertTrue(matcher.feed("aaa").feed("b").is_accepting())
+        self.assertTrue(matcher.feed("b").is_dead())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import itertools
+import unittest
+
+from automatapy.automata import NFA, DFA
+
+
+class DFATest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # (a|b)*a(a|b)^2
+        self.nfa = NFA()
+        states = [self.nfa.add_state(initial=True)] + [self.nfa.add_state() for _ in range(3)]
+        self.nfa.set_final(states[-1])
+        self.nfa.add_transition(states[0], "a", states[0])
+        self.nfa.add_transition(states[0], "b", states[0])
+        self.nfa.add_transition(states[0], "a", states[1])
+        for source, target in zip(states[1:], states[2:]):
+            self.nfa.add_transition(source, "a", target)
+            self.nfa.add_transition(source, "b", target)
+
+    def words(self, length):
+        for n in range(length + 1):
+            for word in itertools.product("ab", repeat=n):
+                yield "".join(word)
+
+    def test_minimize(self):
+        dfa = self.nfa.determinize()
+        minimal, mapping = dfa.minimize()
+        self.assertEqual(len(minimal.get_states()), 8)
+        self.assertEqual(set(mapping.keys()), set(dfa.get_states()))
+        for word in self.words(7):
+            self.assertEqual(minimal.accepts(word), self.nfa.accepts(word), word)
+
+    def test_minimize_redundant(self):
+        dfa = DFA()
+        q1, q2, q3, q4 = dfa.add_state(initial=True), dfa.add_state(), dfa.add_state(), dfa.add_state(final=True)
+        dfa.add_state()
+        dfa.add_transition(q1, "a", q2)
+        dfa.add_transition(q1, "b", q3)
+        dfa.add_transition(q2, "a", q4)
+        dfa.add_transition(q3, "a", q4)
+        minimal, mapping = dfa.minimize()
+        self.assertEqual(len(minimal.get_states()), 3)
+        self.assertIs(mapping[q2], mapping[q3])
+        self.assertEqual(len(mapping), 4)
+        for word in self.words(4):
+            self.assertEqual(minimal.accepts(word), word in ["aa", "ba"], word)
+
+    def test_minimize_empty(self):
+        dfa = DFA()
+        q1 = dfa.add_state(initial=True)
+        dfa.add_transition(q1, "a", q1)
+        minimal, mapping = dfa.minimize()
+        self.assertEqual(len(minimal.get_states()), 1)
+        self.assertFalse(minimal.accepts("aaa"))
+
+
+if __name__ == '__main__':
+    unittest.main()
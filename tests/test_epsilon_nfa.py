@@ -20,6 +20,23 @@ class EpsilonNFATest(unittest.TestCase):
         self.assertTrue(nfa.accepts("bbbbbbbbb"))
         self.assertFalse(nfa.accepts("abbbbbbbbb"))
 
+    def test_epsilon_cycle(self):
+        eps_nfa = EpsilonNFA()
+        q1, q2, q3, q4 = [eps_nfa.add_state() for _ in range(4)]
+        eps_nfa.ts.set_initial(q1)
+        eps_nfa.set_final(q4)
+        eps_nfa.add_transition(q1, Epsilon(), q2)
+        eps_nfa.add_transition(q2, Epsilon(), q3)
+        eps_nfa.add_transition(q3, Epsilon(), q1)
+        eps_nfa.add_transition(q2, "a", q4)
+        eps_nfa.add_transition(q4, Epsilon(), q3)
+        nfa = eps_nfa.to_nfa()
+        self.assertFalse(nfa.accepts(""))
+        self.assertTrue(nfa.accepts("a"))
+        self.assertTrue(nfa.accepts("aaa"))
+        self.assertFalse(nfa.accepts("b"))
+        self.assertEqual(len(nfa.get_states()), 2)
+
 
 
 if __name__ == '__main__':
@@ -0,0 +1,49 @@
+import itertools
+import unittest
+
+from automatapy.regex import Letter, Alternation, KleeneStar, Concatenation
+from automatapy.regex.glushkov_converter import GlushkovConverter
+from automatapy.regex.regex_converter import RegexConverter
+
+
+class GlushkovConverterTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.converter = GlushkovConverter()
+
+    def assertSameLanguage(self, regex, length=6):
+        glushkov = self.converter.convert(regex)
+        thompson = regex.accept(RegexConverter()).to_nfa()
+        for n in range(length + 1):
+            for word in itertools.product("abc", repeat=n):
+                self.assertEqual(glushkov.accepts(word), thompson.accepts(word), "".join(word))
+
+    def test_letter(self):
+        nfa = self.converter.convert(Letter("a"))
+        self.assertEqual(len(nfa.get_states()), 2)
+        self.assertTrue(nfa.accepts("a"))
+        self.assertFalse(nfa.accepts(""))
+
+    def test_regex_1(self):
+        a, b = Letter("a"), Letter("b")
+        r = Alternation(Concatenation(a, b), KleeneStar(a))
+        nfa = self.converter.convert(r)
+        self.assertEqual(len(nfa.get_states()), 4)
+        self.assertTrue(all(t.letter in "ab" for t in nfa.get_transitions()))
+        self.assertSameLanguage(r)
+
+    def test_regex_2(self):
+        a, b, c = Letter("a"), Letter("b"), Letter("c")
+        r = Concatenation(KleeneStar(Alternation(a, Concatenation(b, KleeneStar(c)))), Concatenation(a, KleeneStar(b)))
+        self.assertSameLanguage(r)
+
+    def test_nested_star(self):
+        a, b = Letter("a"), Letter("b")
+        r = KleeneStar(Concatenation(KleeneStar(a), KleeneStar(b)))
+        nfa = self.converter.convert(r)
+        self.assertTrue(nfa.accepts(""))
+        self.assertSameLanguage(r)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from automatapy.automata import NFA, EpsilonNFA, Epsilon, EngineStats, collect_stats
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nfa = NFA()
+        q0, q1, q2 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        self.nfa.add_transition(q0, "a", q0)
+        self.nfa.add_transition(q0, "b", q0)
+        self.nfa.add_transition(q0, "a", q1)
+        self.nfa.add_transition(q1, "b", q2)
+
+    def test_determinize_stats(self):
+        with collect_stats(self.nfa) as stats:
+            dfa = self.nfa.determinize()
+        self.assertIsInstance(stats, EngineStats)
+        self.assertEqual(stats.states_created, len(dfa.ts.states))
+        self.assertEqual(stats.transitions_created, len(dfa.ts.transitions))
+        self.assertEqual(sum(stats.subset_sizes.values()), len(dfa.ts.states))
+        self.assertGreaterEqual(stats.peak_worklist, 1)
+        self.assertIn("determinize", stats.phase_times)
+        self.assertIsNone(self.nfa.engine.stats)
+        self.assertEqual(stats.report()["states_created"], stats.states_created)
+
+    def test_minimize_and_accepts(self):
+        dfa = self.nfa.determinize()
+        with collect_stats(dfa) as stats:
+            minimal, _ = dfa.minimize()
+            self.assertTrue(dfa.accepts("aab"))
+        self.assertEqual(stats.states_created, len(minimal.ts.states))
+        self.assertEqual(stats.steps, 3)
+        self.assertIn("minimize.refine", stats.phase_times)
+        self.assertIn("minimize.build", stats.phase_times)
+
+    def test_remove_epsilon(self):
+        enfa = EpsilonNFA()
+        q0, q1, q2 = enfa.add_state(initial=True), enfa.add_state(), enfa.add_state(final=True)
+        enfa.add_transition(q0, Epsilon(), q1)
+        enfa.add_transition(q1, Epsilon(), q0)
+        enfa.add_transition(q1, "a", q2)
+        closures = []
+        enfa.engine.register_hook("on_closure", closures.append)
+        with collect_stats(enfa) as stats:
+            enfa.to_nfa()
+        self.assertEqual(stats.closures, len(closures))
+        self.assertEqual(len(closures), 2)
+        self.assertIn("remove_epsilon.closure", stats.phase_times)
+
+    def test_hooks(self):
+        created, steps = [], []
+        engine = self.nfa.engine
+        engine.register_hook("on_state_created", created.append)
+        engine.register_hook("on_step", lambda letter, current: steps.append(letter))
+        dfa = self.nfa.determinize()
+        self.nfa.accepts("ab")
+        self.assertEqual(len(created), len(dfa.ts.states))
+        self.assertEqual(steps, ["a", "b"])
+        engine.remove_hook("on_state_created", created.append)
+        self.nfa.determinize()
+        self.assertEqual(len(created), len(dfa.ts.states))
+        with self.assertRaises(ValueError):
+            engine.register_hook("on_unknown", print)
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from automatapy.automata import NFA
+
+
+class MatcherTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nfa = NFA()
+        q1, q2, q3 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        for letter in ["a", "b", ord("a"), ord("b")]:
+            self.nfa.add_transition(q1, letter, q1)
+        self.nfa.add_transition(q1, "a", q2)
+        self.nfa.add_transition(q2, "b", q3)
+        self.nfa.add_transition(q1, ord("a"), q2)
+        self.nfa.add_transition(q2, ord("b"), q3)
+
+    def test_feed(self):
+        for matcher in [self.nfa.matcher(), self.nfa.determinize().matcher()]:
+            self.assertFalse(matcher.feed("aba").is_accepting())
+            self.assertTrue(matcher.feed("b").is_accepting())
+            matcher.feed(iter("ba"))
+            self.assertFalse(matcher.is_accepting())
+            matcher.reset()
+            self.assertFalse(matcher.is_accepting())
+            self.assertTrue(matcher.feed("a").feed("b").is_accepting())
+
+    def test_snapshot(self):
+        matcher = self.nfa.matcher()
+        matcher.feed("bba")
+        snapshot = matcher.snapshot()
+        self.assertTrue(matcher.feed("b").is_accepting())
+        matcher.restore(snapshot)
+        self.assertFalse(matcher.feed("a").is_accepting())
+        matcher.restore(snapshot)
+        self.assertTrue(matcher.feed("b").is_accepting())
+
+    def test_dead(self):
+        matcher = self.nfa.determinize().matcher()
+        matcher.feed("abc")
+        self.assertTrue(matcher.is_dead())
+        self.assertFalse(matcher.feed("ab").is_accepting())
+
+    def test_match_file(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"ab" * 10000)
+            for matcher in [self.nfa.matcher(), self.nfa.determinize().matcher()]:
+                self.assertTrue(matcher.match_file(path, chunk_size=1000))
+                matcher.reset()
+                self.assertTrue(matcher.match_file(path, encoding="ascii"))
+                self.assertFalse(matcher.feed("a").is_accepting())
+            with open(path, "wb"):
+                pass
+            self.assertFalse(self.nfa.matcher().match_file(path))
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
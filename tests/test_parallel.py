@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from automatapy.automata import NFA
+
+
+class ParallelMatcherTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nfa = NFA()
+        q1, q2, q3 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        self.nfa.add_transition(q1, "a", q1)
+        self.nfa.add_transition(q1, "b", q1)
+        self.nfa.add_transition(q1, "a", q2)
+        self.nfa.add_transition(q2, "b", q3)
+        self.dfa = self.nfa.determinize()
+        self.records = ["ab" * (i % 7) + "a" * (i % 3) for i in range(1000)]
+
+    def test_map(self):
+        with self.dfa.parallel_matcher(processes=2) as matcher:
+            matcher.chunk_size = 64
+            expected = [self.nfa.accepts(record) for record in self.records]
+            self.assertEqual(matcher.map(self.records), expected)
+            self.assertEqual(matcher.map(iter(self.records)), expected)
+            self.assertEqual(matcher.map([]), [])
+
+    def test_match_file(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write("\n".join(self.records))
+            with self.dfa.parallel_matcher(processes=2) as matcher:
+                self.assertEqual(matcher.match_file(path), [self.nfa.accepts(record) for record in self.records])
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
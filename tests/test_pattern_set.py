@@ -0,0 +1,39 @@
+import itertools
+import unittest
+
+from automatapy.regex import Letter, Alternation, KleeneStar, Concatenation
+from automatapy.regex.derivatives import DerivativeMatcher
+from automatapy.regex.pattern_set import PatternSet
+
+
+class PatternSetTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        a, b, c = Letter("a"), Letter("b"), Letter("c")
+        self.regexes = [
+            Concatenation(KleeneStar(a), b),
+            Concatenation(KleeneStar(Alternation(a, b)), b),
+            KleeneStar(Concatenation(a, b)),
+            Concatenation(a, KleeneStar(c)),
+        ]
+
+    def test_match(self):
+        matchers = [DerivativeMatcher(regex) for regex in self.regexes]
+        for minimize in [False, True]:
+            patterns = PatternSet(self.regexes, minimize=minimize)
+            for n in range(6):
+                for word in itertools.product("abc", repeat=n):
+                    expected = frozenset(i for i, matcher in enumerate(matchers) if matcher.accepts(word))
+                    self.assertEqual(patterns.match(word), expected, "".join(word))
+
+    def test_minimize(self):
+        a = Letter("a")
+        patterns = PatternSet([KleeneStar(a), KleeneStar(Concatenation(a, a)), KleeneStar(a)])
+        self.assertEqual(patterns.match(""), {0, 1, 2})
+        self.assertEqual(patterns.match("aaa"), {0, 2})
+        self.assertEqual(patterns.match_many(["aa", "b"]), [{0, 1, 2}, set()])
+        self.assertEqual(len(patterns.dfa.get_states()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
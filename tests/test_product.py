@@ -0,0 +1,74 @@
+import itertools
+import unittest
+
+from automatapy.automata import NFA, DFA, LazyProduct
+
+
+class ProductTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Words over {a, b} whose second to last letter is a
+        self.nfa = NFA()
+        q1, q2, q3 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        self.nfa.add_transition(q1, "a", q1)
+        self.nfa.add_transition(q1, "b", q1)
+        self.nfa.add_transition(q1, "a", q2)
+        self.nfa.add_transition(q2, "a", q3)
+        self.nfa.add_transition(q2, "b", q3)
+        # Words over {a, b} with an even number of b
+        self.dfa = DFA()
+        p1, p2 = self.dfa.add_state(initial=True, final=True), self.dfa.add_state()
+        self.dfa.add_transition(p1, "a", p1)
+        self.dfa.add_transition(p1, "b", p2)
+        self.dfa.add_transition(p2, "a", p2)
+        self.dfa.add_transition(p2, "b", p1)
+        self.dfa2 = self.nfa.determinize()
+
+    def words(self, length=6):
+        for n in range(length + 1):
+            for word in itertools.product("ab", repeat=n):
+                yield word
+
+    def assertLanguage(self, automaton, predicate):
+        for word in self.words():
+            self.assertEqual(automaton.accepts(word), predicate(word), "".join(word))
+
+    def test_intersect(self):
+        expected = lambda w: self.nfa.accepts(w) and self.dfa.accepts(w)
+        self.assertIsInstance(self.nfa.intersect(self.dfa), NFA)
+        self.assertLanguage(self.nfa.intersect(self.dfa), expected)
+        self.assertLanguage(self.nfa.intersect(self.dfa, lazy=True), expected)
+        self.assertIsInstance(self.dfa.intersect(self.dfa2), DFA)
+        self.assertLanguage(self.dfa.intersect(self.dfa2), expected)
+
+    def test_union(self):
+        expected = lambda w: self.nfa.accepts(w) or self.dfa.accepts(w)
+        self.assertLanguage(self.nfa.union(self.dfa), expected)
+        self.assertLanguage(self.nfa.union(self.dfa, lazy=True), expected)
+        union = self.dfa.union(self.dfa2)
+        self.assertIsInstance(union, DFA)
+        self.assertLanguage(union, expected)
+        union.compile()
+
+    def test_difference(self):
+        expected = lambda w: self.nfa.accepts(w) and not self.dfa.accepts(w)
+        self.assertLanguage(self.nfa.difference(self.dfa), expected)
+        self.assertLanguage(self.nfa.difference(self.dfa, lazy=True), expected)
+        self.assertLanguage(self.dfa.difference(self.nfa), lambda w: self.dfa.accepts(w) and not self.nfa.accepts(w))
+
+    def test_complement(self):
+        self.assertLanguage(self.nfa.complement(), lambda w: not self.nfa.accepts(w))
+        lazy = self.nfa.complement(lazy=True)
+        self.assertIsInstance(lazy, LazyProduct)
+        self.assertLanguage(lazy, lambda w: not self.nfa.accepts(w))
+        self.assertTrue(lazy.accepts("c"))
+
+    def test_emptiness(self):
+        self.assertTrue(self.nfa.difference(self.nfa, lazy=True).is_empty())
+        self.assertFalse(self.nfa.intersect(self.dfa, lazy=True).is_empty())
+        self.assertEqual(self.nfa.intersect(self.dfa, lazy=True).find_word(), ["a", "a"])
+        self.assertEqual(self.nfa.complement(lazy=True).find_word(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,23 @@
+import random
 import unittest
+from itertools import product
 
 from automatapy.automata import EpsilonNFA
 from automatapy.regex import Letter, Alternation, KleeneStar, Concatenation
+from automatapy.regex.derivatives import DerivativeMatcher
 from automatapy.regex.regex_converter import RegexConverter
 
 
+def random_regex(rng, depth):
+    if depth == 0 or rng.random() < 0.2:
+        return Letter(rng.choice("ab"))
+    kind = rng.randrange(3)
+    if kind == 0:
+        return KleeneStar(random_regex(rng, depth - 1))
+    operation = Concatenation if kind == 1 else Alternation
+    return operation(random_regex(rng, depth - 1), random_regex(rng, depth - 1))
+
+
 class RegexConverterTest(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -41,6 +54,25 @@ class RegexConverterTest(unittest.TestCase):
         dfa = nfa.determinize()
         print(dfa.ts.to_dot())
 
+    def test_random(self):
+        rng = random.Random(5)
+        for _ in range(30):
+            regex = random_regex(rng, 5)
+            nfa = self.converter.convert(regex).to_nfa()
+            matcher = DerivativeMatcher(regex)
+            for length in range(5):
+                for word in product("ab", repeat=length):
+                    self.assertEqual(nfa.accepts(word), matcher.accepts(word))
+
+    def test_deep(self):
+        regex = Letter("a")
+        for i in range(5000):
+            regex = Concatenation(regex, Letter("b")) if i % 2 else Alternation(Letter("c"), regex)
+        nfa = self.converter.convert(regex)
+        self.assertEqual(len(nfa.ts.initial_states), 1)
+        self.assertTrue(nfa.to_nfa().accepts("a" + "b" * 2500))
+        self.assertTrue(regex.accept(self.converter).to_nfa().accepts("cb"))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,107 @@
+import random
+import unittest
+
+from automatapy.automata import NFA, Searcher
+
+
+def brute_force_finditer(nfa, text):
+    spans, pos = [], 0
+    while pos <= len(text):
+        for start in range(pos, len(text) + 1):
+            ends = [end for end in range(start, len(text) + 1) if nfa.accepts(text[start:end])]
+            if ends:
+                spans.append((start, ends[-1]))
+                pos = ends[-1] if ends[-1] > start else start + 1
+                break
+        else:
+            break
+    return spans
+
+
+class SearchTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # a b* a
+        self.nfa = NFA()
+        q0, q1, q2 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        self.nfa.add_transition(q0, "a", q1)
+        self.nfa.add_transition(q1, "b", q1)
+        self.nfa.add_transition(q1, "a", q2)
+
+    def test_search(self):
+        searcher = self.nfa.searcher()
+        self.assertIsInstance(searcher, Searcher)
+        self.assertEqual(searcher.search("xxabbaba"), (2, 6))
+        self.assertEqual(searcher.search("xxabbaba", pos=3), (5, 8))
+        self.assertIsNone(searcher.search("abbbb"))
+        self.assertIsNone(searcher.search("abba", endpos=3))
+        self.assertEqual(self.nfa.search("zzaa"), (2, 4))
+
+    def test_match_prefix(self):
+        self.assertEqual(self.nfa.match_prefix("abbaxx"), (0, 4))
+        self.assertIsNone(self.nfa.match_prefix("xabba"))
+        self.assertEqual(self.nfa.match_prefix("xabba", pos=1), (1, 5))
+
+    def test_finditer(self):
+        self.assertEqual(list(self.nfa.finditer("aa-aba-abbb-aba")), [(0, 2), (3, 6), (12, 15)])
+
+    def test_empty_matches(self):
+        # b*
+        nfa = NFA()
+        q0 = nfa.add_state(initial=True, final=True)
+        nfa.add_transition(q0, "b", q0)
+        self.assertEqual(list(nfa.finditer("abba")), [(0, 0), (1, 3), (3, 3), (4, 4)])
+
+    def test_reverse(self):
+        reverse = self.nfa.reverse()
+        self.assertIsInstance(reverse, NFA)
+        self.assertTrue(reverse.accepts("abba"))
+        self.assertTrue(reverse.accepts("aa"))
+        self.assertFalse(reverse.accepts("ab"))
+
+    def test_random(self):
+        rng = random.Random(7)
+        for _ in range(30):
+            nfa = NFA()
+            states = [nfa.add_state(initial=i == 0, final=rng.random() < 0.3) for i in range(4)]
+            for _ in range(7):
+                nfa.add_transition(rng.choice(states), rng.choice("ab"), rng.choice(states))
+            searcher = nfa.searcher()
+            for _ in range(5):
+                text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+                self.assertEqual(list(searcher.finditer(text)), brute_force_finditer(nfa, text))
+
+    def test_linear_finditer(self):
+        # a | a*b on a text of a's: every match is a single a, but a scan cannot tell before the end whether a b follows
+        nfa = NFA()
+        q0, q1, q2 = nfa.add_state(initial=True), nfa.add_state(final=True), nfa.add_state()
+        q3 = nfa.add_state(final=True)
+        nfa.add_transition(q0, "a", q1)
+        nfa.add_transition(q0, "a", q2)
+        nfa.add_transition(q2, "a", q2)
+        nfa.add_transition(q0, "b", q3)
+        nfa.add_transition(q2, "b", q3)
+        searcher = nfa.searcher()
+        reads = []
+        for n in [1000, 2000, 4000]:
+            text = CountingText("a" * n)
+            self.assertEqual(list(searcher.finditer(text)), [(i, i + 1) for i in range(n)])
+            reads.append(text.reads)
+        self.assertLess(reads[-1], 10 * 4000)
+        self.assertLess(reads[2] / reads[1], 2.5)
+        self.assertEqual(list(searcher.finditer("a" * 5 + "b")), [(0, 6)])
+
+
+class CountingText(str):
+
+    def __init__(self, text):
+        super().__init__()
+        self.reads = 0
+
+    def __getitem__(self, i):
+        self.reads += 1
+        return super().__getitem__(i)
+
+
+if __name__ == '__main__':
+    unittest.main()
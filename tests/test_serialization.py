@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from automatapy.automata import NFA, CompiledDFA, CompiledNFA, Matcher, load
+
+
+class SerializationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nfa = NFA()
+        q1, q2, q3 = self.nfa.add_state(initial=True), self.nfa.add_state(), self.nfa.add_state(final=True)
+        for letter in ["a", "b", 7]:
+            self.nfa.add_transition(q1, letter, q1)
+        self.nfa.add_transition(q1, "a", q2)
+        self.nfa.add_transition(q2, 7, q3)
+        self.words = ["", "a", ["a", 7], ["b", "a", 7], ["a", 7, "a"], "ab", ["a", 7, 7]]
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_dfa(self):
+        self.nfa.determinize().save(self.path)
+        dfa = load(self.path)
+        self.assertIsInstance(dfa, CompiledDFA)
+        self.assertIsInstance(dfa.table, memoryview)
+        for word in self.words:
+            self.assertEqual(dfa.accepts(word), self.nfa.accepts(word), word)
+        self.assertTrue(Matcher(dfa).feed(["a"]).feed([7]).is_accepting())
+
+    def test_nfa(self):
+        self.nfa.save(self.path)
+        nfa = load(self.path)
+        self.assertIsInstance(nfa, CompiledNFA)
+        for word in self.words:
+            self.assertEqual(nfa.accepts(word), self.nfa.accepts(word), word)
+
+    def test_invalid(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not an automaton, but long enough for a header")
+        with self.assertRaises(ValueError):
+            load(self.path)
+        nfa = NFA()
+        nfa.add_transition(nfa.add_state(initial=True), 1.5, nfa.add_state())
+        with self.assertRaises(ValueError):
+            nfa.save(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
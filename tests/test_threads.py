@@ -0,0 +1,94 @@
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from automatapy.automata import NFA, Searcher
+from automatapy.automata.core import TransitionSystem
+from automatapy.regex import Letter, Alternation, KleeneStar, Concatenation
+from automatapy.regex.regex_converter import RegexConverter
+
+THREADS = 8
+
+
+def words(seed, count=200):
+    rng = random.Random(seed)
+    return ["".join(rng.choice("abc") for _ in range(rng.randrange(12))) for _ in range(count)]
+
+
+class StateIdTest(unittest.TestCase):
+
+    def test_dense_ids(self):
+        ts = TransitionSystem()
+        self.assertEqual([ts.add_state().state_id for _ in range(3)], [0, 1, 2])
+        other = TransitionSystem()
+        self.assertEqual(other.add_state().state_id, 0)
+        edges = TransitionSystem.from_edges([0, 1], ["a", "b"], [1, 2])
+        self.assertEqual(sorted(state.state_id for state in edges.states), [0, 1, 2])
+
+    def test_equality(self):
+        ts, other = TransitionSystem(), TransitionSystem()
+        q, p = ts.add_state(name="q"), other.add_state(name="q")
+        self.assertEqual(q.state_id, p.state_id)
+        self.assertNotEqual(q, p)
+        self.assertNotIn(p, ts.states)
+        self.assertEqual(len({q, p}), 2)
+        hash_before = hash(q)
+        q.name = "renamed"
+        self.assertEqual(hash(q), hash_before)
+        self.assertIn(q, ts.states)
+
+    def test_concurrent_add_state(self):
+        ts = TransitionSystem()
+        with ThreadPoolExecutor(THREADS) as pool:
+            states = list(pool.map(lambda _: ts.add_state(), range(2000)))
+        self.assertEqual(sorted(state.state_id for state in states), list(range(2000)))
+        self.assertEqual(len(ts.states), 2000)
+
+    def test_concurrent_construction(self):
+        regex = Concatenation(KleeneStar(Alternation(Letter("a"), Letter("b"))), Letter("c"))
+
+        def build(_):
+            nfa = RegexConverter().convert(regex).to_nfa()
+            return sorted(state.state_id for state in nfa.get_states()), nfa.accepts("abac")
+
+        with ThreadPoolExecutor(THREADS) as pool:
+            results = list(pool.map(build, range(64)))
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertTrue(results[0][1])
+
+
+class ConcurrentMatchingTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Words over {a, b, c} whose third letter from the end is an a
+        self.nfa = NFA()
+        q0 = self.nfa.add_state(initial=True)
+        q1, q2 = self.nfa.add_state(), self.nfa.add_state()
+        q3 = self.nfa.add_state(final=True)
+        for letter in "abc":
+            self.nfa.add_transition(q0, letter, q0)
+            self.nfa.add_transition(q1, letter, q2)
+            self.nfa.add_transition(q2, letter, q3)
+        self.nfa.add_transition(q0, "a", q1)
+
+    def assert_concurrent(self, match):
+        batches = [words(seed) for seed in range(4 * THREADS)]
+        expected = [[match(word) for word in batch] for batch in batches]
+        with ThreadPoolExecutor(THREADS) as pool:
+            results = list(pool.map(lambda batch: [match(word) for word in batch], batches))
+        self.assertEqual(results, expected)
+
+    def test_compiled_dfa(self):
+        self.assert_concurrent(self.nfa.determinize().compile().accepts)
+
+    def test_compiled_nfa(self):
+        self.assert_concurrent(self.nfa.compile().accepts)
+
+    def test_lazy_dfa(self):
+        lazy = self.nfa.lazy_determinize(cache_size=4)
+        self.assert_concurrent(lazy.accepts)
+        self.assertLessEqual(len(lazy.cache), 4)
+
+    def test_searcher(self):
+        searcher = Searcher(self.nfa.ts)
+        self.assert_concurrent(lambda word: list(searcher.finditer(word)))
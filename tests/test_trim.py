@@ -0,0 +1,67 @@
+import unittest
+
+from automatapy.automata import NFA, EpsilonNFA, Epsilon
+from automatapy.regex import Letter, Concatenation
+from automatapy.regex.regex_converter import RegexConverter
+
+
+class TrimTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nfa = NFA()
+        self.q0 = self.nfa.add_state(initial=True)
+        self.q1 = self.nfa.add_state(final=True)
+        self.dead = self.nfa.add_state()
+        self.unreachable = self.nfa.add_state(final=True)
+        self.nfa.add_transition(self.q0, "a", self.q1)
+        self.nfa.add_transition(self.q0, "b", self.dead)
+        self.nfa.add_transition(self.dead, "a", self.dead)
+        self.nfa.add_transition(self.unreachable, "a", self.q1)
+
+    def test_predecessors(self):
+        ts = self.nfa.ts
+        self.assertEqual(ts.get_predecessor(self.q1, "a"), {self.q0, self.unreachable})
+        self.assertEqual(ts.get_predecessor(self.dead, "a"), {self.dead})
+        self.assertEqual(ts.get_predecessor(self.q0, "a"), set())
+
+    def test_trim(self):
+        self.assertEqual(self.nfa.ts.useful_states(), {self.q0, self.q1})
+        self.nfa.trim()
+        ts = self.nfa.ts
+        self.assertEqual(ts.states, {self.q0, self.q1})
+        self.assertEqual(ts.final_states, {self.q1})
+        self.assertEqual(len(ts.transitions), 1)
+        self.assertEqual(ts.enabled_letters(self.q0), {"a"})
+        self.assertEqual(ts.get_predecessor(self.q1, "a"), {self.q0})
+        self.assertNotIn(self.dead, ts.state_to_action_succ)
+        self.assertTrue(self.nfa.accepts("a"))
+        self.assertFalse(self.nfa.accepts("b"))
+
+    def test_determinize_ignores_dead_states(self):
+        dfa, subsets = self.nfa.subset_construction()
+        self.assertEqual(len(self.nfa.ts.states), 4)
+        self.assertEqual(set(subsets.values()), {frozenset({self.q0}), frozenset({self.q1}), frozenset()})
+        self.assertTrue(dfa.accepts("a"))
+        self.assertFalse(dfa.accepts("ba"))
+
+    def test_compact(self):
+        ts = self.nfa.compact().ts
+        self.assertEqual(len(ts.useful_states()), 2)
+        q1 = next(iter(state for state in ts.states if state in ts.final_states and state in ts.useful_states()))
+        self.assertEqual(len(ts.state_to_action_pred[q1]["a"]), 2)
+
+    def test_remove_epsilon(self):
+        enfa = EpsilonNFA()
+        q0, q1, q2 = enfa.add_state(initial=True), enfa.add_state(final=True), enfa.add_state()
+        enfa.add_transition(q0, Epsilon(), q1)
+        enfa.add_transition(q0, "a", q2)
+        self.assertEqual(len(enfa.to_nfa().ts.states), 1)
+
+    def test_regex_converter(self):
+        nfa = RegexConverter().convert(Concatenation(Letter("a"), Letter("b")))
+        self.assertEqual(nfa.ts.useful_states(), nfa.ts.states)
+        self.assertTrue(nfa.to_nfa().accepts("ab"))
+
+
+if __name__ == '__main__':
+    unittest.main()